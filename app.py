@@ -11,10 +11,14 @@ import yaml
 import os
 import re
 import time
+import asyncio
 import shutil
+import hashlib
+import bisect
 from pathlib import Path
 from typing import Dict, Optional, List, Tuple
 from collections import defaultdict
+from functools import lru_cache
 from datetime import datetime
 import google.generativeai as genai
 from io import BytesIO
@@ -28,14 +32,14 @@ try:
     import sys
     sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'mcp_storage'))
     from tools.capacity import get_disk_capacity
-    from tools.iops import get_disk_iops
+    from tools.iops import get_disk_iops, get_disk_iops_async
     from tools.latency import get_disk_latency
     from tools.rca import generate_storage_rca
     from tools.partitions import get_disk_partitions
     from tools.swap import get_swap_usage
     from tools.inodes import get_inode_usage
     from tools.process_io import get_top_io_processes
-    from tools.disk_health import get_disk_health
+    from tools.disk_health import get_disk_health, get_disk_health_async
     from tools.storage_trends import get_storage_trends
     from tools.cleanup_recommendations import get_cleanup_recommendations
     # Kubernetes tools
@@ -420,6 +424,12 @@ if 'baseline_token_usage' not in st.session_state:
     st.session_state.baseline_token_usage = {}
 if 'optimization_savings' not in st.session_state:
     st.session_state.optimization_savings = {}
+if 'cost_info' not in st.session_state:
+    st.session_state.cost_info = {}
+if 'analysis_fingerprints' not in st.session_state:
+    st.session_state.analysis_fingerprints = {}
+if 'rca_metrics_cache' not in st.session_state:
+    st.session_state.rca_metrics_cache = {}
 if 'chat_history' not in st.session_state:
     st.session_state.chat_history = []
 
@@ -578,6 +588,33 @@ def format_storage_as_logs(storage_metrics: Dict) -> List[str]:
     return log_entries
 
 
+def top_io_processes_json() -> str:
+    """Get the top I/O processes JSON, or an error payload where it is unsupported (e.g. macOS)."""
+    try:
+        return get_top_io_processes()
+    except:
+        return json.dumps({"error": "Not available on this platform"})
+
+
+async def run_storage_tools() -> Tuple[str, ...]:
+    """
+    Run all storage tools concurrently.
+    
+    IOPS and disk health each sample counters over a one-second window; the one-shot
+    collectors run on worker threads while those windows are open.
+    """
+    return tuple(await asyncio.gather(
+        get_disk_iops_async(),
+        get_disk_health_async(),
+        asyncio.to_thread(get_disk_capacity),
+        asyncio.to_thread(get_disk_latency),
+        asyncio.to_thread(get_disk_partitions),
+        asyncio.to_thread(get_swap_usage),
+        asyncio.to_thread(get_inode_usage),
+        asyncio.to_thread(top_io_processes_json)
+    ))
+
+
 def collect_storage_metrics() -> Optional[Dict]:
     """Collect comprehensive storage metrics using MCP tools."""
     if not STORAGE_TOOLS_AVAILABLE:
@@ -586,25 +623,26 @@ def collect_storage_metrics() -> Optional[Dict]:
     try:
         metrics = {}
         
+        # The one-shot collectors run while the IOPS/disk health sampling windows are open
+        (
+            iops_json, disk_health_json, capacity_json, latency_json,
+            partitions_json, swap_json, inode_json, process_io_json
+        ) = asyncio.run(run_storage_tools())
+        
         # Collect capacity, IOPS, and latency
-        capacity_data = json.loads(get_disk_capacity())
-        iops_data = json.loads(get_disk_iops())
-        latency_data = json.loads(get_disk_latency())
+        capacity_data = json.loads(capacity_json)
+        iops_data = json.loads(iops_json)
+        latency_data = json.loads(latency_json)
         
         # Generate storage RCA
         storage_rca = json.loads(generate_storage_rca(capacity_data, iops_data, latency_data))
         
         # Collect additional metrics
-        partitions_data = json.loads(get_disk_partitions())
-        swap_data = json.loads(get_swap_usage())
-        inode_data = json.loads(get_inode_usage())
-        disk_health_data = json.loads(get_disk_health())
-        
-        # Collect top I/O processes (may fail on macOS)
-        try:
-            process_io_data = json.loads(get_top_io_processes())
-        except:
-            process_io_data = {"error": "Not available on this platform"}
+        partitions_data = json.loads(partitions_json)
+        swap_data = json.loads(swap_json)
+        inode_data = json.loads(inode_json)
+        disk_health_data = json.loads(disk_health_json)
+        process_io_data = json.loads(process_io_json)
         
         metrics = {
             'capacity': capacity_data,
@@ -664,10 +702,21 @@ def collect_kubernetes_metrics() -> Optional[Dict]:
         return None
 
 
+# Gemini pricing per million tokens, with per-token rates precomputed at import
+INPUT_COST_PER_MILLION = 0.075
+OUTPUT_COST_PER_MILLION = 0.30
+INPUT_COST_PER_TOKEN = INPUT_COST_PER_MILLION / 1_000_000
+OUTPUT_COST_PER_TOKEN = OUTPUT_COST_PER_MILLION / 1_000_000
+
+
+@lru_cache(maxsize=64)
 def calculate_token_cost(prompt_tokens: int, response_tokens: int) -> Dict[str, float]:
     """
     Calculate estimated cost for Gemini API token usage.
     
+    Results are memoized per (prompt_tokens, response_tokens); callers must not
+    mutate the returned dictionary.
+    
     Gemini 2.0 Flash pricing (as of 2024):
     - Input tokens: $0.075 per 1M tokens
     - Output tokens: $0.30 per 1M tokens
@@ -679,13 +728,9 @@ def calculate_token_cost(prompt_tokens: int, response_tokens: int) -> Dict[str,
     Returns:
         Dictionary with cost breakdown
     """
-    # Pricing per million tokens
-    INPUT_COST_PER_MILLION = 0.075
-    OUTPUT_COST_PER_MILLION = 0.30
-    
     # Calculate costs
-    input_cost = (prompt_tokens / 1_000_000) * INPUT_COST_PER_MILLION
-    output_cost = (response_tokens / 1_000_000) * OUTPUT_COST_PER_MILLION
+    input_cost = prompt_tokens * INPUT_COST_PER_TOKEN
+    output_cost = response_tokens * OUTPUT_COST_PER_TOKEN
     total_cost = input_cost + output_cost
     
     return {
@@ -1298,10 +1343,20 @@ def extract_bundle_to_temp_dir(bundle_data: Dict) -> Optional[str]:
 
 
 def collect_rca_metrics(bundle_data: Dict) -> Optional[Dict]:
-    """Collect RCA metrics from bundle data using RCA MCP tools."""
+    """
+    Collect RCA metrics from bundle data using RCA MCP tools.
+    
+    Results are cached in session state against the bundle fingerprint, so the
+    stats panels and analysis prompts share a single extraction per bundle.
+    """
     if not RCA_TOOLS_AVAILABLE:
         return None
     
+    fingerprint = bundle_data.get('fingerprint')
+    cached = st.session_state.rca_metrics_cache
+    if fingerprint and fingerprint in cached:
+        return cached[fingerprint]
+    
     try:
         # Extract bundle to temp directory
         temp_dir = extract_bundle_to_temp_dir(bundle_data)
@@ -1339,6 +1394,9 @@ def collect_rca_metrics(bundle_data: Dict) -> Optional[Dict]:
             analysis_json = analyze_logs(temp_dir)
             metrics['comprehensive_analysis'] = json.loads(analysis_json)
             
+            if fingerprint:
+                # Only the current bundle is kept
+                st.session_state.rca_metrics_cache = {fingerprint: metrics}
             return metrics
         finally:
             # Clean up temp directory
@@ -1380,11 +1438,13 @@ def parse_rca_bundle(uploaded_file) -> Optional[Dict]:
                 status_text = st.empty()
             
             bytes_written = 0
+            bundle_hash = hashlib.sha1()
             while True:
                 chunk = uploaded_file.read(CHUNK_SIZE)
                 if not chunk:
                     break
                 tmp_file.write(chunk)
+                bundle_hash.update(chunk)
                 bytes_written += len(chunk)
                 
                 if progress_bar:
@@ -1406,7 +1466,9 @@ def parse_rca_bundle(uploaded_file) -> Optional[Dict]:
             'deployment_manifests': [],
             'errors': None,
             'timeline': None,
-            'metadata': None
+            'metadata': None,
+            # Content hash of the uploaded archive, used to key per-bundle caches
+            'fingerprint': bundle_hash.hexdigest()
         }
         
         # Process tar file with progress tracking for large archives
@@ -1744,8 +1806,8 @@ def create_root_cause_flow_diagram(error_stats: Dict, error_patterns: Dict, serv
     if not errors_by_service:
         return None
     
-    top_service = max(errors_by_service.items(), key=lambda x: x[1])[0]
-    top_category = max(error_categories.items(), key=lambda x: x[1])[0]
+    top_service = max(errors_by_service, key=errors_by_service.get)
+    top_category = max(error_categories, key=error_categories.get)
     
     # Create Sankey-like flow diagram
     fig = go.Figure()
@@ -3959,7 +4021,7 @@ def display_l3_stats_and_diagram(bundle_data: Dict, analysis_text: str):
             
             if error_stats.get('errors_by_severity'):
                 severity_dist = error_stats.get('errors_by_severity', {})
-                top_severity = max(severity_dist.items(), key=lambda x: x[1])[0] if severity_dist else 'N/A'
+                top_severity = max(severity_dist, key=severity_dist.get) if severity_dist else 'N/A'
                 root_cause_summary.append({
                     'Indicator': 'Top Severity',
                     'Value': top_severity,
@@ -4319,6 +4381,10 @@ Unable to connect to the Gemini API. Please check:
         # Store token usage in session state
         if token_usage_info:
             st.session_state.token_usage['L1'] = token_usage_info
+            st.session_state.cost_info['L1'] = calculate_token_cost(
+                token_usage_info.get('prompt_token_count', 0),
+                token_usage_info.get('candidates_token_count', 0)
+            )
             # Calculate optimization savings
             actual_tokens = token_usage_info.get('total_token_count', 0)
             if actual_tokens > 0 and baseline_token_estimate > 0:
@@ -4467,6 +4533,10 @@ Inputs:
                     'total_token_count': getattr(response.usage_metadata, 'total_token_count', 0)
                 }
                 st.session_state.token_usage['L2'] = token_usage_info
+                st.session_state.cost_info['L2'] = calculate_token_cost(
+                    token_usage_info.get('prompt_token_count', 0),
+                    token_usage_info.get('candidates_token_count', 0)
+                )
                 # Calculate optimization savings
                 actual_tokens = token_usage_info.get('total_token_count', 0)
                 if actual_tokens > 0 and baseline_token_estimate > 0:
@@ -4614,7 +4684,8 @@ def perform_l3_analysis(bundle_data: Dict) -> str:
     # Extract code snippets from logs if available
     code_snippet = ""
     for log in bundle_data.get('app_logs', []):
-        if 'traceback' in log['content'].lower() or 'stack trace' in log['content'].lower():
+        content_lower = log['content'].lower()
+        if 'traceback' in content_lower or 'stack trace' in content_lower:
             code_snippet = log['content'][:5000]
             break
     
@@ -4651,12 +4722,14 @@ RCA Comprehensive Analysis (from bundle):
     for log in bundle_data.get('app_logs', []):
         content_lower = log['content'].lower()
         filename = log.get('filename', '').lower()
+        # Lowercase once per log and walk both line lists in step
+        content_lines = log['content'].split('\n')
+        content_lower_lines = content_lower.split('\n')
         
         # Look for power restart, hardware failures, storage hardware issues
         if any(keyword in content_lower for keyword in ['power', 'restart', 'reboot', 'shutdown', 'hardware', 'disk failure', 'storage controller', 'raid', 'hba', 'fiber channel', 'san', 'storage array']):
             relevant_lines = []
-            for line in log['content'].split('\n'):
-                line_lower = line.lower()
+            for line, line_lower in zip(content_lines, content_lower_lines):
                 if any(keyword in line_lower for keyword in ['power', 'restart', 'reboot', 'shutdown', 'hardware', 'disk', 'storage', 'controller', 'raid', 'hba', 'fiber', 'san', 'array', 'iops', 'latency', 'timeout']):
                     relevant_lines.append(line.strip())
                     if len(relevant_lines) >= 20:  # Limit to 20 most relevant lines
@@ -4668,8 +4741,7 @@ RCA Comprehensive Analysis (from bundle):
         # Look for hardware-level storage issues
         if any(keyword in content_lower for keyword in ['storage server', 'storage hardware', 'disk controller', 'storage array', 'san switch', 'fiber channel', 'hba card', 'raid controller', 'storage backend', 'storage infrastructure']):
             relevant_lines = []
-            for line in log['content'].split('\n'):
-                line_lower = line.lower()
+            for line, line_lower in zip(content_lines, content_lower_lines):
                 if any(keyword in line_lower for keyword in ['storage server', 'hardware', 'controller', 'array', 'san', 'fiber', 'hba', 'raid', 'disk', 'backend', 'infrastructure', 'performance', 'bottleneck', 'degraded', 'failed']):
                     relevant_lines.append(line.strip())
                     if len(relevant_lines) >= 15:
@@ -4983,6 +5055,10 @@ Inputs:
                     'total_token_count': getattr(response.usage_metadata, 'total_token_count', 0)
                 }
                 st.session_state.token_usage['L3'] = token_usage_info
+                st.session_state.cost_info['L3'] = calculate_token_cost(
+                    token_usage_info.get('prompt_token_count', 0),
+                    token_usage_info.get('candidates_token_count', 0)
+                )
                 # Calculate optimization savings
                 actual_tokens = token_usage_info.get('total_token_count', 0)
                 if actual_tokens > 0 and baseline_token_estimate > 0:
@@ -4996,6 +5072,757 @@ Inputs:
         return f"Error performing L3 analysis: {str(e)}"
 
 
+@lru_cache(maxsize=4096)
+def _fmt_int(value: int) -> str:
+    """Format an integer with thousands separators; token counts repeat across reruns."""
+    return format(value, ',')
+
+
+@lru_cache(maxsize=4096)
+def _fmt_usd(value: float) -> str:
+    """Format a dollar amount with six decimal places."""
+    return format(value, '.6f')
+
+
+def render_html(html: str):
+    """
+    Render a pure-HTML fragment.
+    
+    Uses st.html (Streamlit 1.33+) so static cards skip the markdown parser, and
+    falls back to st.markdown with unsafe_allow_html on older releases.
+    """
+    if hasattr(st, 'html'):
+        st.html(html)
+    else:
+        st.markdown(html, unsafe_allow_html=True)
+
+
+def fingerprint_text(text: str) -> str:
+    """
+    Compute a short fingerprint used as the cache key for rendered analysis text.
+    
+    Args:
+        text: Analysis text
+    
+    Returns:
+        Hex digest of the text
+    """
+    return hashlib.sha1(text.encode('utf-8')).hexdigest()
+
+
+@st.cache_data(show_spinner=False)
+def build_analysis_result_html(result_fingerprint: str, _analysis_result: str, accent_rgb: str) -> str:
+    """
+    Build the HTML card wrapping an analysis result.
+    
+    Cached on the fingerprint computed when the analysis finished, so reruns
+    neither hash the full result text nor re-interpolate the card.
+    
+    Args:
+        result_fingerprint: fingerprint_text() of the analysis result
+        _analysis_result: Analysis text returned by the model (excluded from the cache key)
+        accent_rgb: Level accent colour as an "r, g, b" string
+    
+    Returns:
+        HTML string for st.markdown
+    """
+    return f"""
+    <div style="background: rgba(255, 255, 255, 0.95); padding: 2rem; border-radius: 12px; 
+                border: 1px solid rgba({accent_rgb}, 0.2); margin-bottom: 2rem; color: #1E293B;
+                line-height: 1.8; font-size: 1.05rem; box-shadow: 0 4px 6px -1px rgba(0, 0, 0, 0.1);">
+        {_analysis_result}
+    </div>
+    """
+
+
+@st.cache_data(show_spinner=False)
+def build_token_usage_html(level: str, icon: str, accent_color: str, accent_rgb: str, gradient_end_rgb: str,
+                           total_tokens: int, prompt_tokens: int, response_tokens: int,
+                           cost_info: Dict[str, float]) -> str:
+    """
+    Build the token usage and estimated cost card for an analysis level.
+    
+    Args:
+        level: Analysis level (L1, L2, L3)
+        icon: Emoji shown next to the card title
+        accent_color: Level accent colour as a hex string
+        accent_rgb: Level accent colour as an "r, g, b" string
+        gradient_end_rgb: End colour of the token breakdown gradient
+        total_tokens: Total token count
+        prompt_tokens: Prompt token count
+        response_tokens: Response token count
+        cost_info: Cost breakdown from calculate_token_cost
+    
+    Returns:
+        HTML string for render_html
+    """
+    return f"""
+    <div style="background: linear-gradient(135deg, rgba(255, 255, 255, 0.98) 0%, rgba(248, 250, 252, 0.98) 100%);
+                backdrop-filter: blur(10px); padding: 1.75rem; border-radius: 16px; 
+                border: 1px solid rgba({accent_rgb}, 0.2); box-shadow: 0 4px 6px -1px rgba(0, 0, 0, 0.1);
+                margin-bottom: 1rem;">
+        <div style="display: flex; align-items: center; gap: 0.75rem; margin-bottom: 1rem;">
+            <span style="font-size: 1.75rem;">{icon}</span>
+            <h4 style="color: {accent_color}; margin: 0; font-family: 'Space Grotesk', sans-serif; 
+                      font-weight: 700; font-size: 1.25rem;">{level} Analysis Token Usage</h4>
+        </div>
+        <div style="background: linear-gradient(135deg, rgba({accent_rgb}, 0.05) 0%, rgba({gradient_end_rgb}, 0.05) 100%);
+                    padding: 1rem; border-radius: 12px; margin-bottom: 1rem;">
+            <p style="color: #1E293B; font-size: 1rem; font-weight: 600; margin-bottom: 0.5rem; font-family: 'Inter', sans-serif;">
+                <strong style="color: {accent_color};">Total Tokens:</strong> <span style="color: #1E293B;">{_fmt_int(total_tokens)}</span>
+            </p>
+            <div style="display: flex; gap: 1.5rem; flex-wrap: wrap; font-size: 0.95rem; color: #64748B;">
+                <span><strong>Prompt:</strong> {_fmt_int(prompt_tokens)}</span>
+                <span><strong>Response:</strong> {_fmt_int(response_tokens)}</span>
+            </div>
+        </div>
+        <div style="background: linear-gradient(135deg, rgba(16, 185, 129, 0.1) 0%, rgba(5, 150, 105, 0.1) 100%);
+                    padding: 1rem; border-radius: 12px; border-left: 4px solid #10B981;">
+            <p style="color: #1E293B; font-size: 1.125rem; font-weight: 700; margin: 0; font-family: 'Space Grotesk', sans-serif;">
+                💵 Estimated Cost: <span style="color: #10B981; font-size: 1.25rem;">${_fmt_usd(cost_info['total_cost'])}</span>
+            </p>
+            <div style="margin-top: 0.5rem; font-size: 0.875rem; color: #64748B;">
+                Input: ${_fmt_usd(cost_info['input_cost'])} • Output: ${_fmt_usd(cost_info['output_cost'])}
+            </div>
+        </div>
+    </div>
+    """
+
+
+# Static segments of the optimization savings card, joined with the
+# formatted values in build_savings_html
+SAVINGS_CARD_HEADER = """
+    <div style="background: linear-gradient(135deg, rgba(249, 115, 22, 0.12) 0%, rgba(255, 140, 66, 0.12) 100%);
+                backdrop-filter: blur(10px); padding: 1.75rem; border-radius: 16px; 
+                border: 2px solid rgba(249, 115, 22, 0.4); box-shadow: 0 8px 16px -4px rgba(249, 115, 22, 0.3);
+                margin-top: 1.5rem; margin-bottom: 1rem;">
+        <div style="display: flex; align-items: center; gap: 0.75rem; margin-bottom: 1rem;">
+            <span style="font-size: 2rem;">💰</span>
+            <h4 style="color: #F97316; margin: 0; font-family: 'Space Grotesk', sans-serif; 
+                      font-weight: 800; font-size: 1.35rem;">Optimization Savings (Multilevel Chunking)</h4>
+        </div>
+        <div style="display: grid; grid-template-columns: repeat(2, 1fr); gap: 1rem; margin-bottom: 1rem;">
+            <div style="background: rgba(255, 255, 255, 0.6); padding: 1rem; border-radius: 12px; border: 1px solid rgba(249, 115, 22, 0.2);">
+                <p style="color: #64748B; font-size: 0.875rem; margin: 0 0 0.5rem 0; font-weight: 600;">Tokens Saved</p>
+                <p style="color: #1E293B; font-size: 1.5rem; font-weight: 800; margin: 0; font-family: 'Space Grotesk', sans-serif;">
+                    """
+SAVINGS_CARD_BASELINE_OPEN = """
+                </p>
+                <p style="color: #64748B; font-size: 0.75rem; margin: 0.25rem 0 0 0;">
+                    """
+SAVINGS_CARD_COST_OPEN = """
+                </p>
+            </div>
+            <div style="background: rgba(255, 255, 255, 0.6); padding: 1rem; border-radius: 12px; border: 1px solid rgba(249, 115, 22, 0.2);">
+                <p style="color: #64748B; font-size: 0.875rem; margin: 0 0 0.5rem 0; font-weight: 600;">Cost Saved</p>
+                <p style="color: #1E293B; font-size: 1.5rem; font-weight: 800; margin: 0; font-family: 'Space Grotesk', sans-serif;">
+                    """
+SAVINGS_CARD_GRID_CLOSE = """
+                </p>
+            </div>
+        </div>
+        """
+SAVINGS_CARD_FOOTER = """
+    </div>
+    """
+
+# Static "Multilevel chunking" explanation shown under every savings card;
+# only the savings percentage between prefix and suffix is dynamic
+MULTILEVEL_BLURB_PREFIX = """<div style="background: rgba(16, 185, 129, 0.1); padding: 0.75rem; border-radius: 8px; border-left: 3px solid #10B981;">
+            <p style="color: #1E293B; font-size: 0.9rem; margin: 0 0 0.5rem 0; font-weight: 600;">
+                ✨ <strong style="color: #0066FF;">Multilevel chunking</strong> (4-level progressive filtering) reduced token usage by <strong style="color: #10B981;">"""
+MULTILEVEL_BLURB_SUFFIX = """%</strong> while maintaining analysis quality!
+            </p>
+            <p style="color: #64748B; font-size: 0.8rem; margin: 0; line-height: 1.5;">
+                <strong>Multilevel Process:</strong> Level 1 → Extract critical content | Level 2 → Deduplicate & prioritize | Level 3 → Compress & summarize | Level 4 → Remove noise & optimize
+            </p>
+        </div>"""
+
+
+@st.cache_data(show_spinner=False)
+def build_savings_html(savings: Dict[str, float]) -> str:
+    """
+    Build the multilevel chunking optimization savings card.
+    
+    Args:
+        savings: Savings metrics from calculate_optimization_savings
+    
+    Returns:
+        HTML string for render_html
+    """
+    savings_percentage = f"{savings['savings_percentage']:.1f}"
+    parts = [
+        SAVINGS_CARD_HEADER,
+        _fmt_int(savings['tokens_saved']),
+        ' <span style="color: #10B981; font-size: 1rem;">(', savings_percentage, '%)</span>',
+        SAVINGS_CARD_BASELINE_OPEN,
+        'Baseline: ', _fmt_int(savings['baseline_tokens']), ' → Optimized: ', _fmt_int(savings['optimized_tokens']),
+        SAVINGS_CARD_COST_OPEN,
+        '$', _fmt_usd(savings['cost_saved']),
+        ' <span style="color: #10B981; font-size: 1rem;">(', f"{savings['cost_savings_percentage']:.1f}", '%)</span>',
+        SAVINGS_CARD_BASELINE_OPEN,
+        'Baseline: $', _fmt_usd(savings['baseline_cost']), ' → Optimized: $', _fmt_usd(savings['optimized_cost']),
+        SAVINGS_CARD_GRID_CLOSE,
+        MULTILEVEL_BLURB_PREFIX, savings_percentage, MULTILEVEL_BLURB_SUFFIX,
+        SAVINGS_CARD_FOOTER,
+    ]
+    return "".join(parts)
+
+
+# Static HTML for the L3 final summary sections
+L3_KEY_POINTS_HEADER_HTML = """
+    <div style="background: linear-gradient(135deg, rgba(16, 185, 129, 0.1) 0%, rgba(5, 150, 105, 0.1) 100%);
+                padding: 2.5rem; border-radius: 20px; margin: 3rem 0 2rem 0; 
+                border: 3px solid rgba(16, 185, 129, 0.4); box-shadow: 0 12px 24px -4px rgba(16, 185, 129, 0.3);">
+        <h3 style="color: #10B981; margin-top: 0; font-family: 'Poppins', sans-serif; 
+                  font-weight: 900; font-size: 2rem; margin-bottom: 1.5rem; text-align: center;">
+            🎯 Final RCA Analysis - Key Summary Points
+        </h3>
+        <p style="color: #475569; font-size: 1.1rem; margin-bottom: 2rem; text-align: center; font-weight: 600;">
+            Comprehensive root cause analysis summary with actionable insights and recommendations
+        </p>
+    </div>
+    """
+RCA_POINTS_WRAPPER_OPEN = """<div style="background: rgba(255, 255, 255, 0.98); padding: 2rem; border-radius: 16px; 
+                border: 2px solid rgba(16, 185, 129, 0.3); margin-bottom: 2rem;
+                box-shadow: 0 8px 16px -4px rgba(16, 185, 129, 0.2);">"""
+RCA_POINT_CARD_TEMPLATE = """<div style="margin-bottom: 1.5rem; padding: 1.5rem; background: linear-gradient(135deg, rgba(16, 185, 129, 0.05) 0%, rgba(249, 115, 22, 0.05) 100%);
+                    border-radius: 12px; border-left: 5px solid #10B981;">
+            <h4 style="color: #059669; margin-top: 0; margin-bottom: 0.75rem; font-family: 'Poppins', sans-serif; 
+                      font-weight: 800; font-size: 1.35rem;">
+                <strong>{idx}. {title}</strong>
+            </h4>
+            <p style="color: #1E293B; margin: 0; line-height: 1.7; font-size: 1.05rem; font-family: 'Inter', sans-serif;">
+                {description}
+            </p>
+        </div>"""
+FINAL_SUMMARY_HEADER_HTML = """
+    <div style="background: linear-gradient(135deg, rgba(0, 102, 255, 0.1) 0%, rgba(255, 107, 53, 0.1) 100%);
+                padding: 2rem; border-radius: 20px; margin: 2rem 0; 
+                border: 2px solid;
+                border-image: linear-gradient(135deg, #0066FF 0%, #FF6B35 100%) 1;
+                box-shadow: 0 8px 16px -4px rgba(0, 102, 255, 0.2), 0 8px 16px -4px rgba(255, 107, 53, 0.2);">
+        <h3 style="color: #0F172A; margin-top: 0; font-family: 'Poppins', sans-serif; 
+                  font-weight: 800; font-size: 1.75rem; margin-bottom: 1rem;">
+            📊 Comprehensive Incident Analysis Summary
+        </h3>
+        <p style="color: #475569; font-size: 1.1rem; margin: 0; font-weight: 500;">
+            Complete overview combining insights from L1, L2, and L3 analysis levels
+        </p>
+    </div>
+    """
+
+
+# Keywords that mark topics in the L3 analysis text, mapped to the summary
+# point tags they trigger. "storage server" also counts as a storage mention.
+RCA_KEYWORD_TAGS = {
+    'root cause': ('root_cause',),
+    'storage server': ('hardware', 'storage'),
+    'storage': ('storage',),
+    'iops': ('storage',),
+    'latency': ('storage',),
+    'hardware': ('hardware',),
+    'disk': ('hardware',),
+    'power': ('power',),
+    'restart': ('power',),
+    'shutdown': ('power',),
+    'recommendation': ('solutions',),
+    'solution': ('solutions',),
+    'fix': ('solutions',),
+    'monitoring': ('monitoring',),
+    'alert': ('monitoring',),
+    'preventive': ('monitoring',),
+}
+# Longest keywords first so "storage server" wins over "storage"
+RCA_KEYWORD_PATTERN = re.compile('|'.join(
+    re.escape(keyword) for keyword in sorted(RCA_KEYWORD_TAGS, key=len, reverse=True)
+))
+
+
+# Key summary point shown for each matched topic tag, in display order
+RCA_POINT_RULES = [
+    ('root_cause', {
+        'title': 'Root Cause Identified',
+        'description': 'The primary root cause has been identified through comprehensive analysis of storage infrastructure, hardware components, and system performance metrics.'
+    }),
+    ('storage', {
+        'title': 'Storage Performance Bottleneck',
+        'description': 'Severe storage performance issues detected, including extremely low IOPS (0 IOPS), high latency, and storage infrastructure degradation preventing proper volume mounting.'
+    }),
+    ('hardware', {
+        'title': 'Hardware-Level Infrastructure Issues',
+        'description': 'Critical hardware-level problems identified in storage servers, including potential disk failures, power-related issues, and infrastructure bottlenecks affecting system reliability.'
+    }),
+    ('power', {
+        'title': 'Power & Infrastructure Instability',
+        'description': 'Power-related incidents and unexpected restarts have been correlated with storage failures, indicating potential power infrastructure issues or insufficient redundancy.'
+    }),
+    ('solutions', {
+        'title': 'Recommended Solutions & Actions',
+        'description': 'Comprehensive remediation plan includes storage infrastructure upgrades, hardware replacements, enhanced monitoring and alerting, and preventive measures to ensure system reliability.'
+    }),
+    ('monitoring', {
+        'title': 'Preventive Monitoring & Alerting',
+        'description': 'Implementation of real-time monitoring for IOPS, latency, disk queue depth, capacity utilization, and correlated alerts to detect and prevent future incidents proactively.'
+    }),
+]
+# Generic summary used when no topic tag matched
+RCA_DEFAULT_POINTS = [
+    {
+        'title': 'Root Cause Analysis Complete',
+        'description': 'Comprehensive root cause analysis has been performed across all system layers (L1, L2, L3) with detailed investigation of symptoms, correlations, and underlying infrastructure issues.'
+    },
+    {
+        'title': 'Actionable Recommendations Provided',
+        'description': 'Detailed recommendations and solutions have been identified to address the root cause and prevent recurrence, including infrastructure improvements and enhanced monitoring.'
+    }
+]
+
+def display_l3_key_points(l3_analysis_text: str):
+    """Display the final RCA key summary points derived from the L3 analysis text."""
+    if not l3_analysis_text.strip():
+        st.info("L3 analysis pending - key summary points will appear once the analysis completes.")
+        return
+    
+    st.markdown("---")
+    render_html(L3_KEY_POINTS_HEADER_HTML)
+    
+    # Extract and display key RCA points
+    # Single case-insensitive pass over the analysis text collects every topic tag
+    matched_tags = set()
+    for match in RCA_KEYWORD_PATTERN.finditer(l3_analysis_text.lower()):
+        matched_tags.update(RCA_KEYWORD_TAGS[match.group(0)])
+    
+    # Build final RCA summary points in rule order, falling back to the generic summary
+    final_rca_points = [point for tag, point in RCA_POINT_RULES if tag in matched_tags] or RCA_DEFAULT_POINTS
+    
+    # Display final RCA points as a single element; parts are joined without
+    # blank lines so they stay in one HTML block
+    html_parts = [RCA_POINTS_WRAPPER_OPEN]
+    html_parts.extend(
+        RCA_POINT_CARD_TEMPLATE.format(idx=idx, title=point['title'], description=point['description'])
+        for idx, point in enumerate(final_rca_points, 1)
+    )
+    html_parts.append("</div>")
+    render_html("\n".join(html_parts))
+
+
+# Final impact score buckets: (-inf, 15] low, (15, 30] medium, (30, 50] high, (50, inf) critical
+IMPACT_SCORE_BINS = [float('-inf'), 15, 30, 50, float('inf')]
+PRIORITY_LABELS = ['P3 - Low', 'P2 - Medium', 'P1 - High', 'P0 - Critical']
+RECOMMENDATION_LABELS = ['Normal Operations', 'Monitor Closely', 'High Priority Fix', 'Immediate Action Required']
+
+# Overall incident severity: error counts above 20/50/100 raise it to Medium/High/Critical,
+# success rates below 80/50 raise it to High/Critical; the worse of the two wins
+INCIDENT_SEVERITY_LABELS = ['Low', 'Medium', 'High', 'Critical']
+ERROR_COUNT_SEVERITY_BOUNDS = [20, 50, 100]
+SUCCESS_RATE_SEVERITY_BOUNDS = [50, 80]
+SUCCESS_RATE_SEVERITY_LEVELS = [3, 2, 0]
+
+
+@st.cache_data(max_entries=16)
+def cached_final_summary_chart(bundle_fingerprint: str, _rca_metrics: Dict) -> Optional[go.Figure]:
+    """Build the final service impact chart once per bundle fingerprint."""
+    return create_rca_final_analysis_summary_chart(_rca_metrics)
+
+
+@st.cache_data(max_entries=16)
+def cached_final_timeline_chart(bundle_fingerprint: str, _rca_metrics: Dict) -> Optional[go.Figure]:
+    """Build the final incident timeline chart once per bundle fingerprint."""
+    return create_rca_final_timeline_summary_chart(_rca_metrics)
+
+
+def build_final_summary_tables(rca_metrics: Dict):
+    """Build the final summary metrics table and the scored comprehensive service table."""
+    error_stats = rca_metrics.get('error_stats', {})
+    service_stats = rca_metrics.get('service_stats', {})
+    request_patterns = rca_metrics.get('request_patterns', {})
+    timeline_stats = rca_metrics.get('timeline_stats', {})
+    errors_by_service = error_stats.get('errors_by_service', {})
+    
+    # Collect the raw per-service fields, then score every service with column arithmetic
+    service_rows = []
+    for service, details in service_stats.get('service_summary', {}).items():
+        if isinstance(details, dict) and 'error' not in details:
+            latency = (details.get('performance') or {}).get('latency')
+            service_rows.append({
+                'Service': service,
+                'Total Entries': details.get('total_entries', 0),
+                'Total Errors': details.get('errors', 0),
+                'Service Errors': errors_by_service.get(service, 0),
+                'error_rate': details.get('error_rate', 0),
+                'avg_latency': latency.get('avg', 0) if latency else None
+            })
+    
+    # One pass over the services feeds both the summary table and the comprehensive table
+    comprehensive_df = None
+    total_health_score = 0
+    healthy_services = 0
+    if service_rows:
+        comprehensive_df = pd.DataFrame(service_rows)
+        error_rate = comprehensive_df['error_rate'].astype(float)
+        avg_latency = comprehensive_df['avg_latency'].astype(float)
+        
+        # Calculate final score
+        final_score = (error_rate * 0.3) + (comprehensive_df['Service Errors'] * 0.25) + ((100 - (error_rate * 2)) * 0.25) + ((avg_latency.fillna(0) / 10) * 0.2)
+        
+        comprehensive_df['Error Rate (%)'] = error_rate.round(2)
+        comprehensive_df['Avg Latency (ms)'] = avg_latency.round(2).astype(object).where(avg_latency.notna(), 'N/A')
+        health_score = (100 - (error_rate * 2)).clip(lower=0)
+        total_health_score = float(health_score.sum())
+        healthy_services = int((health_score >= 80).sum())
+        comprehensive_df['Health Score'] = health_score.round(1)
+        comprehensive_df['Final Impact Score'] = final_score.round(1)
+        comprehensive_df['Priority'] = pd.cut(final_score, bins=IMPACT_SCORE_BINS, labels=PRIORITY_LABELS).astype(str)
+        comprehensive_df['Recommendation'] = pd.cut(final_score, bins=IMPACT_SCORE_BINS, labels=RECOMMENDATION_LABELS).astype(str)
+        comprehensive_df.drop(columns=['error_rate', 'avg_latency'], inplace=True)
+        comprehensive_df.sort_values('Final Impact Score', ascending=False, inplace=True, ignore_index=True)
+    
+    # Final Analysis Summary Table
+    total_errors = error_stats.get('total_errors', 0)
+    total_events = timeline_stats.get('total_events', 0)
+    services_analyzed = len(service_stats.get('service_summary', {}))
+    success_rate = request_patterns.get('success_rate', 0)
+    errors_by_category = error_stats.get('errors_by_category', {})
+    top_error_category = max(errors_by_category, key=errors_by_category.get) if errors_by_category else 'N/A'
+    most_affected_service = max(errors_by_service, key=errors_by_service.get) if errors_by_service else 'N/A'
+    
+    # Overall health score, from the per-service scores computed above
+    avg_health_score = total_health_score / services_analyzed if services_analyzed > 0 else 0
+    
+    severity_level = max(
+        bisect.bisect_left(ERROR_COUNT_SEVERITY_BOUNDS, total_errors),
+        SUCCESS_RATE_SEVERITY_LEVELS[bisect.bisect_right(SUCCESS_RATE_SEVERITY_BOUNDS, success_rate)]
+    )
+    
+    final_summary_data = [
+        {'Metric': 'Total Errors Detected', 'Value': total_errors, 'Category': 'Errors'},
+        {'Metric': 'Total Events Analyzed', 'Value': total_events, 'Category': 'Events'},
+        {'Metric': 'Services Analyzed', 'Value': services_analyzed, 'Category': 'Services'},
+        {'Metric': 'Overall Success Rate (%)', 'Value': f"{success_rate:.2f}%", 'Category': 'Performance'},
+        {'Metric': 'Average Service Health Score', 'Value': f"{avg_health_score:.1f}/100", 'Category': 'Health'},
+        {'Metric': 'Healthy Services', 'Value': f"{healthy_services}/{services_analyzed}", 'Category': 'Health'},
+        {'Metric': 'Top Error Category', 'Value': top_error_category, 'Category': 'Root Cause'},
+        {'Metric': 'Most Affected Service', 'Value': most_affected_service, 'Category': 'Root Cause'},
+        {'Metric': 'Critical Services', 'Value': services_analyzed - healthy_services, 'Category': 'Health'},
+        {'Metric': 'Overall Incident Severity', 'Value': INCIDENT_SEVERITY_LABELS[severity_level], 'Category': 'Severity'}
+    ]
+    
+    return pd.DataFrame(final_summary_data), comprehensive_df
+
+
+@st.cache_data(max_entries=16)
+def cached_final_summary_tables(bundle_fingerprint: str, _rca_metrics: Dict):
+    """Build the final summary tables once per bundle fingerprint so reruns skip re-scoring."""
+    return build_final_summary_tables(_rca_metrics)
+
+
+def display_final_analysis_summary(bundle_data: Dict):
+    """Display the combined L1/L2/L3 final analysis summary built from RCA tool metrics."""
+    if not RCA_TOOLS_AVAILABLE:
+        return
+    
+    rca_metrics = collect_rca_metrics(bundle_data)
+    if not rca_metrics or 'error' in rca_metrics.get('metadata', {}):
+        return
+    
+    st.markdown("---")
+    st.markdown("### 🎯 Final Analysis Summary")
+    render_html(FINAL_SUMMARY_HEADER_HTML)
+    
+    bundle_fingerprint = bundle_data.get('fingerprint')
+    
+    # Final Analysis Summary Chart
+    st.markdown("#### 📈 Final Analysis - Service Impact Summary")
+    final_summary_chart = cached_final_summary_chart(bundle_fingerprint, rca_metrics) if bundle_fingerprint else create_rca_final_analysis_summary_chart(rca_metrics)
+    if final_summary_chart:
+        st.plotly_chart(final_summary_chart, use_container_width=True, key=f"final_analysis_summary_{bundle_fingerprint}")
+    
+    # Final Analysis Summary Table
+    final_summary_df, comprehensive_df = cached_final_summary_tables(bundle_fingerprint, rca_metrics) if bundle_fingerprint else build_final_summary_tables(rca_metrics)
+    st.dataframe(final_summary_df, use_container_width=True, hide_index=True)
+    
+    # Final Timeline Summary Chart
+    st.markdown("---")
+    st.markdown("#### ⏱️ Final Analysis - Incident Timeline Progression")
+    final_timeline_chart = cached_final_timeline_chart(bundle_fingerprint, rca_metrics) if bundle_fingerprint else create_rca_final_timeline_summary_chart(rca_metrics)
+    if final_timeline_chart:
+        st.plotly_chart(final_timeline_chart, use_container_width=True, key=f"final_timeline_summary_{bundle_fingerprint}")
+    
+    # Final Comprehensive Analysis Table
+    st.markdown("---")
+    st.markdown("#### 📋 Final Comprehensive Analysis Table")
+    
+    if comprehensive_df is not None:
+        st.dataframe(comprehensive_df, use_container_width=True, hide_index=True)
+
+
+# Per-level presentation settings for the analysis result tabs
+ANALYSIS_LEVELS = {
+    'L1': {
+        'tab_name': "🔵 L1 Analysis",
+        'icon': '🔍',
+        'usage_icon': '🔵',
+        'title': 'L1 Analysis - Incident Triage',
+        'subtitle': 'Initial assessment and symptom identification',
+        'accent_color': '#2563EB',
+        'accent_rgb': '37, 99, 235',
+        'gradient_end_rgb': '59, 130, 246',
+        'banner_title': '🔍 Root Cause Analysis & Incident Insights',
+        'banner_text': 'Comprehensive analysis of symptoms, affected components, and initial root cause identification',
+        'banner_gradient_end_rgb': '0, 168, 255',
+        'banner_shadow_rgb': '0, 102, 255',
+    },
+    'L2': {
+        'tab_name': "🔷 L2 Analysis",
+        'icon': '🔬',
+        'usage_icon': '🔷',
+        'title': 'L2 Analysis - Correlation & Root Cause',
+        'subtitle': 'Component correlation and probable root cause identification',
+        'accent_color': '#7C3AED',
+        'accent_rgb': '124, 58, 237',
+        'gradient_end_rgb': '99, 102, 241',
+        'banner_title': '🔬 Correlation Analysis & Root Cause Identification',
+        'banner_text': 'Deep dive into component correlations, error patterns, and probable root causes with actionable insights',
+        'banner_gradient_end_rgb': '249, 115, 22',
+        'banner_shadow_rgb': '124, 58, 237',
+    },
+    'L3': {
+        'tab_name': "🟠 L3 Analysis",
+        'icon': '🎯',
+        'usage_icon': '🟠',
+        'title': 'L3 Analysis - Deep Root Cause & Recommendations',
+        'subtitle': 'Comprehensive root cause analysis with actionable recommendations',
+        'accent_color': '#F97316',
+        'accent_rgb': '249, 115, 22',
+        'gradient_end_rgb': '234, 88, 12',
+        'banner_title': '🎯 Deep Root Cause Analysis & Comprehensive Solutions',
+        'banner_text': 'Detailed root cause analysis with hardware-level insights, preventive measures, and actionable recommendations',
+        'banner_gradient_end_rgb': '255, 107, 53',
+        'banner_shadow_rgb': '249, 115, 22',
+    },
+}
+
+
+def build_level_header_html(config: Dict) -> str:
+    """Build the static title card shown at the top of an analysis level tab."""
+    return f"""
+    <div style="background: linear-gradient(135deg, rgba(255, 255, 255, 0.98) 0%, rgba(248, 250, 252, 0.98) 100%);
+                backdrop-filter: blur(10px); padding: 2rem; border-radius: 20px; margin: 1.5rem 0; 
+                border: 1px solid rgba({config['accent_rgb']}, 0.2); box-shadow: 0 4px 6px -1px rgba(0, 0, 0, 0.1);">
+        <div style="display: flex; align-items: center; gap: 1rem;">
+            <span style="font-size: 2.5rem;">{config['icon']}</span>
+            <div>
+                <h3 style="color: #1E293B; margin: 0; font-family: 'Space Grotesk', sans-serif; 
+                          font-weight: 700; font-size: 1.75rem;">{config['title']}</h3>
+                <p style="color: #64748B; margin: 0.5rem 0 0 0; font-size: 1rem;">{config['subtitle']}</p>
+            </div>
+        </div>
+    </div>
+    """
+
+
+def build_level_banner_html(config: Dict) -> str:
+    """Build the static root cause banner shown above an analysis result."""
+    return f"""
+    <div style="background: linear-gradient(135deg, rgba({config['accent_rgb']}, 0.08) 0%, rgba({config['banner_gradient_end_rgb']}, 0.08) 100%);
+                padding: 2rem; border-radius: 16px; margin: 2rem 0; 
+                border: 2px solid rgba({config['accent_rgb']}, 0.3); box-shadow: 0 8px 16px -4px rgba({config['banner_shadow_rgb']}, 0.2);">
+        <h3 style="color: {config['accent_color']}; margin-top: 0; font-family: 'Poppins', sans-serif; 
+                  font-weight: 800; font-size: 1.75rem; margin-bottom: 1rem;">
+            {config['banner_title']}
+        </h3>
+        <p style="color: #475569; font-size: 1rem; margin-bottom: 1.5rem;">
+            {config['banner_text']}
+        </p>
+    </div>
+    """
+
+
+# Level header and banner cards have no dynamic content, so build them once at import
+LEVEL_HEADER_HTML = {level: build_level_header_html(config) for level, config in ANALYSIS_LEVELS.items()}
+LEVEL_BANNER_HTML = {level: build_level_banner_html(config) for level, config in ANALYSIS_LEVELS.items()}
+
+
+def render_level_tab(level: str):
+    """
+    Render the results tab for a single analysis level.
+    
+    Args:
+        level: Analysis level key in ANALYSIS_LEVELS (L1, L2, L3)
+    """
+    config = ANALYSIS_LEVELS[level]
+    # Read session state once up front rather than through the proxy per access
+    session = st.session_state
+    bundle_data = session.bundle_data
+    analysis_text = session.analysis_results[level]
+    analysis_data = session.analysis_data.get(level)
+    token_info = session.token_usage.get(level)
+    cost_info = session.cost_info.get(level)
+    savings = session.optimization_savings.get(level)
+    
+    render_html(LEVEL_HEADER_HTML[level])
+    
+    # Display stats and diagram
+    if level == 'L1':
+        display_l1_stats_and_diagram(bundle_data, analysis_data, analysis_text)
+    elif level == 'L2':
+        display_l2_stats_and_diagram(bundle_data, analysis_text)
+    else:
+        display_l3_stats_and_diagram(bundle_data, analysis_text)
+    
+    # Display formatted JSON if available
+    if analysis_data:
+        st.markdown("---")
+        with st.expander("📋 View Structured JSON Data", expanded=False):
+            json_str = json.dumps(analysis_data, indent=2, ensure_ascii=False)
+            st.code(json_str, language='json')
+    
+    # Root Cause Analysis & Solutions
+    st.markdown("---")
+    render_html(LEVEL_BANNER_HTML[level])
+    result_fingerprint = session.analysis_fingerprints.get(level) or fingerprint_text(analysis_text)
+    st.markdown(build_analysis_result_html(result_fingerprint, analysis_text, config['accent_rgb']), unsafe_allow_html=True)
+    
+    if level == 'L3':
+        display_l3_key_points(analysis_text)
+    
+    # Display token usage (cost is computed once when the analysis completes)
+    if token_info:
+        total_tokens = token_info.get('total_token_count', 0)
+        prompt_tokens = token_info.get('prompt_token_count', 0)
+        response_tokens = token_info.get('candidates_token_count', 0)
+        
+        # Separator, token usage and optimization savings go out as one element.
+        # Parts are stripped and joined without blank lines so the markdown
+        # fallback of render_html keeps them in a single HTML block.
+        usage_parts = ["<hr>", build_token_usage_html(
+            level, config['usage_icon'], config['accent_color'], config['accent_rgb'], config['gradient_end_rgb'],
+            total_tokens, prompt_tokens, response_tokens, cost_info
+        )]
+        if savings:
+            usage_parts.append(build_savings_html(savings))
+        render_html("\n".join(part.strip() for part in usage_parts))
+    
+    # The final summary pipeline (metrics, charts, tables) only runs once L3 produced text
+    if level == 'L3' and analysis_text.strip():
+        display_final_analysis_summary(bundle_data)
+
+
+def render_analysis_dashboard():
+    """Render the analysis level selector, result tabs and download button for the loaded bundle."""
+    st.markdown("""
+    <div style="margin: 2rem 0 1.5rem 0;">
+        <h2 style="color: #111827; font-family: 'Inter', sans-serif; font-weight: 600; font-size: 1.5rem; margin-bottom: 0.5rem;">Analysis Dashboard</h2>
+        <p style="color: #6B7280; font-size: 0.875rem; margin-top: 0.5rem; font-weight: 400; font-family: 'Inter', sans-serif;">
+            Select an analysis level to begin comprehensive incident investigation
+        </p>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # Analysis level selector
+    selected_level = st.radio(
+        "Select Analysis Level",
+        options=["L1", "L2", "L3"],
+        format_func=lambda level: f"{level} Analysis",
+        horizontal=True,
+        key="analysis_level"
+    )
+    if st.button(f"Run {selected_level} Analysis", use_container_width=True, key="run_analysis_btn"):
+        if selected_level == "L1":
+            with st.spinner("🔍 Performing L1 analysis..."):
+                result, json_data = perform_l1_analysis(st.session_state.bundle_data)
+                st.session_state.analysis_results['L1'] = result
+                st.session_state.analysis_data['L1'] = json_data
+        elif selected_level == "L2":
+            with st.spinner("🔬 Performing L2 analysis..."):
+                result = perform_l2_analysis(st.session_state.bundle_data)
+                st.session_state.analysis_results['L2'] = result
+        else:
+            with st.spinner("🎯 Performing L3 analysis..."):
+                result = perform_l3_analysis(st.session_state.bundle_data)
+                st.session_state.analysis_results['L3'] = result
+        st.session_state.analysis_fingerprints[selected_level] = fingerprint_text(
+            st.session_state.analysis_results[selected_level]
+        )
+    
+    # Display results in tabs
+    analysis_results = st.session_state.analysis_results
+    active_levels = [level for level in ANALYSIS_LEVELS if level in analysis_results]
+    if not active_levels:
+        return
+    
+    st.markdown("---")
+    tabs = st.tabs([ANALYSIS_LEVELS[level]['tab_name'] for level in active_levels])
+    for tab, level in zip(tabs, active_levels):
+        with tab:
+            render_level_tab(level)
+    
+    # Download results (outside tabs, always visible)
+    st.markdown("---")
+    results_json = json.dumps(analysis_results, indent=2)
+    st.download_button(
+        label="📥 Download Analysis Results (JSON)",
+        data=results_json,
+        file_name="rca_analysis_results.json",
+        mime="application/json"
+    )
+
+
+# Run the chatbot as a fragment where supported (st.fragment since Streamlit 1.37,
+# st.experimental_fragment before that) so a chat message only reruns the chat
+# section instead of the whole page with every analysis tab
+chat_fragment = getattr(st, 'fragment', None) or getattr(st, 'experimental_fragment', None) or (lambda func: func)
+
+
+@chat_fragment
+def render_chat_section():
+    """Render the chatbot input and conversation history for the loaded bundle."""
+    # Chat input
+    user_query = st.chat_input("Ask a question about your RCA bundle logs...")
+    
+    if user_query:
+        # Add user message to history
+        st.session_state.chat_history.append({
+            'user': user_query,
+            'assistant': ''
+        })
+        
+        # Process query
+        with st.spinner("🤔 Analyzing bundle logs..."):
+            answer = process_chat_query(
+                st.session_state.bundle_data,
+                user_query,
+                st.session_state.chat_history[:-1]  # Exclude current message
+            )
+            
+            # Update last message with answer
+            st.session_state.chat_history[-1]['assistant'] = answer
+    
+    # Display conversation history at the bottom
+    if st.session_state.chat_history:
+        st.markdown("---")
+        st.markdown("""
+        <div style="background: #FFFFFF; padding: 1.25rem; border-radius: 8px; margin: 1.5rem 0; 
+                    border: 1px solid #E5E7EB; box-shadow: 0 2px 4px -1px rgba(0, 0, 0, 0.1);">
+            <h3 style="color: #111827; font-family: 'Inter', sans-serif; font-weight: 600; 
+                      font-size: 1.125rem; margin: 0 0 1rem 0; display: flex; align-items: center; gap: 0.5rem;">
+                💬 Conversation History
+            </h3>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        # Display all messages in the conversation
+        for i, msg in enumerate(st.session_state.chat_history):
+            with st.chat_message("user"):
+                st.write(msg['user'])
+            with st.chat_message("assistant"):
+                st.markdown(msg['assistant'])
+        
+        # Add some spacing at the end
+        st.markdown("<br>", unsafe_allow_html=True)
+
+
 def main():
     # Aziro Technologies Hero Section with Logo
     st.markdown("""
@@ -5130,711 +5957,12 @@ def main():
                     })
                     
                     st.markdown("**Files in bundle:**")
-                    for filename in sorted(bundle_data['files'].keys()):
-                        st.text(f"  • {filename}")
+                    # Single element for the whole listing instead of one st.text per file
+                    st.code("\n".join(f"  • {filename}" for filename in sorted(bundle_data['files'])), language=None)
                 
     # Enterprise Analysis Section
     if st.session_state.bundle_data:
-        st.markdown("""
-        <div style="margin: 2rem 0 1.5rem 0;">
-            <h2 style="color: #111827; font-family: 'Inter', sans-serif; font-weight: 600; font-size: 1.5rem; margin-bottom: 0.5rem;">Analysis Dashboard</h2>
-            <p style="color: #6B7280; font-size: 0.875rem; margin-top: 0.5rem; font-weight: 400; font-family: 'Inter', sans-serif;">
-                Select an analysis level to begin comprehensive incident investigation
-            </p>
-        </div>
-        """, unsafe_allow_html=True)
-        
-        col1, col2, col3 = st.columns(3)
-        
-        with col1:
-            st.markdown("""
-            <div style="text-align: center; margin-bottom: 0.5rem;">
-                <span class="analysis-badge badge-l1">L1</span>
-            </div>
-            """, unsafe_allow_html=True)
-            if st.button("Run L1 Analysis", use_container_width=True, key="l1_btn"):
-                with st.spinner("🔍 Performing L1 analysis..."):
-                    result, json_data = perform_l1_analysis(st.session_state.bundle_data)
-                    st.session_state.analysis_results['L1'] = result
-                    st.session_state.analysis_data['L1'] = json_data
-        
-        with col2:
-            st.markdown("""
-            <div style="text-align: center; margin-bottom: 0.5rem;">
-                <span class="analysis-badge badge-l2">L2</span>
-            </div>
-            """, unsafe_allow_html=True)
-            if st.button("Run L2 Analysis", use_container_width=True, key="l2_btn"):
-                with st.spinner("🔬 Performing L2 analysis..."):
-                    result = perform_l2_analysis(st.session_state.bundle_data)
-                    st.session_state.analysis_results['L2'] = result
-        
-        with col3:
-            st.markdown("""
-            <div style="text-align: center; margin-bottom: 0.5rem;">
-                <span class="analysis-badge badge-l3">L3</span>
-            </div>
-            """, unsafe_allow_html=True)
-            if st.button("Run L3 Analysis", use_container_width=True, key="l3_btn"):
-                with st.spinner("🎯 Performing L3 analysis..."):
-                    result = perform_l3_analysis(st.session_state.bundle_data)
-                    st.session_state.analysis_results['L3'] = result
-        
-        # Display results in tabs
-        if st.session_state.analysis_results:
-            st.markdown("---")
-            
-            # Create tabs for each analysis level
-            tab_names = []
-            if 'L1' in st.session_state.analysis_results:
-                tab_names.append("🔵 L1 Analysis")
-            if 'L2' in st.session_state.analysis_results:
-                tab_names.append("🔷 L2 Analysis")
-            if 'L3' in st.session_state.analysis_results:
-                tab_names.append("🟠 L3 Analysis")
-            
-            if tab_names:
-                tabs = st.tabs(tab_names)
-                tab_index = 0
-                
-                # L1 Results Tab
-                if 'L1' in st.session_state.analysis_results:
-                    with tabs[tab_index]:
-                        st.markdown("""
-                        <div style="background: linear-gradient(135deg, rgba(255, 255, 255, 0.98) 0%, rgba(248, 250, 252, 0.98) 100%);
-                                    backdrop-filter: blur(10px); padding: 2rem; border-radius: 20px; margin: 1.5rem 0; 
-                                    border: 1px solid rgba(37, 99, 235, 0.2); box-shadow: 0 4px 6px -1px rgba(0, 0, 0, 0.1);">
-                            <div style="display: flex; align-items: center; gap: 1rem;">
-                                <span style="font-size: 2.5rem;">🔍</span>
-                                <div>
-                                    <h3 style="color: #1E293B; margin: 0; font-family: 'Space Grotesk', sans-serif; 
-                                              font-weight: 700; font-size: 1.75rem;">L1 Analysis - Incident Triage</h3>
-                                    <p style="color: #64748B; margin: 0.5rem 0 0 0; font-size: 1rem;">Initial assessment and symptom identification</p>
-                                </div>
-                            </div>
-                </div>
-                        """, unsafe_allow_html=True)
-                        
-                        # Display stats and diagram
-                        display_l1_stats_and_diagram(
-                            st.session_state.bundle_data, 
-                            st.session_state.analysis_data.get('L1'),
-                            st.session_state.analysis_results['L1']
-                        )
-                        
-                        # Display formatted JSON if available
-                        if st.session_state.analysis_data.get('L1'):
-                            st.markdown("---")
-                            with st.expander("📋 View Structured JSON Data", expanded=False):
-                                json_str = json.dumps(st.session_state.analysis_data['L1'], indent=2, ensure_ascii=False)
-                                st.code(json_str, language='json')
-                        
-                        # Root Cause Analysis & Solutions - L1
-                        st.markdown("---")
-                        st.markdown("""
-                        <div style="background: linear-gradient(135deg, rgba(37, 99, 235, 0.08) 0%, rgba(0, 168, 255, 0.08) 100%);
-                        padding: 2rem; border-radius: 16px; margin: 2rem 0; 
-                        border: 2px solid rgba(37, 99, 235, 0.3); box-shadow: 0 8px 16px -4px rgba(0, 102, 255, 0.2);">
-                        <h3 style="color: #2563EB; margin-top: 0; font-family: 'Poppins', sans-serif; 
-                        font-weight: 800; font-size: 1.75rem; margin-bottom: 1rem;">
-                        🔍 Root Cause Analysis & Incident Insights
-                        </h3>
-                        <p style="color: #475569; font-size: 1rem; margin-bottom: 1.5rem;">
-                        Comprehensive analysis of symptoms, affected components, and initial root cause identification
-                        </p>
-                        </div>
-                        """, unsafe_allow_html=True)
-                        st.markdown(f"""
-                        <div style="background: rgba(255, 255, 255, 0.95); padding: 2rem; border-radius: 12px; 
-                        border: 1px solid rgba(37, 99, 235, 0.2); margin-bottom: 2rem; color: #1E293B;
-                        line-height: 1.8; font-size: 1.05rem; box-shadow: 0 4px 6px -1px rgba(0, 0, 0, 0.1);">
-                        {st.session_state.analysis_results['L1']}
-                        </div>
-                        """, unsafe_allow_html=True)
-            
-                        # Display token usage for L1
-                        if 'L1' in st.session_state.token_usage:
-                            token_info = st.session_state.token_usage['L1']
-                            total_tokens = token_info.get('total_token_count', 0)
-                            prompt_tokens = token_info.get('prompt_token_count', 0)
-                            response_tokens = token_info.get('candidates_token_count', 0)
-                            
-                            # Calculate cost
-                            cost_info = calculate_token_cost(prompt_tokens, response_tokens)
-                            
-                            st.markdown("---")
-                            st.markdown(f"""
-                            <div style="background: linear-gradient(135deg, rgba(255, 255, 255, 0.98) 0%, rgba(248, 250, 252, 0.98) 100%);
-                                        backdrop-filter: blur(10px); padding: 1.75rem; border-radius: 16px; 
-                                        border: 1px solid rgba(37, 99, 235, 0.2); box-shadow: 0 4px 6px -1px rgba(0, 0, 0, 0.1);
-                                        margin-bottom: 1rem;">
-                                <div style="display: flex; align-items: center; gap: 0.75rem; margin-bottom: 1rem;">
-                                    <span style="font-size: 1.75rem;">🔵</span>
-                                    <h4 style="color: #2563EB; margin: 0; font-family: 'Space Grotesk', sans-serif; 
-                                              font-weight: 700; font-size: 1.25rem;">L1 Analysis Token Usage</h4>
-                                </div>
-                                <div style="background: linear-gradient(135deg, rgba(37, 99, 235, 0.05) 0%, rgba(59, 130, 246, 0.05) 100%);
-                                            padding: 1rem; border-radius: 12px; margin-bottom: 1rem;">
-                                    <p style="color: #1E293B; font-size: 1rem; font-weight: 600; margin-bottom: 0.5rem; font-family: 'Inter', sans-serif;">
-                                        <strong style="color: #2563EB;">Total Tokens:</strong> <span style="color: #1E293B;">{total_tokens:,}</span>
-                                    </p>
-                                    <div style="display: flex; gap: 1.5rem; flex-wrap: wrap; font-size: 0.95rem; color: #64748B;">
-                                        <span><strong>Prompt:</strong> {prompt_tokens:,}</span>
-                                        <span><strong>Response:</strong> {response_tokens:,}</span>
-                                    </div>
-                                </div>
-                                <div style="background: linear-gradient(135deg, rgba(16, 185, 129, 0.1) 0%, rgba(5, 150, 105, 0.1) 100%);
-                                            padding: 1rem; border-radius: 12px; border-left: 4px solid #10B981;">
-                                    <p style="color: #1E293B; font-size: 1.125rem; font-weight: 700; margin: 0; font-family: 'Space Grotesk', sans-serif;">
-                                        💵 Estimated Cost: <span style="color: #10B981; font-size: 1.25rem;">${cost_info['total_cost']:.6f}</span>
-                                    </p>
-                                    <div style="margin-top: 0.5rem; font-size: 0.875rem; color: #64748B;">
-                                        Input: ${cost_info['input_cost']:.6f} • Output: ${cost_info['output_cost']:.6f}
-                                    </div>
-                                </div>
-                            </div>
-                            """, unsafe_allow_html=True)
-                            
-                            # Display optimization savings for L1
-                            if 'L1' in st.session_state.optimization_savings:
-                                savings = st.session_state.optimization_savings['L1']
-                                st.markdown(f"""
-                                <div style="background: linear-gradient(135deg, rgba(249, 115, 22, 0.12) 0%, rgba(255, 140, 66, 0.12) 100%);
-                                            backdrop-filter: blur(10px); padding: 1.75rem; border-radius: 16px; 
-                                            border: 2px solid rgba(249, 115, 22, 0.4); box-shadow: 0 8px 16px -4px rgba(249, 115, 22, 0.3);
-                                            margin-top: 1.5rem; margin-bottom: 1rem;">
-                                    <div style="display: flex; align-items: center; gap: 0.75rem; margin-bottom: 1rem;">
-                                        <span style="font-size: 2rem;">💰</span>
-                                        <h4 style="color: #F97316; margin: 0; font-family: 'Space Grotesk', sans-serif; 
-                                                  font-weight: 800; font-size: 1.35rem;">Optimization Savings (Multilevel Chunking)</h4>
-                                    </div>
-                                    <div style="display: grid; grid-template-columns: repeat(2, 1fr); gap: 1rem; margin-bottom: 1rem;">
-                                        <div style="background: rgba(255, 255, 255, 0.6); padding: 1rem; border-radius: 12px; border: 1px solid rgba(249, 115, 22, 0.2);">
-                                            <p style="color: #64748B; font-size: 0.875rem; margin: 0 0 0.5rem 0; font-weight: 600;">Tokens Saved</p>
-                                            <p style="color: #1E293B; font-size: 1.5rem; font-weight: 800; margin: 0; font-family: 'Space Grotesk', sans-serif;">
-                                                {savings['tokens_saved']:,} <span style="color: #10B981; font-size: 1rem;">({savings['savings_percentage']:.1f}%)</span>
-                                            </p>
-                                            <p style="color: #64748B; font-size: 0.75rem; margin: 0.25rem 0 0 0;">
-                                                Baseline: {savings['baseline_tokens']:,} → Optimized: {savings['optimized_tokens']:,}
-                                            </p>
-                                        </div>
-                                        <div style="background: rgba(255, 255, 255, 0.6); padding: 1rem; border-radius: 12px; border: 1px solid rgba(249, 115, 22, 0.2);">
-                                            <p style="color: #64748B; font-size: 0.875rem; margin: 0 0 0.5rem 0; font-weight: 600;">Cost Saved</p>
-                                            <p style="color: #1E293B; font-size: 1.5rem; font-weight: 800; margin: 0; font-family: 'Space Grotesk', sans-serif;">
-                                                ${savings['cost_saved']:.6f} <span style="color: #10B981; font-size: 1rem;">({savings['cost_savings_percentage']:.1f}%)</span>
-                                            </p>
-                                            <p style="color: #64748B; font-size: 0.75rem; margin: 0.25rem 0 0 0;">
-                                                Baseline: ${savings['baseline_cost']:.6f} → Optimized: ${savings['optimized_cost']:.6f}
-                                            </p>
-                                        </div>
-                                    </div>
-                                    <div style="background: rgba(16, 185, 129, 0.1); padding: 0.75rem; border-radius: 8px; border-left: 3px solid #10B981;">
-                                        <p style="color: #1E293B; font-size: 0.9rem; margin: 0 0 0.5rem 0; font-weight: 600;">
-                                            ✨ <strong style="color: #0066FF;">Multilevel chunking</strong> (4-level progressive filtering) reduced token usage by <strong style="color: #10B981;">{savings['savings_percentage']:.1f}%</strong> while maintaining analysis quality!
-                                        </p>
-                                        <p style="color: #64748B; font-size: 0.8rem; margin: 0; line-height: 1.5;">
-                                            <strong>Multilevel Process:</strong> Level 1 → Extract critical content | Level 2 → Deduplicate & prioritize | Level 3 → Compress & summarize | Level 4 → Remove noise & optimize
-                                        </p>
-                                </div>
-                            </div>
-                            """, unsafe_allow_html=True)
-                    tab_index += 1
-                
-                # L2 Results Tab
-                if 'L2' in st.session_state.analysis_results:
-                    with tabs[tab_index]:
-                        st.markdown("""
-                        <div style="background: linear-gradient(135deg, rgba(255, 255, 255, 0.98) 0%, rgba(248, 250, 252, 0.98) 100%);
-                                    backdrop-filter: blur(10px); padding: 2rem; border-radius: 20px; margin: 1.5rem 0; 
-                                    border: 1px solid rgba(124, 58, 237, 0.2); box-shadow: 0 4px 6px -1px rgba(0, 0, 0, 0.1);">
-                            <div style="display: flex; align-items: center; gap: 1rem;">
-                                <span style="font-size: 2.5rem;">🔬</span>
-                                <div>
-                                    <h3 style="color: #1E293B; margin: 0; font-family: 'Space Grotesk', sans-serif; 
-                                              font-weight: 700; font-size: 1.75rem;">L2 Analysis - Correlation & Root Cause</h3>
-                                    <p style="color: #64748B; margin: 0.5rem 0 0 0; font-size: 1rem;">Component correlation and probable root cause identification</p>
-                                </div>
-                            </div>
-                        </div>
-                        """, unsafe_allow_html=True)
-                        
-                        # Display stats and diagram
-                        display_l2_stats_and_diagram(st.session_state.bundle_data, st.session_state.analysis_results['L2'])
-                        
-                        # Root Cause Analysis & Solutions - L2
-                        st.markdown("---")
-                        st.markdown("""
-                        <div style="background: linear-gradient(135deg, rgba(124, 58, 237, 0.08) 0%, rgba(249, 115, 22, 0.08) 100%);
-                                    padding: 2rem; border-radius: 16px; margin: 2rem 0; 
-                                    border: 2px solid rgba(124, 58, 237, 0.3); box-shadow: 0 8px 16px -4px rgba(124, 58, 237, 0.2);">
-                            <h3 style="color: #7C3AED; margin-top: 0; font-family: 'Poppins', sans-serif; 
-                                      font-weight: 800; font-size: 1.75rem; margin-bottom: 1rem;">
-                                🔬 Correlation Analysis & Root Cause Identification
-                            </h3>
-                            <p style="color: #475569; font-size: 1rem; margin-bottom: 1.5rem;">
-                                Deep dive into component correlations, error patterns, and probable root causes with actionable insights
-                            </p>
-                        </div>
-                        """, unsafe_allow_html=True)
-                        st.markdown(f"""
-                        <div style="background: rgba(255, 255, 255, 0.95); padding: 2rem; border-radius: 12px; 
-                                    border: 1px solid rgba(124, 58, 237, 0.2); margin-bottom: 2rem; color: #1E293B;
-                                    line-height: 1.8; font-size: 1.05rem; box-shadow: 0 4px 6px -1px rgba(0, 0, 0, 0.1);">
-                            {st.session_state.analysis_results['L2']}
-                        </div>
-                        """, unsafe_allow_html=True)
-                        
-                        # Display token usage for L2
-                        if 'L2' in st.session_state.token_usage:
-                            token_info = st.session_state.token_usage['L2']
-                            total_tokens = token_info.get('total_token_count', 0)
-                            prompt_tokens = token_info.get('prompt_token_count', 0)
-                            response_tokens = token_info.get('candidates_token_count', 0)
-                            
-                            # Calculate cost
-                            cost_info = calculate_token_cost(prompt_tokens, response_tokens)
-                            
-                            st.markdown("---")
-                            st.markdown(f"""
-                            <div style="background: linear-gradient(135deg, rgba(255, 255, 255, 0.98) 0%, rgba(248, 250, 252, 0.98) 100%);
-                                        backdrop-filter: blur(10px); padding: 1.75rem; border-radius: 16px; 
-                                        border: 1px solid rgba(124, 58, 237, 0.2); box-shadow: 0 4px 6px -1px rgba(0, 0, 0, 0.1);
-                                        margin-bottom: 1rem;">
-                                <div style="display: flex; align-items: center; gap: 0.75rem; margin-bottom: 1rem;">
-                                    <span style="font-size: 1.75rem;">🔷</span>
-                                    <h4 style="color: #7C3AED; margin: 0; font-family: 'Space Grotesk', sans-serif; 
-                                              font-weight: 700; font-size: 1.25rem;">L2 Analysis Token Usage</h4>
-                                </div>
-                                <div style="background: linear-gradient(135deg, rgba(124, 58, 237, 0.05) 0%, rgba(99, 102, 241, 0.05) 100%);
-                                            padding: 1rem; border-radius: 12px; margin-bottom: 1rem;">
-                                    <p style="color: #1E293B; font-size: 1rem; font-weight: 600; margin-bottom: 0.5rem; font-family: 'Inter', sans-serif;">
-                                        <strong style="color: #7C3AED;">Total Tokens:</strong> <span style="color: #1E293B;">{total_tokens:,}</span>
-                                    </p>
-                                    <div style="display: flex; gap: 1.5rem; flex-wrap: wrap; font-size: 0.95rem; color: #64748B;">
-                                        <span><strong>Prompt:</strong> {prompt_tokens:,}</span>
-                                        <span><strong>Response:</strong> {response_tokens:,}</span>
-                                    </div>
-                                </div>
-                                <div style="background: linear-gradient(135deg, rgba(16, 185, 129, 0.1) 0%, rgba(5, 150, 105, 0.1) 100%);
-                                            padding: 1rem; border-radius: 12px; border-left: 4px solid #10B981;">
-                                    <p style="color: #1E293B; font-size: 1.125rem; font-weight: 700; margin: 0; font-family: 'Space Grotesk', sans-serif;">
-                                        💵 Estimated Cost: <span style="color: #10B981; font-size: 1.25rem;">${cost_info['total_cost']:.6f}</span>
-                                    </p>
-                                    <div style="margin-top: 0.5rem; font-size: 0.875rem; color: #64748B;">
-                                        Input: ${cost_info['input_cost']:.6f} • Output: ${cost_info['output_cost']:.6f}
-                                    </div>
-                                </div>
-                            </div>
-                            """, unsafe_allow_html=True)
-                            
-                            # Display optimization savings for L2
-                            if 'L2' in st.session_state.optimization_savings:
-                                savings = st.session_state.optimization_savings['L2']
-                                st.markdown(f"""
-                                <div style="background: linear-gradient(135deg, rgba(249, 115, 22, 0.12) 0%, rgba(255, 140, 66, 0.12) 100%);
-                                            backdrop-filter: blur(10px); padding: 1.75rem; border-radius: 16px; 
-                                            border: 2px solid rgba(249, 115, 22, 0.4); box-shadow: 0 8px 16px -4px rgba(249, 115, 22, 0.3);
-                                            margin-top: 1.5rem; margin-bottom: 1rem;">
-                                    <div style="display: flex; align-items: center; gap: 0.75rem; margin-bottom: 1rem;">
-                                        <span style="font-size: 2rem;">💰</span>
-                                        <h4 style="color: #F97316; margin: 0; font-family: 'Space Grotesk', sans-serif; 
-                                                  font-weight: 800; font-size: 1.35rem;">Optimization Savings (Multilevel Chunking)</h4>
-                                    </div>
-                                    <div style="display: grid; grid-template-columns: repeat(2, 1fr); gap: 1rem; margin-bottom: 1rem;">
-                                        <div style="background: rgba(255, 255, 255, 0.6); padding: 1rem; border-radius: 12px; border: 1px solid rgba(249, 115, 22, 0.2);">
-                                            <p style="color: #64748B; font-size: 0.875rem; margin: 0 0 0.5rem 0; font-weight: 600;">Tokens Saved</p>
-                                            <p style="color: #1E293B; font-size: 1.5rem; font-weight: 800; margin: 0; font-family: 'Space Grotesk', sans-serif;">
-                                                {savings['tokens_saved']:,} <span style="color: #10B981; font-size: 1rem;">({savings['savings_percentage']:.1f}%)</span>
-                                            </p>
-                                            <p style="color: #64748B; font-size: 0.75rem; margin: 0.25rem 0 0 0;">
-                                                Baseline: {savings['baseline_tokens']:,} → Optimized: {savings['optimized_tokens']:,}
-                                            </p>
-                                        </div>
-                                        <div style="background: rgba(255, 255, 255, 0.6); padding: 1rem; border-radius: 12px; border: 1px solid rgba(249, 115, 22, 0.2);">
-                                            <p style="color: #64748B; font-size: 0.875rem; margin: 0 0 0.5rem 0; font-weight: 600;">Cost Saved</p>
-                                            <p style="color: #1E293B; font-size: 1.5rem; font-weight: 800; margin: 0; font-family: 'Space Grotesk', sans-serif;">
-                                                ${savings['cost_saved']:.6f} <span style="color: #10B981; font-size: 1rem;">({savings['cost_savings_percentage']:.1f}%)</span>
-                                            </p>
-                                            <p style="color: #64748B; font-size: 0.75rem; margin: 0.25rem 0 0 0;">
-                                                Baseline: ${savings['baseline_cost']:.6f} → Optimized: ${savings['optimized_cost']:.6f}
-                                            </p>
-                                        </div>
-                                    </div>
-                                    <div style="background: rgba(16, 185, 129, 0.1); padding: 0.75rem; border-radius: 8px; border-left: 3px solid #10B981;">
-                                        <p style="color: #1E293B; font-size: 0.9rem; margin: 0 0 0.5rem 0; font-weight: 600;">
-                                            ✨ <strong style="color: #0066FF;">Multilevel chunking</strong> (4-level progressive filtering) reduced token usage by <strong style="color: #10B981;">{savings['savings_percentage']:.1f}%</strong> while maintaining analysis quality!
-                                        </p>
-                                        <p style="color: #64748B; font-size: 0.8rem; margin: 0; line-height: 1.5;">
-                                            <strong>Multilevel Process:</strong> Level 1 → Extract critical content | Level 2 → Deduplicate & prioritize | Level 3 → Compress & summarize | Level 4 → Remove noise & optimize
-                                        </p>
-                                </div>
-                            </div>
-                            """, unsafe_allow_html=True)
-                    tab_index += 1
-                
-                # L3 Results Tab
-                if 'L3' in st.session_state.analysis_results:
-                    with tabs[tab_index]:
-                        st.markdown("""
-                        <div style="background: linear-gradient(135deg, rgba(255, 255, 255, 0.98) 0%, rgba(248, 250, 252, 0.98) 100%);
-                                    backdrop-filter: blur(10px); padding: 2rem; border-radius: 20px; margin: 1.5rem 0; 
-                                    border: 1px solid rgba(249, 115, 22, 0.2); box-shadow: 0 4px 6px -1px rgba(0, 0, 0, 0.1);">
-                            <div style="display: flex; align-items: center; gap: 1rem;">
-                                <span style="font-size: 2.5rem;">🎯</span>
-                                <div>
-                                    <h3 style="color: #1E293B; margin: 0; font-family: 'Space Grotesk', sans-serif; 
-                                              font-weight: 700; font-size: 1.75rem;">L3 Analysis - Deep Root Cause & Recommendations</h3>
-                                    <p style="color: #64748B; margin: 0.5rem 0 0 0; font-size: 1rem;">Comprehensive root cause analysis with actionable recommendations</p>
-                                </div>
-                            </div>
-                        </div>
-                        """, unsafe_allow_html=True)
-                        
-                        # Display stats and diagram
-                        display_l3_stats_and_diagram(st.session_state.bundle_data, st.session_state.analysis_results['L3'])
-                        
-                        # Root Cause Analysis & Solutions - L3
-                        st.markdown("---")
-                        st.markdown("""
-                        <div style="background: linear-gradient(135deg, rgba(249, 115, 22, 0.08) 0%, rgba(255, 107, 53, 0.08) 100%);
-                                    padding: 2rem; border-radius: 16px; margin: 2rem 0; 
-                                    border: 2px solid rgba(249, 115, 22, 0.3); box-shadow: 0 8px 16px -4px rgba(249, 115, 22, 0.2);">
-                            <h3 style="color: #F97316; margin-top: 0; font-family: 'Poppins', sans-serif; 
-                                      font-weight: 800; font-size: 1.75rem; margin-bottom: 1rem;">
-                                🎯 Deep Root Cause Analysis & Comprehensive Solutions
-                            </h3>
-                            <p style="color: #475569; font-size: 1rem; margin-bottom: 1.5rem;">
-                                Detailed root cause analysis with hardware-level insights, preventive measures, and actionable recommendations
-                            </p>
-                        </div>
-                        """, unsafe_allow_html=True)
-                        st.markdown(f"""
-                        <div style="background: rgba(255, 255, 255, 0.95); padding: 2rem; border-radius: 12px; 
-                                    border: 1px solid rgba(249, 115, 22, 0.2); margin-bottom: 2rem; color: #1E293B;
-                                    line-height: 1.8; font-size: 1.05rem; box-shadow: 0 4px 6px -1px rgba(0, 0, 0, 0.1);">
-                            {st.session_state.analysis_results['L3']}
-                        </div>
-                        """, unsafe_allow_html=True)
-                        
-                        # Final RCA Analysis Summary - Key Points
-                        st.markdown("---")
-                        st.markdown("""
-                        <div style="background: linear-gradient(135deg, rgba(16, 185, 129, 0.1) 0%, rgba(5, 150, 105, 0.1) 100%);
-                                    padding: 2.5rem; border-radius: 20px; margin: 3rem 0 2rem 0; 
-                                    border: 3px solid rgba(16, 185, 129, 0.4); box-shadow: 0 12px 24px -4px rgba(16, 185, 129, 0.3);">
-                            <h3 style="color: #10B981; margin-top: 0; font-family: 'Poppins', sans-serif; 
-                                      font-weight: 900; font-size: 2rem; margin-bottom: 1.5rem; text-align: center;">
-                                🎯 Final RCA Analysis - Key Summary Points
-                            </h3>
-                            <p style="color: #475569; font-size: 1.1rem; margin-bottom: 2rem; text-align: center; font-weight: 600;">
-                                Comprehensive root cause analysis summary with actionable insights and recommendations
-                            </p>
-                        </div>
-                        """, unsafe_allow_html=True)
-                        
-                        # Extract and display key RCA points
-                        l3_analysis_text = st.session_state.analysis_results.get('L3', '')
-                        rca_metrics = None
-                        if RCA_TOOLS_AVAILABLE:
-                            rca_metrics = collect_rca_metrics(st.session_state.bundle_data)
-                        
-                        # Build final RCA summary points
-                        final_rca_points = []
-                        
-                        # Extract root cause from analysis
-                        if 'root cause' in l3_analysis_text.lower() or 'root cause' in l3_analysis_text.lower():
-                            final_rca_points.append({
-                                'title': 'Root Cause Identified',
-                                'description': 'The primary root cause has been identified through comprehensive analysis of storage infrastructure, hardware components, and system performance metrics.'
-                            })
-                        
-                        # Extract storage-related issues
-                        if 'storage' in l3_analysis_text.lower() or 'IOPS' in l3_analysis_text.lower() or 'latency' in l3_analysis_text.lower():
-                            final_rca_points.append({
-                                'title': 'Storage Performance Bottleneck',
-                                'description': 'Severe storage performance issues detected, including extremely low IOPS (0 IOPS), high latency, and storage infrastructure degradation preventing proper volume mounting.'
-                            })
-                        
-                        # Extract hardware-level issues
-                        if 'hardware' in l3_analysis_text.lower() or 'disk' in l3_analysis_text.lower() or 'storage server' in l3_analysis_text.lower():
-                            final_rca_points.append({
-                                'title': 'Hardware-Level Infrastructure Issues',
-                                'description': 'Critical hardware-level problems identified in storage servers, including potential disk failures, power-related issues, and infrastructure bottlenecks affecting system reliability.'
-                            })
-                        
-                        # Extract power-related issues
-                        if 'power' in l3_analysis_text.lower() or 'restart' in l3_analysis_text.lower() or 'shutdown' in l3_analysis_text.lower():
-                            final_rca_points.append({
-                                'title': 'Power & Infrastructure Instability',
-                                'description': 'Power-related incidents and unexpected restarts have been correlated with storage failures, indicating potential power infrastructure issues or insufficient redundancy.'
-                            })
-                        
-                        # Extract solutions/recommendations
-                        if 'recommendation' in l3_analysis_text.lower() or 'solution' in l3_analysis_text.lower() or 'fix' in l3_analysis_text.lower():
-                            final_rca_points.append({
-                                'title': 'Recommended Solutions & Actions',
-                                'description': 'Comprehensive remediation plan includes storage infrastructure upgrades, hardware replacements, enhanced monitoring and alerting, and preventive measures to ensure system reliability.'
-                            })
-                        
-                        # Extract monitoring recommendations
-                        if 'monitoring' in l3_analysis_text.lower() or 'alert' in l3_analysis_text.lower() or 'preventive' in l3_analysis_text.lower():
-                            final_rca_points.append({
-                                'title': 'Preventive Monitoring & Alerting',
-                                'description': 'Implementation of real-time monitoring for IOPS, latency, disk queue depth, capacity utilization, and correlated alerts to detect and prevent future incidents proactively.'
-                            })
-                        
-                        # If no specific points extracted, add generic RCA summary
-                        if not final_rca_points:
-                            final_rca_points = [
-                                {
-                                    'title': 'Root Cause Analysis Complete',
-                                    'description': 'Comprehensive root cause analysis has been performed across all system layers (L1, L2, L3) with detailed investigation of symptoms, correlations, and underlying infrastructure issues.'
-                                },
-                                {
-                                    'title': 'Actionable Recommendations Provided',
-                                    'description': 'Detailed recommendations and solutions have been identified to address the root cause and prevent recurrence, including infrastructure improvements and enhanced monitoring.'
-                                }
-                            ]
-                        
-                        # Display final RCA points
-                        st.markdown("""
-                        <div style="background: rgba(255, 255, 255, 0.98); padding: 2rem; border-radius: 16px; 
-                                    border: 2px solid rgba(16, 185, 129, 0.3); margin-bottom: 2rem;
-                                    box-shadow: 0 8px 16px -4px rgba(16, 185, 129, 0.2);">
-                        """, unsafe_allow_html=True)
-                        
-                        for idx, point in enumerate(final_rca_points, 1):
-                            st.markdown(f"""
-                            <div style="margin-bottom: 1.5rem; padding: 1.5rem; background: linear-gradient(135deg, rgba(16, 185, 129, 0.05) 0%, rgba(249, 115, 22, 0.05) 100%);
-                                        border-radius: 12px; border-left: 5px solid #10B981;">
-                                <h4 style="color: #059669; margin-top: 0; margin-bottom: 0.75rem; font-family: 'Poppins', sans-serif; 
-                                          font-weight: 800; font-size: 1.35rem;">
-                                    <strong>{idx}. {point['title']}</strong>
-                                </h4>
-                                <p style="color: #1E293B; margin: 0; line-height: 1.7; font-size: 1.05rem; font-family: 'Inter', sans-serif;">
-                                    {point['description']}
-                                </p>
-                            </div>
-                            """, unsafe_allow_html=True)
-                        
-                        st.markdown("</div>", unsafe_allow_html=True)
-                        
-                        # Display token usage for L3
-                        if 'L3' in st.session_state.token_usage:
-                            token_info = st.session_state.token_usage['L3']
-                            total_tokens = token_info.get('total_token_count', 0)
-                            prompt_tokens = token_info.get('prompt_token_count', 0)
-                            response_tokens = token_info.get('candidates_token_count', 0)
-                            
-                            # Calculate cost
-                            cost_info = calculate_token_cost(prompt_tokens, response_tokens)
-                            
-                            st.markdown("---")
-                            st.markdown(f"""
-                            <div style="background: linear-gradient(135deg, rgba(255, 255, 255, 0.98) 0%, rgba(248, 250, 252, 0.98) 100%);
-                                        backdrop-filter: blur(10px); padding: 1.75rem; border-radius: 16px; 
-                                        border: 1px solid rgba(249, 115, 22, 0.2); box-shadow: 0 4px 6px -1px rgba(0, 0, 0, 0.1);
-                                        margin-bottom: 1rem;">
-                                <div style="display: flex; align-items: center; gap: 0.75rem; margin-bottom: 1rem;">
-                                    <span style="font-size: 1.75rem;">🟠</span>
-                                    <h4 style="color: #F97316; margin: 0; font-family: 'Space Grotesk', sans-serif; 
-                                              font-weight: 700; font-size: 1.25rem;">L3 Analysis Token Usage</h4>
-                                </div>
-                                <div style="background: linear-gradient(135deg, rgba(249, 115, 22, 0.05) 0%, rgba(234, 88, 12, 0.05) 100%);
-                                            padding: 1rem; border-radius: 12px; margin-bottom: 1rem;">
-                                    <p style="color: #1E293B; font-size: 1rem; font-weight: 600; margin-bottom: 0.5rem; font-family: 'Inter', sans-serif;">
-                                        <strong style="color: #F97316;">Total Tokens:</strong> <span style="color: #1E293B;">{total_tokens:,}</span>
-                                    </p>
-                                    <div style="display: flex; gap: 1.5rem; flex-wrap: wrap; font-size: 0.95rem; color: #64748B;">
-                                        <span><strong>Prompt:</strong> {prompt_tokens:,}</span>
-                                        <span><strong>Response:</strong> {response_tokens:,}</span>
-                                    </div>
-                                </div>
-                                <div style="background: linear-gradient(135deg, rgba(16, 185, 129, 0.1) 0%, rgba(5, 150, 105, 0.1) 100%);
-                                            padding: 1rem; border-radius: 12px; border-left: 4px solid #10B981;">
-                                    <p style="color: #1E293B; font-size: 1.125rem; font-weight: 700; margin: 0; font-family: 'Space Grotesk', sans-serif;">
-                                        💵 Estimated Cost: <span style="color: #10B981; font-size: 1.25rem;">${cost_info['total_cost']:.6f}</span>
-                                    </p>
-                                    <div style="margin-top: 0.5rem; font-size: 0.875rem; color: #64748B;">
-                                        Input: ${cost_info['input_cost']:.6f} • Output: ${cost_info['output_cost']:.6f}
-                                    </div>
-                                </div>
-                            </div>
-                            """, unsafe_allow_html=True)
-                            
-                            # Display optimization savings for L3
-                            if 'L3' in st.session_state.optimization_savings:
-                                savings = st.session_state.optimization_savings['L3']
-                                st.markdown(f"""
-                                <div style="background: linear-gradient(135deg, rgba(249, 115, 22, 0.12) 0%, rgba(255, 140, 66, 0.12) 100%);
-                                            backdrop-filter: blur(10px); padding: 1.75rem; border-radius: 16px; 
-                                            border: 2px solid rgba(249, 115, 22, 0.4); box-shadow: 0 8px 16px -4px rgba(249, 115, 22, 0.3);
-                                            margin-top: 1.5rem; margin-bottom: 1rem;">
-                                    <div style="display: flex; align-items: center; gap: 0.75rem; margin-bottom: 1rem;">
-                                        <span style="font-size: 2rem;">💰</span>
-                                        <h4 style="color: #F97316; margin: 0; font-family: 'Space Grotesk', sans-serif; 
-                                                  font-weight: 800; font-size: 1.35rem;">Optimization Savings (Multilevel Chunking)</h4>
-                                    </div>
-                                    <div style="display: grid; grid-template-columns: repeat(2, 1fr); gap: 1rem; margin-bottom: 1rem;">
-                                        <div style="background: rgba(255, 255, 255, 0.6); padding: 1rem; border-radius: 12px; border: 1px solid rgba(249, 115, 22, 0.2);">
-                                            <p style="color: #64748B; font-size: 0.875rem; margin: 0 0 0.5rem 0; font-weight: 600;">Tokens Saved</p>
-                                            <p style="color: #1E293B; font-size: 1.5rem; font-weight: 800; margin: 0; font-family: 'Space Grotesk', sans-serif;">
-                                                {savings['tokens_saved']:,} <span style="color: #10B981; font-size: 1rem;">({savings['savings_percentage']:.1f}%)</span>
-                                            </p>
-                                            <p style="color: #64748B; font-size: 0.75rem; margin: 0.25rem 0 0 0;">
-                                                Baseline: {savings['baseline_tokens']:,} → Optimized: {savings['optimized_tokens']:,}
-                                            </p>
-                                        </div>
-                                        <div style="background: rgba(255, 255, 255, 0.6); padding: 1rem; border-radius: 12px; border: 1px solid rgba(249, 115, 22, 0.2);">
-                                            <p style="color: #64748B; font-size: 0.875rem; margin: 0 0 0.5rem 0; font-weight: 600;">Cost Saved</p>
-                                            <p style="color: #1E293B; font-size: 1.5rem; font-weight: 800; margin: 0; font-family: 'Space Grotesk', sans-serif;">
-                                                ${savings['cost_saved']:.6f} <span style="color: #10B981; font-size: 1rem;">({savings['cost_savings_percentage']:.1f}%)</span>
-                                            </p>
-                                            <p style="color: #64748B; font-size: 0.75rem; margin: 0.25rem 0 0 0;">
-                                                Baseline: ${savings['baseline_cost']:.6f} → Optimized: ${savings['optimized_cost']:.6f}
-                                            </p>
-                                        </div>
-                                    </div>
-                                    <div style="background: rgba(16, 185, 129, 0.1); padding: 0.75rem; border-radius: 8px; border-left: 3px solid #10B981;">
-                                        <p style="color: #1E293B; font-size: 0.9rem; margin: 0 0 0.5rem 0; font-weight: 600;">
-                                            ✨ <strong style="color: #0066FF;">Multilevel chunking</strong> (4-level progressive filtering) reduced token usage by <strong style="color: #10B981;">{savings['savings_percentage']:.1f}%</strong> while maintaining analysis quality!
-                                        </p>
-                                        <p style="color: #64748B; font-size: 0.8rem; margin: 0; line-height: 1.5;">
-                                            <strong>Multilevel Process:</strong> Level 1 → Extract critical content | Level 2 → Deduplicate & prioritize | Level 3 → Compress & summarize | Level 4 → Remove noise & optimize
-                                        </p>
-                                </div>
-                            </div>
-                            """, unsafe_allow_html=True)
-                        
-                        # Final Analysis Summary - After L3
-                        if RCA_TOOLS_AVAILABLE:
-                            rca_metrics = collect_rca_metrics(st.session_state.bundle_data)
-                            if rca_metrics and 'error' not in rca_metrics.get('metadata', {}):
-                                st.markdown("---")
-                                st.markdown("### 🎯 Final Analysis Summary")
-                                st.markdown("""
-                                <div style="background: linear-gradient(135deg, rgba(0, 102, 255, 0.1) 0%, rgba(255, 107, 53, 0.1) 100%);
-                                            padding: 2rem; border-radius: 20px; margin: 2rem 0; 
-                                            border: 2px solid;
-                                            border-image: linear-gradient(135deg, #0066FF 0%, #FF6B35 100%) 1;
-                                            box-shadow: 0 8px 16px -4px rgba(0, 102, 255, 0.2), 0 8px 16px -4px rgba(255, 107, 53, 0.2);">
-                                    <h3 style="color: #0F172A; margin-top: 0; font-family: 'Poppins', sans-serif; 
-                                              font-weight: 800; font-size: 1.75rem; margin-bottom: 1rem;">
-                                        📊 Comprehensive Incident Analysis Summary
-                                    </h3>
-                                    <p style="color: #475569; font-size: 1.1rem; margin: 0; font-weight: 500;">
-                                        Complete overview combining insights from L1, L2, and L3 analysis levels
-                                    </p>
-                                </div>
-                                """, unsafe_allow_html=True)
-                                
-                                error_stats = rca_metrics.get('error_stats', {})
-                                service_stats = rca_metrics.get('service_stats', {})
-                                request_patterns = rca_metrics.get('request_patterns', {})
-                                timeline_stats = rca_metrics.get('timeline_stats', {})
-                                errors_by_service = error_stats.get('errors_by_service', {})
-                                
-                                # Final Analysis Summary Chart
-                                st.markdown("#### 📈 Final Analysis - Service Impact Summary")
-                                final_summary_chart = create_rca_final_analysis_summary_chart(rca_metrics)
-                                if final_summary_chart:
-                                    st.plotly_chart(final_summary_chart, use_container_width=True, key="final_analysis_summary")
-                                
-                                # Final Analysis Summary Table
-                                total_errors = error_stats.get('total_errors', 0)
-                                total_events = timeline_stats.get('total_events', 0)
-                                services_analyzed = len(service_stats.get('service_summary', {}))
-                                success_rate = request_patterns.get('success_rate', 0)
-                                top_error_category = max(error_stats.get('errors_by_category', {}).items(), key=lambda x: x[1])[0] if error_stats.get('errors_by_category') else 'N/A'
-                                most_affected_service = max(errors_by_service.items(), key=lambda x: x[1])[0] if errors_by_service else 'N/A'
-                                
-                                # Calculate overall health score
-                                service_summary = service_stats.get('service_summary', {})
-                                total_health_score = 0
-                                healthy_services = 0
-                                for service, details in service_summary.items():
-                                    if isinstance(details, dict) and 'error' not in details:
-                                        error_rate = details.get('error_rate', 0)
-                                        health_score = max(0, 100 - (error_rate * 2))
-                                        total_health_score += health_score
-                                        if health_score >= 80:
-                                            healthy_services += 1
-                                
-                                avg_health_score = total_health_score / services_analyzed if services_analyzed > 0 else 0
-                                
-                                final_summary_data = [
-                                    {'Metric': 'Total Errors Detected', 'Value': total_errors, 'Category': 'Errors'},
-                                    {'Metric': 'Total Events Analyzed', 'Value': total_events, 'Category': 'Events'},
-                                    {'Metric': 'Services Analyzed', 'Value': services_analyzed, 'Category': 'Services'},
-                                    {'Metric': 'Overall Success Rate (%)', 'Value': f"{success_rate:.2f}%", 'Category': 'Performance'},
-                                    {'Metric': 'Average Service Health Score', 'Value': f"{avg_health_score:.1f}/100", 'Category': 'Health'},
-                                    {'Metric': 'Healthy Services', 'Value': f"{healthy_services}/{services_analyzed}", 'Category': 'Health'},
-                                    {'Metric': 'Top Error Category', 'Value': top_error_category, 'Category': 'Root Cause'},
-                                    {'Metric': 'Most Affected Service', 'Value': most_affected_service, 'Category': 'Root Cause'},
-                                    {'Metric': 'Critical Services', 'Value': services_analyzed - healthy_services, 'Category': 'Health'},
-                                    {'Metric': 'Overall Incident Severity', 'Value': 'Critical' if total_errors > 100 or success_rate < 50 else 'High' if total_errors > 50 or success_rate < 80 else 'Medium' if total_errors > 20 else 'Low', 'Category': 'Severity'}
-                                ]
-                                
-                                if final_summary_data:
-                                    final_summary_df = pd.DataFrame(final_summary_data)
-                                    st.dataframe(final_summary_df, use_container_width=True, hide_index=True)
-                                
-                                # Final Timeline Summary Chart
-                                st.markdown("---")
-                                st.markdown("#### ⏱️ Final Analysis - Incident Timeline Progression")
-                                final_timeline_chart = create_rca_final_timeline_summary_chart(rca_metrics)
-                                if final_timeline_chart:
-                                    st.plotly_chart(final_timeline_chart, use_container_width=True, key="final_timeline_summary")
-                                
-                                # Final Comprehensive Analysis Table
-                                st.markdown("---")
-                                st.markdown("#### 📋 Final Comprehensive Analysis Table")
-                                
-                                # Create comprehensive final analysis table
-                                comprehensive_analysis = []
-                                
-                                # Service-level final analysis
-                                for service, details in service_stats.get('service_summary', {}).items():
-                                    if isinstance(details, dict) and 'error' not in details:
-                                        errors = details.get('errors', 0)
-                                        error_rate = details.get('error_rate', 0)
-                                        total_entries = details.get('total_entries', 0)
-                                        service_errors = errors_by_service.get(service, 0)
-                                        perf = details.get('performance', {})
-                                        latency = perf.get('latency', {}) if perf else {}
-                                        
-                                        # Calculate final score
-                                        final_score = (error_rate * 0.3) + (service_errors * 0.25) + ((100 - (error_rate * 2)) * 0.25) + ((latency.get('avg', 0) / 10) * 0.2 if latency else 0)
-                                        
-                                        comprehensive_analysis.append({
-                                            'Service': service,
-                                            'Total Entries': total_entries,
-                                            'Total Errors': errors,
-                                            'Service Errors': service_errors,
-                                            'Error Rate (%)': round(error_rate, 2),
-                                            'Avg Latency (ms)': round(latency.get('avg', 0), 2) if latency else 'N/A',
-                                            'Health Score': round(max(0, 100 - (error_rate * 2)), 1),
-                                            'Final Impact Score': round(final_score, 1),
-                                            'Priority': 'P0 - Critical' if final_score > 50 else 'P1 - High' if final_score > 30 else 'P2 - Medium' if final_score > 15 else 'P3 - Low',
-                                            'Recommendation': 'Immediate Action Required' if final_score > 50 else 'High Priority Fix' if final_score > 30 else 'Monitor Closely' if final_score > 15 else 'Normal Operations'
-                                        })
-                                
-                                if comprehensive_analysis:
-                                    comprehensive_df = pd.DataFrame(comprehensive_analysis).sort_values('Final Impact Score', ascending=False)
-                                    st.dataframe(comprehensive_df, use_container_width=True, hide_index=True)
-            
-            # Download results (outside tabs, always visible)
-            
-            # Download results
-            if st.session_state.analysis_results:
-                st.markdown("---")
-                results_json = json.dumps(st.session_state.analysis_results, indent=2)
-                st.download_button(
-                    label="📥 Download Analysis Results (JSON)",
-                    data=results_json,
-                    file_name="rca_analysis_results.json",
-                    mime="application/json"
-                )
+        render_analysis_dashboard()
     
     # RCA Analysis Chatbot Section - Ask questions about the bundle
     if st.session_state.bundle_data:
@@ -5853,53 +5981,7 @@ def main():
         </div>
         """, unsafe_allow_html=True)
         
-        # Chat input
-        user_query = st.chat_input("Ask a question about your RCA bundle logs...")
-        
-        if user_query:
-            # Add user message to history
-            st.session_state.chat_history.append({
-                'user': user_query,
-                'assistant': ''
-            })
-            
-            # Process query
-            with st.spinner("🤔 Analyzing bundle logs..."):
-                answer = process_chat_query(
-                    st.session_state.bundle_data,
-                    user_query,
-                    st.session_state.chat_history[:-1]  # Exclude current message
-                )
-                
-                # Update last message with answer
-                st.session_state.chat_history[-1]['assistant'] = answer
-            
-            # Rerun to show new messages
-            st.rerun()
-        
-        # Display conversation history at the bottom
-        if st.session_state.chat_history:
-            st.markdown("---")
-            st.markdown("""
-            <div style="background: #FFFFFF; padding: 1.25rem; border-radius: 8px; margin: 1.5rem 0; 
-                        border: 1px solid #E5E7EB; box-shadow: 0 2px 4px -1px rgba(0, 0, 0, 0.1);">
-                <h3 style="color: #111827; font-family: 'Inter', sans-serif; font-weight: 600; 
-                          font-size: 1.125rem; margin: 0 0 1rem 0; display: flex; align-items: center; gap: 0.5rem;">
-                    💬 Conversation History
-                </h3>
-            </div>
-            """, unsafe_allow_html=True)
-            
-            # Display all messages in the conversation
-            for i, msg in enumerate(st.session_state.chat_history):
-                with st.chat_message("user"):
-                    st.write(msg['user'])
-                with st.chat_message("assistant"):
-                    st.markdown(msg['assistant'])
-            
-            # Add some spacing at the end
-            st.markdown("<br>", unsafe_allow_html=True)
-
+        render_chat_section()
 
 if __name__ == "__main__":
     main()
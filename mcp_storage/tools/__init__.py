@@ -3,14 +3,14 @@ Storage MCP Tools Package
 """
 
 from .capacity import get_disk_capacity
-from .iops import get_disk_iops
+from .iops import get_disk_iops, get_disk_iops_async
 from .latency import get_disk_latency
 from .rca import generate_storage_rca
 from .partitions import get_disk_partitions
 from .swap import get_swap_usage
 from .inodes import get_inode_usage
 from .process_io import get_top_io_processes
-from .disk_health import get_disk_health
+from .disk_health import get_disk_health, get_disk_health_async
 from .storage_trends import get_storage_trends
 from .cleanup_recommendations import get_cleanup_recommendations
 
@@ -26,6 +26,7 @@ from .kubernetes_health import get_cluster_health
 __all__ = [
     "get_disk_capacity",
     "get_disk_iops",
+    "get_disk_iops_async",
     "get_disk_latency",
     "generate_storage_rca",
     "get_disk_partitions",
@@ -33,6 +34,7 @@ __all__ = [
     "get_inode_usage",
     "get_top_io_processes",
     "get_disk_health",
+    "get_disk_health_async",
     "get_storage_trends",
     "get_cleanup_recommendations",
     # Kubernetes tools
@@ -0,0 +1,50 @@
+"""
+Disk Statistics Helper
+Read whole-disk I/O totals directly from /proc/diskstats (Linux).
+"""
+
+import os
+from functools import lru_cache
+from typing import NamedTuple, Optional
+
+
+class DiskTotals(NamedTuple):
+    """Cumulative I/O totals across whole disks (same field names as psutil's sdiskio)."""
+    read_count: int
+    write_count: int
+    read_time: int
+    write_time: int
+
+
+@lru_cache(maxsize=256)
+def _is_whole_disk(name: str) -> bool:
+    """Whether a diskstats device is a whole disk (listed in /sys/block) rather than a partition."""
+    return os.path.exists(f"/sys/block/{name.replace('/', '!')}")
+
+
+def read_disk_totals() -> Optional[DiskTotals]:
+    """
+    Sum read/write counts and times (ms) over whole disks from /proc/diskstats.
+    
+    Counts the same devices as psutil.disk_io_counters() without building a
+    per-device namedtuple for every row. Returns None where /proc/diskstats is
+    unavailable, so callers can fall back to psutil.
+    """
+    read_count = write_count = read_time = write_time = 0
+    found = False
+    try:
+        with open("/proc/diskstats") as f:
+            for line in f:
+                # major minor name reads merged sectors read_ms writes merged sectors write_ms ...
+                fields = line.split()
+                if len(fields) < 11 or not _is_whole_disk(fields[2]):
+                    continue
+                read_count += int(fields[3])
+                read_time += int(fields[6])
+                write_count += int(fields[7])
+                write_time += int(fields[10])
+                found = True
+    except (OSError, ValueError):
+        return None
+    
+    return DiskTotals(read_count, write_count, read_time, write_time) if found else None
@@ -0,0 +1,34 @@
+"""
+JSON Output Helper
+Serialize and parse tool results, using orjson when it is installed.
+"""
+
+import json
+import os
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Tool results are parsed by the app/MCP client, so they are compact by default;
+# set RCA_PRETTY=1 for 2-space indented output when reading them by hand
+PRETTY_OUTPUT = os.getenv("RCA_PRETTY") == "1"
+
+
+def dumps_result(obj) -> str:
+    """Serialize a tool result as JSON (orjson when available, stdlib json otherwise)."""
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if PRETTY_OUTPUT else 0)
+        return orjson.dumps(obj, option=option).decode()
+    if PRETTY_OUTPUT:
+        return json.dumps(obj, indent=2)
+    return json.dumps(obj, separators=(",", ":"))
+
+
+def loads_result(data):
+    """Parse a tool result JSON string (orjson when available, stdlib json otherwise)."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -0,0 +1,211 @@
+"""
+Kubernetes Client Helper
+Shared Kubernetes API clients and helpers for the Kubernetes tools.
+"""
+
+import os
+import socket
+import threading
+import time
+from functools import wraps
+
+# urllib3 keeps only 4 connections per pool by default; concurrent tool calls
+# (list_pods, list_nodes, get_resource_usage, ...) would otherwise discard and
+# re-handshake connections
+CONNECTION_POOL_MAXSIZE = 32
+
+# resourceVersion="0" lets the apiserver answer list calls from its watch cache
+# instead of a quorum read from etcd; a snapshot that is a moment old is fine here
+WATCH_CACHE_RESOURCE_VERSION = "0"
+
+# Objects fetched per apiserver list call when paging through large listings
+LIST_PAGE_SIZE = 500
+
+# Namespace/node listings are effectively static over a few seconds, so repeat tool
+# calls within this window reuse the previous result; RCA_K8S_LIST_TTL=0 disables it
+LISTING_CACHE_TTL_SEC = float(os.getenv("RCA_K8S_LIST_TTL", "30"))
+
+# Pod phases, readiness and restart counts move quickly during an incident, so pod
+# listings are only reused briefly; RCA_K8S_POD_LIST_TTL=0 disables it
+POD_LISTING_CACHE_TTL_SEC = float(os.getenv("RCA_K8S_POD_LIST_TTL", "5"))
+
+# Probe idle pooled connections so ones silently dropped by a load balancer are
+# detected and replaced instead of stalling the next call until its read timeout
+_KEEPALIVE_SOCKET_OPTIONS = [(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)] + [
+    (socket.IPPROTO_TCP, getattr(socket, name), value)
+    for name, value in (("TCP_KEEPIDLE", 60), ("TCP_KEEPINTVL", 20), ("TCP_KEEPCNT", 3))
+    if hasattr(socket, name)
+]
+
+
+def _process_singleton(build):
+    """Memoize a zero-argument builder with double-checked locking (failures are not cached)."""
+    instance = None
+    lock = threading.Lock()
+    
+    @wraps(build)
+    def get():
+        nonlocal instance
+        if instance is None:
+            # Concurrent first callers wait here instead of each loading the kubeconfig
+            with lock:
+                if instance is None:
+                    instance = build()
+        return instance
+    
+    return get
+
+
+@_process_singleton
+def get_k8s_client():
+    """
+    Get the process-wide Kubernetes CoreV1Api client, handling import errors gracefully.
+    
+    The kubeconfig is loaded once and the client (with its urllib3 connection pool) is
+    reused by every tool call. Failures are not cached, so a later call retries.
+    """
+    try:
+        from kubernetes import client
+        return client.CoreV1Api(_get_api_client())
+    except ImportError:
+        raise ImportError("kubernetes library not installed. Run: pip install kubernetes")
+    except Exception as e:
+        raise Exception(f"Failed to load Kubernetes config: {str(e)}")
+
+
+@_process_singleton
+def get_custom_objects_api():
+    """Get the process-wide Kubernetes CustomObjectsApi client (used for metrics-server)."""
+    try:
+        from kubernetes import client
+        return client.CustomObjectsApi(_get_api_client())
+    except ImportError:
+        raise ImportError("kubernetes library not installed. Run: pip install kubernetes")
+    except Exception as e:
+        raise Exception(f"Failed to load Kubernetes config: {str(e)}")
+
+
+@_process_singleton
+def _get_api_client():
+    """Get the ApiClient (one connection pool) shared by every API group, with TCP keep-alive enabled."""
+    from kubernetes import client
+    from urllib3.connection import HTTPConnection
+    api_client = client.ApiClient(_load_config())
+    # Replacing socket_options drops urllib3's defaults (TCP_NODELAY), so keep them
+    pool_kw = api_client.rest_client.pool_manager.connection_pool_kw
+    pool_kw["socket_options"] = (
+        list(pool_kw.get("socket_options") or HTTPConnection.default_socket_options)
+        + _KEEPALIVE_SOCKET_OPTIONS
+    )
+    return api_client
+
+
+@_process_singleton
+def _load_config():
+    """Load the in-cluster config, falling back to the local kubeconfig (once per process)."""
+    from kubernetes import client, config
+    configuration = client.Configuration()
+    try:
+        config.load_incluster_config(client_configuration=configuration)
+    except:
+        config.load_kube_config(client_configuration=configuration)
+    configuration.connection_pool_maxsize = CONNECTION_POOL_MAXSIZE
+    return configuration
+
+
+def ttl_cached_listing(ttl_sec):
+    """
+    Cache a listing builder's result dict per arguments for ttl_sec seconds.
+    
+    Error results are not cached, and ttl_sec <= 0 disables caching. Cached dicts are
+    shared between callers and must not be mutated.
+    """
+    def decorator(build):
+        cache = {}
+        
+        @wraps(build)
+        def wrapper(*args, **kwargs):
+            if ttl_sec <= 0:
+                return build(*args, **kwargs)
+            key = (args, tuple(sorted(kwargs.items())))
+            now = time.monotonic()
+            cached = cache.get(key)
+            if cached and now - cached[0] < ttl_sec:
+                return cached[1]
+            
+            result = build(*args, **kwargs)
+            if 'error' not in result:
+                cache[key] = (now, result)
+            return result
+        
+        return wrapper
+    
+    return decorator
+
+
+def single_flight(func):
+    """Let concurrent calls with the same arguments share one in-flight call's result."""
+    lock = threading.Lock()
+    # key -> [done event, result, exception] of the call currently running for those arguments
+    in_flight = {}
+    
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        key = (args, tuple(sorted(kwargs.items())))
+        with lock:
+            call = in_flight.get(key)
+            is_leader = call is None
+            if is_leader:
+                call = in_flight[key] = [threading.Event(), None, None]
+        
+        if is_leader:
+            try:
+                call[1] = func(*args, **kwargs)
+            except BaseException as e:
+                call[2] = e
+            finally:
+                with lock:
+                    del in_flight[key]
+                call[0].set()
+        else:
+            call[0].wait()
+        
+        if call[2] is not None:
+            raise call[2]
+        return call[1]
+    
+    return wrapper
+
+
+def iter_list_items(list_func, **list_kwargs):
+    """
+    Yield the items of a Kubernetes list call, fetching one server-side page at a time.
+    
+    Only one page of deserialized objects is held at a time. The continue token pins later
+    pages to the first page's snapshot, so resource_version is only sent with the first call.
+    """
+    list_kwargs.setdefault("limit", LIST_PAGE_SIZE)
+    while True:
+        page = list_func(**list_kwargs)
+        yield from page.items
+        
+        continue_token = page.metadata._continue if page.metadata else None
+        if not continue_token:
+            return
+        list_kwargs.pop("resource_version", None)
+        list_kwargs["_continue"] = continue_token
+
+
+def format_age(timestamp, now) -> str:
+    """Format the age of a timestamp relative to now like kubectl (e.g. '3d4h', '2h15m', '7m'; '' if unset)."""
+    if not timestamp:
+        return ""
+    age_delta = now - timestamp
+    days = age_delta.days
+    hours, remainder = divmod(age_delta.seconds, 3600)
+    minutes, _ = divmod(remainder, 60)
+    if days > 0:
+        return f"{days}d{hours}h"
+    if hours > 0:
+        return f"{hours}h{minutes}m"
+    return f"{minutes}m"
@@ -3,9 +3,17 @@ Disk Capacity Tool
 Measures disk capacity, usage, and free space for a given mount point.
 """
 
-import json
+import bisect
 import psutil
 
+from ._jsonio import dumps_result
+
+BYTES_PER_GB = 1 << 30
+
+# used_percent thresholds for WARNING and CRITICAL (inclusive)
+_USED_PERCENT_THRESHOLDS = (70, 85)
+_STATUS_LEVELS = ("OK", "WARNING", "CRITICAL")
+
 
 def get_disk_capacity(mount_point: str = "/") -> str:
     """
@@ -34,18 +42,13 @@ def get_disk_capacity(mount_point: str = "/") -> str:
         disk_usage = psutil.disk_usage(mount_point)
         
         # Convert bytes to GB
-        total_gb = disk_usage.total / (1024 ** 3)
-        used_gb = disk_usage.used / (1024 ** 3)
-        free_gb = disk_usage.free / (1024 ** 3)
+        total_gb = disk_usage.total / BYTES_PER_GB
+        used_gb = disk_usage.used / BYTES_PER_GB
+        free_gb = disk_usage.free / BYTES_PER_GB
         used_percent = disk_usage.percent
         
-        # Determine status
-        if used_percent >= 85:
-            status = "CRITICAL"
-        elif used_percent >= 70:
-            status = "WARNING"
-        else:
-            status = "OK"
+        # Determine status (WARNING at >= 70%, CRITICAL at >= 85%)
+        status = _STATUS_LEVELS[bisect.bisect_right(_USED_PERCENT_THRESHOLDS, used_percent)]
         
         # Build result
         result = {
@@ -58,7 +61,7 @@ def get_disk_capacity(mount_point: str = "/") -> str:
             "message": f"Disk usage at {mount_point}: {used_percent:.2f}% ({used_gb:.2f} GB used of {total_gb:.2f} GB total)"
         }
         
-        return json.dumps(result, indent=2)
+        return dumps_result(result)
     
     except PermissionError:
         error_result = {
@@ -66,7 +69,7 @@ def get_disk_capacity(mount_point: str = "/") -> str:
             "mount_point": mount_point,
             "message": f"Cannot access mount point: {mount_point}. Insufficient permissions."
         }
-        return json.dumps(error_result, indent=2)
+        return dumps_result(error_result)
     
     except Exception as e:
         error_result = {
@@ -74,4 +77,4 @@ def get_disk_capacity(mount_point: str = "/") -> str:
             "mount_point": mount_point,
             "message": f"Failed to get disk capacity for {mount_point}: {str(e)}"
         }
-        return json.dumps(error_result, indent=2)
+        return dumps_result(error_result)
@@ -3,10 +3,99 @@ Storage Cleanup Recommendations Tool
 Analyze storage and provide cleanup recommendations.
 """
 
-import json
 import os
 import psutil
+import time
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+from ._jsonio import dumps_result
+
+BYTES_PER_GB = 1 << 30
+
+# Common cleanup targets, with "~" expanded once at import
+CLEANUP_TARGETS = tuple(
+    (os.path.expanduser(target_path), description)
+    for target_path, description in (
+        ("/tmp", "Temporary files"),
+        ("/var/log", "Log files"),
+        ("/var/cache", "Cache files"),
+        ("~/.cache", "User cache"),
+        ("~/.local/share/Trash", "Trash files"),
+    )
+)
+
+# Static recommendation, built once and serialized as-is
+REMOVE_UNUSED_APPS_RECOMMENDATION = {
+    "action": "Review and remove unused applications",
+    "reason": "Free up space by removing unused software",
+    "impact": "MEDIUM"
+}
+
+# Seconds a cached target scan stays valid. A directory's mtime only changes when entries are
+# added or removed, not when existing files grow (e.g. appended logs), so mtime alone is not
+# enough to validate a cached size.
+SCAN_CACHE_TTL_SEC = 60.0
+
+# (path, analyze_depth) -> (scanned_at, directory mtime, total_size, file_count)
+_SCAN_CACHE: Dict[Tuple[str, int], Tuple[float, float, int, int]] = {}
+
+
+def _scan_directory(path: str, depth: int, max_depth: int) -> Tuple[int, int]:
+    """Return (total_size, file_count) for files under path, descending up to max_depth levels."""
+    total_size = 0
+    file_count = 0
+    subdirectories = []
+    
+    with os.scandir(path) as entries:
+        for entry in entries:
+            # DirEntry caches the file type and lstat result, so no extra path joins or getsize calls.
+            # Type checks come from the directory listing and don't raise, so only the stat is guarded.
+            if entry.is_file(follow_symlinks=False):
+                try:
+                    total_size += entry.stat(follow_symlinks=False).st_size
+                except OSError:
+                    continue
+                file_count += 1
+            elif depth < max_depth and entry.is_dir(follow_symlinks=False):
+                subdirectories.append(entry.path)
+    
+    # Descend after the listing is closed; one try per directory covers unreadable subtrees
+    for subdirectory in subdirectories:
+        try:
+            sub_size, sub_count = _scan_directory(subdirectory, depth + 1, max_depth)
+        except OSError:
+            continue
+        total_size += sub_size
+        file_count += sub_count
+    
+    return total_size, file_count
+
+
+def _scan_target(full_path: str, analyze_depth: int) -> Optional[Tuple[int, int]]:
+    """
+    Return (total_size, file_count) for a cleanup target, or None if missing or unreadable.
+    
+    Results are reused while the target's mtime is unchanged and the entry is younger
+    than SCAN_CACHE_TTL_SEC, so repeated polls skip the walk.
+    """
+    try:
+        mtime = os.stat(full_path).st_mtime
+        now = time.monotonic()
+        
+        cache_key = (full_path, analyze_depth)
+        cached = _SCAN_CACHE.get(cache_key)
+        if cached and cached[1] == mtime and now - cached[0] < SCAN_CACHE_TTL_SEC:
+            return cached[2], cached[3]
+        
+        total_size, file_count = _scan_directory(full_path, 0, analyze_depth)
+    except (PermissionError, OSError):  # Includes FileNotFoundError for absent targets
+        return None
+    
+    _SCAN_CACHE[cache_key] = (now, mtime, total_size, file_count)
+    return total_size, file_count
 
 
 def get_cleanup_recommendations(mount_point: str = "/", analyze_depth: int = 2) -> str:
@@ -35,54 +124,34 @@ def get_cleanup_recommendations(mount_point: str = "/", analyze_depth: int = 2)
     try:
         disk_usage = psutil.disk_usage(mount_point)
         used_percent = disk_usage.percent
-        free_gb = disk_usage.free / (1024 ** 3)
+        free_gb = disk_usage.free / BYTES_PER_GB
         
         recommendations = []
         large_directories = []
         estimated_savings = 0.0
         
-        # Common cleanup targets
-        cleanup_targets = [
-            ("/tmp", "Temporary files"),
-            ("/var/log", "Log files"),
-            ("/var/cache", "Cache files"),
-            ("~/.cache", "User cache"),
-            ("~/.local/share/Trash", "Trash files"),
-        ]
+        # Check common locations concurrently; the walks are syscall-bound and release the GIL.
+        # map() keeps results in target order so the report stays deterministic.
+        with ThreadPoolExecutor(max_workers=len(CLEANUP_TARGETS)) as executor:
+            scans = list(executor.map(
+                lambda target: _scan_target(target[0], analyze_depth),
+                CLEANUP_TARGETS
+            ))
         
-        # Check common locations
-        for target_path, description in cleanup_targets:
-            full_path = os.path.expanduser(target_path)
-            if os.path.exists(full_path):
-                try:
-                    total_size = 0
-                    file_count = 0
-                    
-                    for root, dirs, files in os.walk(full_path):
-                        for file in files:
-                            try:
-                                file_path = os.path.join(root, file)
-                                size = os.path.getsize(file_path)
-                                total_size += size
-                                file_count += 1
-                            except (OSError, PermissionError):
-                                continue
-                        
-                        # Limit depth
-                        if root.count(os.sep) - full_path.count(os.sep) >= analyze_depth:
-                            dirs[:] = []
-                    
-                    size_gb = total_size / (1024 ** 3)
-                    if size_gb > 0.1:  # Only report if > 100MB
-                        large_directories.append({
-                            "path": full_path,
-                            "size_gb": round(size_gb, 2),
-                            "file_count": file_count,
-                            "description": description
-                        })
-                        estimated_savings += size_gb * 0.5  # Assume 50% can be cleaned
-                except (PermissionError, OSError):
-                    continue
+        for (full_path, description), scan in zip(CLEANUP_TARGETS, scans):
+            if scan is None:
+                continue
+            total_size, file_count = scan
+            
+            size_gb = total_size / BYTES_PER_GB
+            if size_gb > 0.1:  # Only report if > 100MB
+                large_directories.append({
+                    "path": full_path,
+                    "size_gb": round(size_gb, 2),
+                    "file_count": file_count,
+                    "description": description
+                })
+                estimated_savings += size_gb * 0.5  # Assume 50% can be cleaned
         
         # Generate recommendations based on usage
         if used_percent >= 85:
@@ -103,22 +172,19 @@ def get_cleanup_recommendations(mount_point: str = "/", analyze_depth: int = 2)
             priority = "MEDIUM" if used_percent >= 50 else "LOW"
         
         # Add specific recommendations
-        if large_directories:
-            for dir_info in large_directories[:5]:  # Top 5
-                recommendations.append({
-                    "action": f"Clean {dir_info['description']}",
-                    "path": dir_info["path"],
-                    "potential_savings_gb": round(dir_info["size_gb"] * 0.5, 2),
-                    "impact": "MEDIUM"
-                })
+        recommendations.extend(
+            {
+                "action": f"Clean {dir_info['description']}",
+                "path": dir_info["path"],
+                "potential_savings_gb": round(dir_info["size_gb"] * 0.5, 2),
+                "impact": "MEDIUM"
+            }
+            for dir_info in islice(large_directories, 5)  # Top 5
+        )
         
         # General recommendations
         if used_percent > 50:
-            recommendations.append({
-                "action": "Review and remove unused applications",
-                "reason": "Free up space by removing unused software",
-                "impact": "MEDIUM"
-            })
+            recommendations.append(REMOVE_UNUSED_APPS_RECOMMENDATION)
         
         if free_gb < 10:
             recommendations.append({
@@ -141,7 +207,7 @@ def get_cleanup_recommendations(mount_point: str = "/", analyze_depth: int = 2)
             "message": f"Cleanup priority: {priority}. Estimated savings: {estimated_savings:.2f} GB"
         }
         
-        return json.dumps(result, indent=2)
+        return dumps_result(result)
     
     except Exception as e:
         error_result = {
@@ -149,4 +215,4 @@ def get_cleanup_recommendations(mount_point: str = "/", analyze_depth: int = 2)
             "mount_point": mount_point,
             "message": f"Failed to generate cleanup recommendations for {mount_point}: {str(e)}"
         }
-        return json.dumps(error_result, indent=2)
+        return dumps_result(error_result)
@@ -3,81 +3,120 @@ Disk Health Tool
 Get disk health and performance metrics.
 """
 
-import json
+import asyncio
+import os
 import psutil
-import time
+from functools import lru_cache
+from typing import Optional, Tuple
 
+from ._jsonio import dumps_result
 
-def get_disk_health(mount_point: str = "/", test_duration: float = 1.0) -> str:
-    """
-    Get comprehensive disk health metrics including I/O wait times and performance.
+BYTES_PER_MB = 1 << 20
+
+
+def _read_cpu_times() -> Optional[Tuple[float, ...]]:
+    """Return (user, nice, system, idle, iowait) CPU times, or None if iowait is not reported."""
+    try:
+        # First line of /proc/stat: "cpu user nice system idle iowait irq softirq ..."
+        with open("/proc/stat") as f:
+            fields = f.readline().split()[1:6]
+        if len(fields) == 5:
+            return tuple(float(value) for value in fields)
+    except (OSError, ValueError):
+        pass
     
-    Args:
-        mount_point: Mount point to check (default: "/")
-        test_duration: Duration for performance test in seconds (default: 1.0)
+    cpu = psutil.cpu_times()
+    if not hasattr(cpu, "iowait"):
+        return None  # Not available on all systems
+    return (cpu.user, cpu.nice, cpu.system, cpu.idle, cpu.iowait)
+
+
+@lru_cache(maxsize=32)
+def _resolve_block_device(mount_point: str) -> Optional[str]:
+    """Map a mount point to its block device name (e.g. "sda1") via /proc/mounts, or None."""
+    try:
+        with open("/proc/mounts") as f:
+            mounts = [line.split() for line in f]
+    except OSError:
+        return None
     
-    Returns:
-        JSON string containing:
-        - mount_point: Mount point checked
-        - io_wait_percent: CPU I/O wait percentage
-        - disk_utilization_percent: Disk utilization percentage
-        - avg_queue_length: Average I/O queue length
-        - read_speed_mbps: Average read speed in MB/s
-        - write_speed_mbps: Average write speed in MB/s
-        - status: Overall health status
-        - health_score: Health score (0-100)
+    device = None
+    for fields in mounts:
+        if len(fields) >= 2 and fields[1] == mount_point:
+            device = fields[0]  # Last entry wins for stacked mounts
     
-    Example:
-        >>> result = get_disk_health("/", 1.0)
-        >>> data = json.loads(result)
-        >>> print(data["health_score"])
-        85
+    if not device or not device.startswith("/dev/"):
+        return None  # Virtual filesystems (overlay, tmpfs, ...) have no block device
+    
+    # Resolve /dev/mapper/* and /dev/disk/by-* symlinks to the kernel name (dm-0, sda1, ...)
+    name = os.path.basename(os.path.realpath(device))
+    return name if os.path.exists(f"/sys/class/block/{name}/stat") else None
+
+
+def _read_io_bytes(device: Optional[str]) -> Optional[Tuple[int, int]]:
+    """Return cumulative (read_bytes, write_bytes) for a block device, or for all disks via psutil."""
+    if device:
+        try:
+            # Fields 3 and 7 of the stat file are sectors read/written, always in 512-byte units
+            with open(f"/sys/class/block/{device}/stat") as f:
+                fields = f.read().split()
+            return int(fields[2]) * 512, int(fields[6]) * 512
+        except (OSError, ValueError, IndexError):
+            pass
+    
+    io = psutil.disk_io_counters(perdisk=False, nowrap=False)
+    if io is None:
+        return None
+    return io.read_bytes, io.write_bytes
+
+
+async def get_disk_health_async(mount_point: str = "/", test_duration: float = 1.0, include_iowait: bool = True) -> str:
+    """
+    Async variant of get_disk_health.
+    
+    Awaits the test duration instead of blocking, so callers can run it
+    alongside other interval-based measurements with asyncio.gather.
     """
     try:
-        # Get initial I/O counters
-        initial_io = psutil.disk_io_counters()
-        initial_cpu = psutil.cpu_times()
+        # Get initial I/O counters for the device backing mount_point (all disks if it has none);
+        # CPU times are read straight from /proc/stat when possible
+        device = _resolve_block_device(mount_point)
+        initial_io = _read_io_bytes(device)
+        initial_cpu = _read_cpu_times() if include_iowait else None
         
         if initial_io is None:
             error_result = {
                 "error": "No disk I/O counters available",
                 "message": "System does not provide disk I/O statistics"
             }
-            return json.dumps(error_result, indent=2)
+            return dumps_result(error_result)
         
         # Wait for test duration
-        time.sleep(test_duration)
+        await asyncio.sleep(test_duration)
         
         # Get final counters
-        final_io = psutil.disk_io_counters()
-        final_cpu = psutil.cpu_times()
+        final_io = _read_io_bytes(device)
+        final_cpu = _read_cpu_times() if include_iowait else None
         
         if final_io is None:
             error_result = {
                 "error": "No disk I/O counters available after test",
                 "message": "System does not provide disk I/O statistics"
             }
-            return json.dumps(error_result, indent=2)
+            return dumps_result(error_result)
         
         # Calculate I/O metrics
-        read_bytes = (final_io.read_bytes - initial_io.read_bytes) / test_duration
-        write_bytes = (final_io.write_bytes - initial_io.write_bytes) / test_duration
-        read_speed_mbps = (read_bytes / (1024 ** 2))
-        write_speed_mbps = (write_bytes / (1024 ** 2))
+        read_bytes = (final_io[0] - initial_io[0]) / test_duration
+        write_bytes = (final_io[1] - initial_io[1]) / test_duration
+        read_speed_mbps = read_bytes / BYTES_PER_MB
+        write_speed_mbps = write_bytes / BYTES_PER_MB
         
         # Calculate I/O wait (if available)
-        try:
-            io_wait = final_cpu.iowait - initial_cpu.iowait
-            total_time = sum([
-                final_cpu.user - initial_cpu.user,
-                final_cpu.nice - initial_cpu.nice,
-                final_cpu.system - initial_cpu.system,
-                final_cpu.idle - initial_cpu.idle,
-                io_wait
-            ])
-            io_wait_percent = (io_wait / total_time * 100) if total_time > 0 else 0
-        except AttributeError:
-            io_wait_percent = None  # Not available on all systems
+        io_wait_percent = None
+        if initial_cpu and final_cpu:
+            deltas = [final - initial for initial, final in zip(initial_cpu, final_cpu)]
+            total_time = sum(deltas)
+            io_wait_percent = (deltas[4] / total_time * 100) if total_time > 0 else 0
         
         # Get disk usage
         disk_usage = psutil.disk_usage(mount_point)
@@ -108,6 +147,7 @@ def get_disk_health(mount_point: str = "/", test_duration: float = 1.0) -> str:
         
         result = {
             "mount_point": mount_point,
+            "device": device if device else "all",
             "io_wait_percent": round(io_wait_percent, 2) if io_wait_percent is not None else None,
             "disk_utilization_percent": round(disk_utilization_percent, 2),
             "read_speed_mbps": round(read_speed_mbps, 2),
@@ -118,7 +158,7 @@ def get_disk_health(mount_point: str = "/", test_duration: float = 1.0) -> str:
             "message": f"Disk health: {status} (Score: {health_score}/100)"
         }
         
-        return json.dumps(result, indent=2)
+        return dumps_result(result)
     
     except Exception as e:
         error_result = {
@@ -126,4 +166,35 @@ def get_disk_health(mount_point: str = "/", test_duration: float = 1.0) -> str:
             "mount_point": mount_point,
             "message": f"Failed to get disk health for {mount_point}: {str(e)}"
         }
-        return json.dumps(error_result, indent=2)
+        return dumps_result(error_result)
+
+
+def get_disk_health(mount_point: str = "/", test_duration: float = 1.0, include_iowait: bool = True) -> str:
+    """
+    Get comprehensive disk health metrics including I/O wait times and performance.
+    
+    Args:
+        mount_point: Mount point to check (default: "/")
+        test_duration: Duration for performance test in seconds (default: 1.0)
+        include_iowait: Sample CPU times for io_wait_percent (default: True); when False,
+            io_wait_percent is None and the health score ignores I/O wait
+    
+    Returns:
+        JSON string containing:
+        - mount_point: Mount point checked
+        - device: Block device measured ("all" when the mount has no backing device)
+        - io_wait_percent: CPU I/O wait percentage
+        - disk_utilization_percent: Disk utilization percentage
+        - avg_queue_length: Average I/O queue length
+        - read_speed_mbps: Average read speed in MB/s
+        - write_speed_mbps: Average write speed in MB/s
+        - status: Overall health status
+        - health_score: Health score (0-100)
+    
+    Example:
+        >>> result = get_disk_health("/", 1.0)
+        >>> data = json.loads(result)
+        >>> print(data["health_score"])
+        85
+    """
+    return asyncio.run(get_disk_health_async(mount_point, test_duration, include_iowait))
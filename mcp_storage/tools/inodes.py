@@ -3,9 +3,30 @@ Inode Usage Tool
 Monitor inode usage for file systems (Unix/Linux).
 """
 
-import json
 import os
 import stat
+import time
+from typing import Dict, Tuple
+
+from ._jsonio import dumps_result
+
+# Inode counts change slowly, so a statvfs result is reused for this many seconds per mount point
+INODE_CACHE_TTL_SEC = 5.0
+
+# mount_point -> (sampled_at, total_inodes, free_inodes)
+_INODE_CACHE: Dict[str, Tuple[float, int, int]] = {}
+
+
+def _inode_counts(mount_point: str) -> Tuple[int, int]:
+    """Return (total_inodes, free_inodes) for a mount point, cached for INODE_CACHE_TTL_SEC."""
+    now = time.monotonic()
+    cached = _INODE_CACHE.get(mount_point)
+    if cached and now - cached[0] < INODE_CACHE_TTL_SEC:
+        return cached[1], cached[2]
+    
+    statvfs = os.statvfs(mount_point)
+    _INODE_CACHE[mount_point] = (now, statvfs.f_files, statvfs.f_ffree)
+    return statvfs.f_files, statvfs.f_ffree
 
 
 def get_inode_usage(mount_point: str = "/") -> str:
@@ -31,11 +52,8 @@ def get_inode_usage(mount_point: str = "/") -> str:
         45.2
     """
     try:
-        statvfs = os.statvfs(mount_point)
-        
         # Calculate inode statistics
-        total_inodes = statvfs.f_files
-        free_inodes = statvfs.f_ffree
+        total_inodes, free_inodes = _inode_counts(mount_point)
         used_inodes = total_inodes - free_inodes
         
         if total_inodes > 0:
@@ -61,7 +79,7 @@ def get_inode_usage(mount_point: str = "/") -> str:
             "message": f"Inode usage at {mount_point}: {used_percent:.2f}% ({used_inodes} used of {total_inodes} total)"
         }
         
-        return json.dumps(result, indent=2)
+        return dumps_result(result)
     
     except AttributeError:
         # Windows doesn't support statvfs
@@ -70,7 +88,7 @@ def get_inode_usage(mount_point: str = "/") -> str:
             "mount_point": mount_point,
             "message": "Inode statistics are not available on Windows systems"
         }
-        return json.dumps(error_result, indent=2)
+        return dumps_result(error_result)
     
     except Exception as e:
         error_result = {
@@ -78,4 +96,4 @@ def get_inode_usage(mount_point: str = "/") -> str:
             "mount_point": mount_point,
             "message": f"Failed to get inode usage for {mount_point}: {str(e)}"
         }
-        return json.dumps(error_result, indent=2)
+        return dumps_result(error_result)
@@ -3,57 +3,43 @@ Disk IOPS Tool
 Measures Input/Output Operations Per Second (IOPS) for disk I/O.
 """
 
-import json
-import time
+import asyncio
 import psutil
 
+from ._jsonio import dumps_result
 
-def get_disk_iops(interval_sec: float = 1.0) -> str:
+
+async def get_disk_iops_async(interval_sec: float = 1.0) -> str:
     """
-    Get disk IOPS metrics by measuring I/O operations over a time interval.
-    
-    Args:
-        interval_sec: Measurement interval in seconds (default: 1.0)
+    Async variant of get_disk_iops.
     
-    Returns:
-        JSON string containing:
-        - read_iops: Read operations per second
-        - write_iops: Write operations per second
-        - total_iops: Total operations per second
-        - read_count: Total read operations in interval
-        - write_count: Total write operations in interval
-        - interval_sec: Measurement interval used
-        - status: "OK" or "DEGRADED" (DEGRADED if total_iops < 100)
-    
-    Example:
-        >>> result = get_disk_iops(1.0)
-        >>> data = json.loads(result)
-        >>> print(data["total_iops"])
-        150.5
+    Awaits the measurement interval instead of blocking, so callers can run it
+    alongside other interval-based measurements with asyncio.gather.
     """
     try:
-        # Get initial I/O counters
-        initial_io = psutil.disk_io_counters()
+        # Get initial I/O counters (nowrap=False skips psutil's wraparound bookkeeping;
+        # a single interval is far shorter than a counter wrap)
+        initial_io = psutil.disk_io_counters(perdisk=False, nowrap=False)
         
         if initial_io is None:
             error_result = {
                 "error": "No disk I/O counters available",
                 "message": "System does not provide disk I/O statistics"
             }
-            return json.dumps(error_result, indent=2)
+            return dumps_result(error_result)
         
         # Wait for the specified interval
-        time.sleep(interval_sec)
+        await asyncio.sleep(interval_sec)
         
         # Get final I/O counters
-        final_io = psutil.disk_io_counters()
+        final_io = psutil.disk_io_counters(perdisk=False, nowrap=False)
         
         if final_io is None:
             error_result = {
                 "error": "No disk I/O counters available after interval",
                 "message": "System does not provide disk I/O statistics"
             }
-            return json.dumps(error_result, indent=2)
+            return dumps_result(error_result)
         
         # Calculate differences
         read_count = final_io.read_count - initial_io.read_count
@@ -83,11 +69,37 @@ def get_disk_iops(interval_sec: float = 1.0) -> str:
             "message": f"IOPS: {total_iops:.2f} total ({read_iops:.2f} read, {write_iops:.2f} write) over {interval_sec}s"
         }
         
-        return json.dumps(result, indent=2)
+        return dumps_result(result)
     
     except Exception as e:
         error_result = {
             "error": str(e),
             "message": f"Failed to get disk IOPS: {str(e)}"
         }
-        return json.dumps(error_result, indent=2)
+        return dumps_result(error_result)
+
+
+def get_disk_iops(interval_sec: float = 1.0) -> str:
+    """
+    Get disk IOPS metrics by measuring I/O operations over a time interval.
+    
+    Args:
+        interval_sec: Measurement interval in seconds (default: 1.0)
+    
+    Returns:
+        JSON string containing:
+        - read_iops: Read operations per second
+        - write_iops: Write operations per second
+        - total_iops: Total operations per second
+        - read_count: Total read operations in interval
+        - write_count: Total write operations in interval
+        - interval_sec: Measurement interval used
+        - status: "OK" or "DEGRADED" (DEGRADED if total_iops < 100)
+    
+    Example:
+        >>> result = get_disk_iops(1.0)
+        >>> data = json.loads(result)
+        >>> print(data["total_iops"])
+        150.5
+    """
+    return asyncio.run(get_disk_iops_async(interval_sec))
@@ -3,23 +3,15 @@ Kubernetes Events Tool
 Get Kubernetes events.
 """
 
-import json
+import heapq
+from datetime import datetime, timezone
 from typing import Optional
 
+from ._jsonio import dumps_result
+from ._k8s_client import format_age, get_k8s_client, iter_list_items
 
-def _get_k8s_client():
-    """Get Kubernetes client, handling import errors gracefully."""
-    try:
-        from kubernetes import client, config
-        try:
-            config.load_incluster_config()
-        except:
-            config.load_kube_config()
-        return client.CoreV1Api()
-    except ImportError:
-        raise ImportError("kubernetes library not installed. Run: pip install kubernetes")
-    except Exception as e:
-        raise Exception(f"Failed to load Kubernetes config: {str(e)}")
+# Sort key stand-in for events that carry no first_timestamp
+_MISSING_TIMESTAMP = datetime.min.replace(tzinfo=timezone.utc)
 
 
 def get_events(namespace: Optional[str] = None, limit: int = 50) -> str:
@@ -36,29 +28,26 @@ def get_events(namespace: Optional[str] = None, limit: int = 50) -> str:
         - total_count: Total number of events
     """
     try:
-        v1 = _get_k8s_client()
+        v1 = get_k8s_client()
         
+        # Page through the events server-side and keep only the `limit` most recent,
+        # newest first (O(N log limit); events without a timestamp rank last). Only one
+        # page of deserialized events is held at a time.
         if namespace:
-            events = v1.list_namespaced_event(namespace=namespace)
+            events = iter_list_items(v1.list_namespaced_event, namespace=namespace)
         else:
-            events = v1.list_event_for_all_namespaces()
+            events = iter_list_items(v1.list_event_for_all_namespaces)
+        recent_events = heapq.nlargest(
+            limit,
+            events,
+            key=lambda event: event.first_timestamp or _MISSING_TIMESTAMP
+        )
         
+        now = datetime.now(timezone.utc)
         event_list = []
-        for event in events.items[:limit]:
+        for event in recent_events:
             # Calculate age
-            age = ""
-            if event.first_timestamp:
-                from datetime import datetime, timezone
-                age_delta = datetime.now(timezone.utc) - event.first_timestamp
-                days = age_delta.days
-                hours, remainder = divmod(age_delta.seconds, 3600)
-                minutes, _ = divmod(remainder, 60)
-                if days > 0:
-                    age = f"{days}d{hours}h"
-                elif hours > 0:
-                    age = f"{hours}h{minutes}m"
-                else:
-                    age = f"{minutes}m"
+            age = format_age(event.first_timestamp, now)
             
             event_info = {
                 "name": event.metadata.name,
@@ -77,9 +66,6 @@ def get_events(namespace: Optional[str] = None, limit: int = 50) -> str:
             }
             event_list.append(event_info)
         
-        # Sort by most recent first
-        event_list.sort(key=lambda x: x["first_seen"], reverse=True)
-        
         result = {
             "events": event_list,
             "total_count": len(event_list),
@@ -87,11 +73,11 @@ def get_events(namespace: Optional[str] = None, limit: int = 50) -> str:
             "message": f"Found {len(event_list)} event(s)"
         }
         
-        return json.dumps(result, indent=2)
+        return dumps_result(result)
     
     except Exception as e:
         error_result = {
             "error": str(e),
             "message": f"Failed to get events: {str(e)}"
         }
-        return json.dumps(error_result, indent=2)
+        return dumps_result(error_result)
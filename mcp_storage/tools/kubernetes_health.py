@@ -3,22 +3,10 @@ Kubernetes Cluster Health Tool
 Get overall cluster health status.
 """
 
-import json
+from collections import Counter
 
-
-def _get_k8s_client():
-    """Get Kubernetes client, handling import errors gracefully."""
-    try:
-        from kubernetes import client, config
-        try:
-            config.load_incluster_config()
-        except:
-            config.load_kube_config()
-        return client.CoreV1Api()
-    except ImportError:
-        raise ImportError("kubernetes library not installed. Run: pip install kubernetes")
-    except Exception as e:
-        raise Exception(f"Failed to load Kubernetes config: {str(e)}")
+from ._jsonio import dumps_result
+from ._k8s_client import get_k8s_client, iter_list_items
 
 
 def get_cluster_health() -> str:
@@ -34,7 +22,7 @@ def get_cluster_health() -> str:
         - summary: Health summary message
     """
     try:
-        v1 = _get_k8s_client()
+        v1 = get_k8s_client()
         
         # Get nodes
         nodes = v1.list_node()
@@ -54,40 +42,39 @@ def get_cluster_health() -> str:
                             "message": condition.message if condition.message else "N/A"
                         })
         
-        # Get pods
-        pods = v1.list_pod_for_all_namespaces()
-        pod_count = len(pods.items)
-        running_pods = 0
+        # Get pods (paged; every pod is still needed since CrashLoopBackOff pods report phase Running)
+        phase_counts = Counter()
         pending_pods = []
         failed_pods = []
+        phase_details = {"Pending": pending_pods, "Failed": failed_pods}
         crash_loop_pods = []
         
-        for pod in pods.items:
-            if pod.status.phase == "Running":
-                running_pods += 1
-            elif pod.status.phase == "Pending":
-                pending_pods.append({
-                    "name": pod.metadata.name,
-                    "namespace": pod.metadata.namespace,
-                    "reason": pod.status.reason if pod.status.reason else "N/A"
-                })
-            elif pod.status.phase == "Failed":
-                failed_pods.append({
+        for pod in iter_list_items(v1.list_pod_for_all_namespaces):
+            pod_status = pod.status
+            phase = pod_status.phase
+            phase_counts[phase] += 1
+            
+            details = phase_details.get(phase)
+            if details is not None:
+                details.append({
                     "name": pod.metadata.name,
                     "namespace": pod.metadata.namespace,
-                    "reason": pod.status.reason if pod.status.reason else "N/A"
+                    "reason": pod_status.reason if pod_status.reason else "N/A"
                 })
             
-            # Check for crash loop
-            if pod.status.container_statuses:
-                for container in pod.status.container_statuses:
-                    if container.state.waiting and "CrashLoopBackOff" in container.state.waiting.reason:
-                        crash_loop_pods.append({
-                            "name": pod.metadata.name,
-                            "namespace": pod.metadata.namespace,
-                            "container": container.name,
-                            "reason": container.state.waiting.reason
-                        })
+            # Check for crash loop (the waiting reason is an exact enum value, and may be None)
+            for container in pod_status.container_statuses or ():
+                waiting = container.state.waiting
+                if waiting and waiting.reason == "CrashLoopBackOff":
+                    crash_loop_pods.append({
+                        "name": pod.metadata.name,
+                        "namespace": pod.metadata.namespace,
+                        "container": container.name,
+                        "reason": waiting.reason
+                    })
+        
+        pod_count = sum(phase_counts.values())
+        running_pods = phase_counts["Running"]
         
         # Determine overall status
         issues = []
@@ -137,7 +124,7 @@ def get_cluster_health() -> str:
             "message": f"Cluster status: {status}. {ready_nodes}/{node_count} nodes ready, {running_pods}/{pod_count} pods running."
         }
         
-        return json.dumps(result, indent=2)
+        return dumps_result(result)
     
     except Exception as e:
         error_result = {
@@ -145,4 +132,4 @@ def get_cluster_health() -> str:
             "status": "UNKNOWN",
             "message": f"Failed to get cluster health: {str(e)}"
         }
-        return json.dumps(error_result, indent=2)
+        return dumps_result(error_result)
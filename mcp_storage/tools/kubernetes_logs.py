@@ -3,23 +3,10 @@ Kubernetes Logs Tool
 Get logs from Kubernetes pods.
 """
 
-import json
 from typing import Optional
 
-
-def _get_k8s_client():
-    """Get Kubernetes client, handling import errors gracefully."""
-    try:
-        from kubernetes import client, config
-        try:
-            config.load_incluster_config()
-        except:
-            config.load_kube_config()
-        return client.CoreV1Api()
-    except ImportError:
-        raise ImportError("kubernetes library not installed. Run: pip install kubernetes")
-    except Exception as e:
-        raise Exception(f"Failed to load Kubernetes config: {str(e)}")
+from ._jsonio import dumps_result
+from ._k8s_client import get_k8s_client
 
 
 def get_pod_logs(pod_name: str, namespace: str = "default", container: Optional[str] = None, tail_lines: int = 100) -> str:
@@ -41,7 +28,7 @@ def get_pod_logs(pod_name: str, namespace: str = "default", container: Optional[
         - line_count: Number of log lines
     """
     try:
-        v1 = _get_k8s_client()
+        v1 = get_k8s_client()
         
         # Get pod to check containers
         pod = v1.read_namespaced_pod(name=pod_name, namespace=namespace)
@@ -57,17 +44,23 @@ def get_pod_logs(pod_name: str, namespace: str = "default", container: Optional[
                     "namespace": namespace,
                     "message": f"Pod {pod_name} has no containers"
                 }
-                return json.dumps(error_result, indent=2)
+                return dumps_result(error_result)
         
-        # Get logs
-        logs = v1.read_namespaced_pod_log(
+        # Get logs as raw bytes and split them before decoding, skipping the client's
+        # str deserialization of the whole body
+        response = v1.read_namespaced_pod_log(
             name=pod_name,
             namespace=namespace,
             container=container,
-            tail_lines=tail_lines
+            tail_lines=tail_lines,
+            _preload_content=False
         )
+        try:
+            raw_logs = response.data
+        finally:
+            response.release_conn()
         
-        log_lines = logs.split('\n') if logs else []
+        log_lines = [line.decode("utf-8", "replace") for line in raw_logs.splitlines()]
         
         result = {
             "pod_name": pod_name,
@@ -78,7 +71,7 @@ def get_pod_logs(pod_name: str, namespace: str = "default", container: Optional[
             "message": f"Retrieved {len(log_lines)} log line(s) from {pod_name}/{container}"
         }
         
-        return json.dumps(result, indent=2)
+        return dumps_result(result)
     
     except Exception as e:
         error_result = {
@@ -88,4 +81,4 @@ def get_pod_logs(pod_name: str, namespace: str = "default", container: Optional[
             "container": container,
             "message": f"Failed to get pod logs: {str(e)}"
         }
-        return json.dumps(error_result, indent=2)
+        return dumps_result(error_result)
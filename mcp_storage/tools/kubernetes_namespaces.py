@@ -3,22 +3,16 @@ Kubernetes Namespaces Tool
 List Kubernetes namespaces.
 """
 
-import json
+from collections import Counter
+from datetime import datetime, timezone
 
+from ._jsonio import dumps_result
+from ._k8s_client import (
+    LIST_PAGE_SIZE, LISTING_CACHE_TTL_SEC, WATCH_CACHE_RESOURCE_VERSION, format_age, get_k8s_client, ttl_cached_listing
+)
 
-def _get_k8s_client():
-    """Get Kubernetes client, handling import errors gracefully."""
-    try:
-        from kubernetes import client, config
-        try:
-            config.load_incluster_config()
-        except:
-            config.load_kube_config()
-        return client.CoreV1Api()
-    except ImportError:
-        raise ImportError("kubernetes library not installed. Run: pip install kubernetes")
-    except Exception as e:
-        raise Exception(f"Failed to load Kubernetes config: {str(e)}")
+# Ask the apiserver for pod metadata only (no specs/statuses); plain JSON is the fallback
+_POD_METADATA_ACCEPT = "application/json;as=PartialObjectMetadataList;v=v1;g=meta.k8s.io,application/json"
 
 
 def list_namespaces() -> str:
@@ -30,42 +24,35 @@ def list_namespaces() -> str:
         - namespaces: List of namespace information (name, status, age, pod_count)
         - total_count: Total number of namespaces
     """
+    return dumps_result(_list_namespaces_result())
+
+
+@ttl_cached_listing(LISTING_CACHE_TTL_SEC)
+def _list_namespaces_result() -> dict:
+    """Build the list_namespaces result dict (reused for LISTING_CACHE_TTL_SEC)."""
     try:
-        v1 = _get_k8s_client()
-        namespaces = v1.list_namespace()
+        v1 = get_k8s_client()
+        namespaces = v1.list_namespace(resource_version=WATCH_CACHE_RESOURCE_VERSION)
+        
+        # Count pods per namespace from one cluster-wide listing instead of one call per namespace
+        try:
+            pod_counts = Counter(pod["metadata"]["namespace"] for pod in _iter_pod_metadata(v1))
+        except:
+            pod_counts = Counter()
         
         namespace_list = []
+        now = datetime.now(timezone.utc)
         for ns in namespaces.items:
-            # Calculate age
-            age = ""
-            if ns.metadata.creation_timestamp:
-                from datetime import datetime, timezone
-                age_delta = datetime.now(timezone.utc) - ns.metadata.creation_timestamp
-                days = age_delta.days
-                hours, remainder = divmod(age_delta.seconds, 3600)
-                minutes, _ = divmod(remainder, 60)
-                if days > 0:
-                    age = f"{days}d{hours}h"
-                elif hours > 0:
-                    age = f"{hours}h{minutes}m"
-                else:
-                    age = f"{minutes}m"
+            age = format_age(ns.metadata.creation_timestamp, now)
             
             # Get phase/status
             status = ns.status.phase if ns.status.phase else "Active"
             
-            # Count pods in namespace
-            try:
-                pods = v1.list_namespaced_pod(namespace=ns.metadata.name)
-                pod_count = len(pods.items)
-            except:
-                pod_count = 0
-            
             namespace_info = {
                 "name": ns.metadata.name,
                 "status": status,
                 "age": age,
-                "pod_count": pod_count
+                "pod_count": pod_counts[ns.metadata.name]
             }
             namespace_list.append(namespace_info)
         
@@ -75,11 +62,31 @@ def list_namespaces() -> str:
             "message": f"Found {len(namespace_list)} namespace(s) in cluster"
         }
         
-        return json.dumps(result, indent=2)
+        return result
     
     except Exception as e:
         error_result = {
             "error": str(e),
             "message": f"Failed to list namespaces: {str(e)}"
         }
-        return json.dumps(error_result, indent=2)
+        return error_result
+
+
+def _iter_pod_metadata(v1):
+    """Yield every pod in the cluster as a metadata-only dict, one server-side page at a time."""
+    query_params = [("resourceVersion", WATCH_CACHE_RESOURCE_VERSION), ("limit", LIST_PAGE_SIZE)]
+    while True:
+        response = v1.api_client.call_api(
+            "/api/v1/pods", "GET",
+            query_params=query_params,
+            header_params={"Accept": _POD_METADATA_ACCEPT},
+            response_type="object",
+            auth_settings=["BearerToken"],
+            _return_http_data_only=True
+        )
+        yield from response.get("items") or []
+        
+        continue_token = (response.get("metadata") or {}).get("continue")
+        if not continue_token:
+            return
+        query_params = [("limit", LIST_PAGE_SIZE), ("continue", continue_token)]
@@ -3,23 +3,20 @@ Kubernetes Nodes Tool
 List and get status of Kubernetes nodes.
 """
 
-import json
 from typing import Optional
 
+from ._jsonio import dumps_result
+from ._k8s_client import (
+    LISTING_CACHE_TTL_SEC, WATCH_CACHE_RESOURCE_VERSION, get_k8s_client, single_flight, ttl_cached_listing
+)
+
+_NODE_ROLE_LABEL_PREFIX = "node-role.kubernetes.io/"
+_NODE_ROLE_PREFIX_LEN = len(_NODE_ROLE_LABEL_PREFIX)
 
-def _get_k8s_client():
-    """Get Kubernetes client, handling import errors gracefully."""
-    try:
-        from kubernetes import client, config
-        try:
-            config.load_incluster_config()
-        except:
-            config.load_kube_config()
-        return client.CoreV1Api()
-    except ImportError:
-        raise ImportError("kubernetes library not installed. Run: pip install kubernetes")
-    except Exception as e:
-        raise Exception(f"Failed to load Kubernetes config: {str(e)}")
+
+def _node_roles(labels) -> list:
+    """Get a node's roles from its node-role.kubernetes.io/<role> labels (default: worker)."""
+    return [key[_NODE_ROLE_PREFIX_LEN:] for key in labels or () if key.startswith(_NODE_ROLE_LABEL_PREFIX)] or ["worker"]
 
 
 def list_nodes() -> str:
@@ -31,21 +28,19 @@ def list_nodes() -> str:
         - nodes: List of node information (name, status, roles, version, resources)
         - total_count: Total number of nodes
     """
+    return dumps_result(_list_nodes_result())
+
+
+@ttl_cached_listing(LISTING_CACHE_TTL_SEC)
+def _list_nodes_result() -> dict:
+    """Build the list_nodes result dict (reused for LISTING_CACHE_TTL_SEC)."""
     try:
-        v1 = _get_k8s_client()
-        nodes = v1.list_node()
+        v1 = get_k8s_client()
+        nodes = v1.list_node(resource_version=WATCH_CACHE_RESOURCE_VERSION)
         
         node_list = []
         for node in nodes.items:
-            # Get roles
-            roles = []
-            if node.metadata.labels:
-                for key in node.metadata.labels:
-                    if "node-role.kubernetes.io" in key:
-                        role = key.split("/")[-1]
-                        roles.append(role)
-            if not roles:
-                roles = ["worker"]
+            roles = _node_roles(node.metadata.labels)
             
             # Get node conditions
             conditions = {}
@@ -92,16 +87,17 @@ def list_nodes() -> str:
             "message": f"Found {len(node_list)} node(s) in cluster"
         }
         
-        return json.dumps(result, indent=2)
+        return result
     
     except Exception as e:
         error_result = {
             "error": str(e),
             "message": f"Failed to list nodes: {str(e)}"
         }
-        return json.dumps(error_result, indent=2)
+        return error_result
 
 
+@single_flight
 def get_node_status(node_name: str) -> str:
     """
     Get detailed status of a specific node.
@@ -119,19 +115,16 @@ def get_node_status(node_name: str) -> str:
         - pods: Pods running on this node
     """
     try:
-        v1 = _get_k8s_client()
+        v1 = get_k8s_client()
         
+        # Start the pods-on-node listing on the client's worker pool so it overlaps read_node
+        pods_request = v1.list_pod_for_all_namespaces(
+            field_selector=f"spec.nodeName={node_name}", resource_version=WATCH_CACHE_RESOURCE_VERSION,
+            async_req=True
+        )
         node = v1.read_node(name=node_name)
         
-        # Get roles
-        roles = []
-        if node.metadata.labels:
-            for key in node.metadata.labels:
-                if "node-role.kubernetes.io" in key:
-                    role = key.split("/")[-1]
-                    roles.append(role)
-        if not roles:
-            roles = ["worker"]
+        roles = _node_roles(node.metadata.labels)
         
         # Get conditions
         conditions = []
@@ -165,7 +158,7 @@ def get_node_status(node_name: str) -> str:
             }
         
         # Get pods on this node
-        pods = v1.list_pod_for_all_namespaces(field_selector=f"spec.nodeName={node_name}")
+        pods = pods_request.get()
         pod_list = [{"name": p.metadata.name, "namespace": p.metadata.namespace, "status": p.status.phase} 
                    for p in pods.items]
         
@@ -185,7 +178,7 @@ def get_node_status(node_name: str) -> str:
             "message": f"Node {node_name} is {status} with {len(pod_list)} pod(s)"
         }
         
-        return json.dumps(result, indent=2)
+        return dumps_result(result)
     
     except Exception as e:
         error_result = {
@@ -193,4 +186,4 @@ def get_node_status(node_name: str) -> str:
             "node_name": node_name,
             "message": f"Failed to get node status: {str(e)}"
         }
-        return json.dumps(error_result, indent=2)
+        return dumps_result(error_result)
@@ -3,25 +3,15 @@ Kubernetes Pods Tool
 List and get status of Kubernetes pods.
 """
 
-import json
+from collections import Counter
+from datetime import datetime, timezone
 from typing import Optional
 
-
-def _get_k8s_client():
-    """Get Kubernetes client, handling import errors gracefully."""
-    try:
-        from kubernetes import client, config
-        try:
-            # Try to load in-cluster config first (if running in a pod)
-            config.load_incluster_config()
-        except:
-            # Fall back to kubeconfig (local cluster)
-            config.load_kube_config()
-        return client.CoreV1Api()
-    except ImportError:
-        raise ImportError("kubernetes library not installed. Run: pip install kubernetes")
-    except Exception as e:
-        raise Exception(f"Failed to load Kubernetes config: {str(e)}")
+from ._jsonio import dumps_result
+from ._k8s_client import (
+    POD_LISTING_CACHE_TTL_SEC, WATCH_CACHE_RESOURCE_VERSION, format_age, get_k8s_client, iter_list_items, single_flight,
+    ttl_cached_listing
+)
 
 
 def list_pods(namespace: Optional[str] = None) -> str:
@@ -37,32 +27,34 @@ def list_pods(namespace: Optional[str] = None) -> str:
         - total_count: Total number of pods
         - namespaces: List of namespaces with pod counts
     """
+    return dumps_result(_list_pods_result(namespace))
+
+
+@ttl_cached_listing(POD_LISTING_CACHE_TTL_SEC)
+def _list_pods_result(namespace: Optional[str]) -> dict:
+    """Build the list_pods result dict (reused for POD_LISTING_CACHE_TTL_SEC)."""
     try:
-        v1 = _get_k8s_client()
+        v1 = get_k8s_client()
         
         if namespace:
-            pods = v1.list_namespaced_pod(namespace=namespace)
-            namespace_list = [namespace]
+            pods = iter_list_items(
+                v1.list_namespaced_pod, namespace=namespace, resource_version=WATCH_CACHE_RESOURCE_VERSION
+            )
         else:
-            pods = v1.list_pod_for_all_namespaces()
-            namespace_list = list(set([pod.metadata.namespace for pod in pods.items]))
+            pods = iter_list_items(v1.list_pod_for_all_namespaces, resource_version=WATCH_CACHE_RESOURCE_VERSION)
         
         pod_list = []
-        for pod in pods.items:
-            # Calculate age
-            age = ""
-            if pod.status.start_time:
-                from datetime import datetime, timezone
-                age_delta = datetime.now(timezone.utc) - pod.status.start_time
-                days = age_delta.days
-                hours, remainder = divmod(age_delta.seconds, 3600)
-                minutes, _ = divmod(remainder, 60)
-                if days > 0:
-                    age = f"{days}d{hours}h"
-                elif hours > 0:
-                    age = f"{hours}h{minutes}m"
-                else:
-                    age = f"{minutes}m"
+        now = datetime.now(timezone.utc)
+        for pod in pods:
+            age = format_age(pod.status.start_time, now)
+            
+            # Ready and restart counts in one pass (pending pods have no container statuses yet)
+            container_statuses = pod.status.container_statuses or ()
+            ready_count = 0
+            restart_count = 0
+            for container_status in container_statuses:
+                ready_count += bool(container_status.ready)
+                restart_count += container_status.restart_count
             
             pod_info = {
                 "name": pod.metadata.name,
@@ -70,34 +62,33 @@ def list_pods(namespace: Optional[str] = None) -> str:
                 "status": pod.status.phase,
                 "node": pod.spec.node_name if pod.spec.node_name else "N/A",
                 "age": age,
-                "ready": f"{sum(1 for c in pod.status.container_statuses if c.ready)}/{len(pod.status.container_statuses) if pod.status.container_statuses else 0}",
-                "restarts": sum(c.restart_count for c in pod.status.container_statuses if pod.status.container_statuses) if pod.status.container_statuses else 0
+                "ready": f"{ready_count}/{len(container_statuses)}",
+                "restarts": restart_count
             }
             pod_list.append(pod_info)
         
         # Count pods per namespace
-        namespace_counts = {}
-        for pod in pod_list:
-            ns = pod["namespace"]
-            namespace_counts[ns] = namespace_counts.get(ns, 0) + 1
+        namespace_counts = Counter(pod["namespace"] for pod in pod_list)
+        namespace_list = [namespace] if namespace else list(namespace_counts)
         
         result = {
             "pods": pod_list,
             "total_count": len(pod_list),
-            "namespaces": [{"name": ns, "pod_count": namespace_counts.get(ns, 0)} for ns in namespace_list],
+            "namespaces": [{"name": ns, "pod_count": namespace_counts[ns]} for ns in namespace_list],
             "message": f"Found {len(pod_list)} pod(s) in {len(namespace_list)} namespace(s)"
         }
         
-        return json.dumps(result, indent=2)
+        return result
     
     except Exception as e:
         error_result = {
             "error": str(e),
             "message": f"Failed to list pods: {str(e)}"
         }
-        return json.dumps(error_result, indent=2)
+        return error_result
 
 
+@single_flight
 def get_pod_status(pod_name: str, namespace: str = "default") -> str:
     """
     Get detailed status of a specific pod.
@@ -117,7 +108,7 @@ def get_pod_status(pod_name: str, namespace: str = "default") -> str:
         - events: Recent events (if available)
     """
     try:
-        v1 = _get_k8s_client()
+        v1 = get_k8s_client()
         
         pod = v1.read_namespaced_pod(name=pod_name, namespace=namespace)
         
@@ -149,20 +140,7 @@ def get_pod_status(pod_name: str, namespace: str = "default") -> str:
                     "message": condition.message if condition.message else "N/A"
                 })
         
-        # Calculate age
-        age = ""
-        if pod.status.start_time:
-            from datetime import datetime, timezone
-            age_delta = datetime.now(timezone.utc) - pod.status.start_time
-            days = age_delta.days
-            hours, remainder = divmod(age_delta.seconds, 3600)
-            minutes, _ = divmod(remainder, 60)
-            if days > 0:
-                age = f"{days}d{hours}h"
-            elif hours > 0:
-                age = f"{hours}h{minutes}m"
-            else:
-                age = f"{minutes}m"
+        age = format_age(pod.status.start_time, datetime.now(timezone.utc))
         
         result = {
             "name": pod.metadata.name,
@@ -175,7 +153,7 @@ def get_pod_status(pod_name: str, namespace: str = "default") -> str:
             "message": f"Pod {pod_name} in namespace {namespace} is {pod.status.phase}"
         }
         
-        return json.dumps(result, indent=2)
+        return dumps_result(result)
     
     except Exception as e:
         error_result = {
@@ -184,4 +162,4 @@ def get_pod_status(pod_name: str, namespace: str = "default") -> str:
             "namespace": namespace,
             "message": f"Failed to get pod status: {str(e)}"
         }
-        return json.dumps(error_result, indent=2)
+        return dumps_result(error_result)
@@ -3,23 +3,17 @@ Kubernetes Resource Usage Tool
 Get CPU and memory usage for pods and nodes.
 """
 
-import json
 from typing import Optional
 
+from ._jsonio import dumps_result
+from ._k8s_client import get_custom_objects_api
 
-def _get_k8s_client():
-    """Get Kubernetes client, handling import errors gracefully."""
-    try:
-        from kubernetes import client, config
-        try:
-            config.load_incluster_config()
-        except:
-            config.load_kube_config()
-        return client.CoreV1Api(), client.CustomObjectsApi()
-    except ImportError:
-        raise ImportError("kubernetes library not installed. Run: pip install kubernetes")
-    except Exception as e:
-        raise Exception(f"Failed to load Kubernetes config: {str(e)}")
+BYTES_PER_MB = 1 << 20
+
+# Quantity suffix -> multiplier, looked up directly from the last one/two characters
+_CPU_SUFFIX_MULTIPLIERS = {"m": 1e-3, "n": 1e-9}
+_MEMORY_BINARY_MULTIPLIERS = {"Ki": 1024, "Mi": 1024 ** 2, "Gi": 1024 ** 3, "Ti": 1024 ** 4}
+_MEMORY_DECIMAL_MULTIPLIERS = {"K": 1000, "M": 1000 ** 2, "G": 1000 ** 3, "T": 1000 ** 4}
 
 
 def get_resource_usage(resource_type: str = "pods", namespace: Optional[str] = None) -> str:
@@ -37,7 +31,7 @@ def get_resource_usage(resource_type: str = "pods", namespace: Optional[str] = N
         - total_memory: Total memory usage
     """
     try:
-        v1, custom_api = _get_k8s_client()
+        custom_api = get_custom_objects_api()
         
         # Try to get metrics from metrics-server
         try:
@@ -86,19 +80,20 @@ def get_resource_usage(resource_type: str = "pods", namespace: Optional[str] = N
                             "cpu": cpu_str,
                             "cpu_cores": round(cpu_value, 3),
                             "memory": memory_str,
-                            "memory_mb": round(memory_value / (1024 * 1024), 2)
+                            "memory_mb": round(memory_value / BYTES_PER_MB, 2)
                         })
                     
                     total_cpu_cores += cpu_usage
                     total_memory_bytes += memory_usage
                     
+                    memory_mb = memory_usage / BYTES_PER_MB
                     resource_list.append({
                         "name": pod_name,
                         "namespace": pod_namespace,
                         "cpu": f"{cpu_usage:.3f}",
                         "cpu_cores": round(cpu_usage, 3),
-                        "memory": f"{memory_usage / (1024 * 1024):.2f}Mi",
-                        "memory_mb": round(memory_usage / (1024 * 1024), 2),
+                        "memory": f"{memory_mb:.2f}Mi",
+                        "memory_mb": round(memory_mb, 2),
                         "containers": containers
                     })
                 
@@ -106,7 +101,7 @@ def get_resource_usage(resource_type: str = "pods", namespace: Optional[str] = N
                     "resource_type": "pods",
                     "resources": resource_list,
                     "total_cpu_cores": round(total_cpu_cores, 3),
-                    "total_memory_mb": round(total_memory_bytes / (1024 * 1024), 2),
+                    "total_memory_mb": round(total_memory_bytes / BYTES_PER_MB, 2),
                     "total_count": len(resource_list),
                     "message": f"Found resource usage for {len(resource_list)} pod(s)"
                 }
@@ -138,21 +133,21 @@ def get_resource_usage(resource_type: str = "pods", namespace: Optional[str] = N
                         "cpu": cpu_str,
                         "cpu_cores": round(cpu_value, 3),
                         "memory": memory_str,
-                        "memory_mb": round(memory_value / (1024 * 1024), 2)
+                        "memory_mb": round(memory_value / BYTES_PER_MB, 2)
                     })
                 
                 result = {
                     "resource_type": "nodes",
                     "resources": resource_list,
                     "total_cpu_cores": round(total_cpu_cores, 3),
-                    "total_memory_mb": round(total_memory_bytes / (1024 * 1024), 2),
+                    "total_memory_mb": round(total_memory_bytes / BYTES_PER_MB, 2),
                     "total_count": len(resource_list),
                     "message": f"Found resource usage for {len(resource_list)} node(s)"
                 }
             else:
                 raise ValueError(f"Invalid resource_type: {resource_type}. Must be 'pods' or 'nodes'")
             
-            return json.dumps(result, indent=2)
+            return dumps_result(result)
         
         except Exception as metrics_error:
             # Metrics server not available
@@ -161,7 +156,7 @@ def get_resource_usage(resource_type: str = "pods", namespace: Optional[str] = N
                 "details": str(metrics_error),
                 "message": "Kubernetes metrics-server is not installed or not accessible. Install metrics-server to get resource usage data."
             }
-            return json.dumps(error_result, indent=2)
+            return dumps_result(error_result)
     
     except Exception as e:
         error_result = {
@@ -169,7 +164,7 @@ def get_resource_usage(resource_type: str = "pods", namespace: Optional[str] = N
             "resource_type": resource_type,
             "message": f"Failed to get resource usage: {str(e)}"
         }
-        return json.dumps(error_result, indent=2)
+        return dumps_result(error_result)
 
 
 def _parse_cpu(cpu_str: str) -> float:
@@ -178,12 +173,10 @@ def _parse_cpu(cpu_str: str) -> float:
         return 0.0
     
     cpu_str = cpu_str.strip()
-    if cpu_str.endswith("m"):
-        return float(cpu_str[:-1]) / 1000.0
-    elif cpu_str.endswith("n"):
-        return float(cpu_str[:-1]) / 1000000000.0
-    else:
-        return float(cpu_str)
+    multiplier = _CPU_SUFFIX_MULTIPLIERS.get(cpu_str[-1])
+    if multiplier is not None:
+        return float(cpu_str[:-1]) * multiplier
+    return float(cpu_str)
 
 
 def _parse_memory(memory_str: str) -> float:
@@ -192,20 +185,13 @@ def _parse_memory(memory_str: str) -> float:
         return 0.0
     
     memory_str = memory_str.strip()
-    multipliers = {
-        "Ki": 1024,
-        "Mi": 1024 ** 2,
-        "Gi": 1024 ** 3,
-        "Ti": 1024 ** 4,
-        "K": 1000,
-        "M": 1000 ** 2,
-        "G": 1000 ** 3,
-        "T": 1000 ** 4
-    }
-    
-    for suffix, multiplier in multipliers.items():
-        if memory_str.endswith(suffix):
-            return float(memory_str[:-len(suffix)]) * multiplier
+    # Binary suffixes are two characters, so check them before the one-character decimal ones
+    multiplier = _MEMORY_BINARY_MULTIPLIERS.get(memory_str[-2:])
+    if multiplier is not None:
+        return float(memory_str[:-2]) * multiplier
+    multiplier = _MEMORY_DECIMAL_MULTIPLIERS.get(memory_str[-1])
+    if multiplier is not None:
+        return float(memory_str[:-1]) * multiplier
     
     # If no suffix, assume bytes
     return float(memory_str)
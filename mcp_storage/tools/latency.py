@@ -3,9 +3,16 @@ Disk Latency Tool
 Measures disk read and write latency in milliseconds.
 """
 
-import json
+import bisect
 import psutil
 
+from ._diskstats import read_disk_totals
+from ._jsonio import dumps_result
+
+# Latency thresholds (ms) that must be exceeded for WARNING and CRITICAL
+_LATENCY_THRESHOLDS_MS = (10, 20)
+_STATUS_LEVELS = ("OK", "WARNING", "CRITICAL")
+
 
 def get_disk_latency() -> str:
     """
@@ -28,15 +35,15 @@ def get_disk_latency() -> str:
         15.5
     """
     try:
-        # Get disk I/O counters
-        io_counters = psutil.disk_io_counters()
+        # Get disk I/O counters (psutil where /proc/diskstats is unavailable)
+        io_counters = read_disk_totals() or psutil.disk_io_counters()
         
         if io_counters is None:
             error_result = {
                 "error": "No disk I/O counters available",
                 "message": "System does not provide disk I/O statistics"
             }
-            return json.dumps(error_result, indent=2)
+            return dumps_result(error_result)
         
         # Extract metrics (time is in milliseconds)
         read_time_ms = io_counters.read_time
@@ -58,12 +65,7 @@ def get_disk_latency() -> str:
         
         # Determine status based on worst latency
         max_latency = max(avg_read_latency_ms, avg_write_latency_ms)
-        if max_latency > 20:
-            status = "CRITICAL"
-        elif max_latency > 10:
-            status = "WARNING"
-        else:
-            status = "OK"
+        status = _STATUS_LEVELS[bisect.bisect_left(_LATENCY_THRESHOLDS_MS, max_latency)]
         
         # Build result
         result = {
@@ -77,11 +79,11 @@ def get_disk_latency() -> str:
             "message": f"Latency: Read {avg_read_latency_ms:.2f}ms, Write {avg_write_latency_ms:.2f}ms"
         }
         
-        return json.dumps(result, indent=2)
+        return dumps_result(result)
     
     except Exception as e:
         error_result = {
             "error": str(e),
             "message": f"Failed to get disk latency: {str(e)}"
         }
-        return json.dumps(error_result, indent=2)
+        return dumps_result(error_result)
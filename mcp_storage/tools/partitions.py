@@ -3,8 +3,61 @@ Disk Partitions Tool
 Get information about all disk partitions and mount points.
 """
 
-import json
+import os
 import psutil
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Optional, Tuple
+
+from ._jsonio import dumps_result
+
+BYTES_PER_GB = 1 << 30
+
+# The mount table rarely changes, so the partition list is reused for this many seconds
+PARTITION_CACHE_TTL_SEC = 5.0
+
+# Upper bound on concurrent disk_usage (statvfs) calls; statvfs releases the GIL
+USAGE_MAX_WORKERS = 8
+
+# (sampled_at, partitions) from the last psutil.disk_partitions() call
+_PARTITION_CACHE: Optional[Tuple[float, list]] = None
+
+
+def _list_partitions() -> list:
+    """Return psutil.disk_partitions(all=False), cached for PARTITION_CACHE_TTL_SEC."""
+    global _PARTITION_CACHE
+    now = time.monotonic()
+    if _PARTITION_CACHE and now - _PARTITION_CACHE[0] < PARTITION_CACHE_TTL_SEC:
+        return _PARTITION_CACHE[1]
+    
+    partitions = psutil.disk_partitions(all=False)
+    _PARTITION_CACHE = (now, partitions)
+    return partitions
+
+
+def _partition_usage(mountpoint: str) -> Dict[str, Any]:
+    """Get the usage fields for one mount point (None values if it cannot be read)."""
+    try:
+        if hasattr(os, "statvfs"):
+            # One statvfs call, computed the same way as psutil.disk_usage
+            st = os.statvfs(mountpoint)
+            total = st.f_blocks * st.f_frsize
+            free = st.f_bavail * st.f_frsize
+            used = (st.f_blocks - st.f_bfree) * st.f_frsize
+            # Percent of the space visible to non-root users, as psutil reports it
+            user_total = used + free
+            percent = round(used / user_total * 100, 1) if user_total else 0.0
+        else:
+            usage = psutil.disk_usage(mountpoint)
+            total, used, free, percent = usage.total, usage.used, usage.free, usage.percent
+        return {
+            "total_gb": round(total / BYTES_PER_GB, 2),
+            "used_gb": round(used / BYTES_PER_GB, 2),
+            "free_gb": round(free / BYTES_PER_GB, 2),
+            "used_percent": round(percent, 2)
+        }
+    except (PermissionError, OSError):
+        return {"total_gb": None, "used_gb": None, "free_gb": None, "used_percent": None}
 
 
 def get_disk_partitions() -> str:
@@ -25,7 +78,7 @@ def get_disk_partitions() -> str:
         5
     """
     try:
-        partitions = psutil.disk_partitions(all=False)
+        partitions = _list_partitions()
         
         partition_list = []
         mount_points = []
@@ -42,19 +95,22 @@ def get_disk_partitions() -> str:
             mount_points.append(partition.mountpoint)
             file_systems.add(partition.fstype)
         
-        # Get usage for each mount point
-        for part_info in partition_list:
-            try:
-                usage = psutil.disk_usage(part_info["mountpoint"])
-                part_info["total_gb"] = round(usage.total / (1024 ** 3), 2)
-                part_info["used_gb"] = round(usage.used / (1024 ** 3), 2)
-                part_info["free_gb"] = round(usage.free / (1024 ** 3), 2)
-                part_info["used_percent"] = round(usage.percent, 2)
-            except (PermissionError, OSError):
-                part_info["total_gb"] = None
-                part_info["used_gb"] = None
-                part_info["free_gb"] = None
-                part_info["used_percent"] = None
+        # Get usage once per filesystem: bind mounts of the same /dev device share one statvfs.
+        # Virtual filesystems (tmpfs, overlay, ...) have no unique device, so they are keyed by mount point.
+        usage_keys = [
+            part_info["device"] if part_info["device"].startswith("/dev/") else part_info["mountpoint"]
+            for part_info in partition_list
+        ]
+        mountpoint_by_key = {}
+        for usage_key, mountpoint in zip(usage_keys, mount_points):
+            mountpoint_by_key.setdefault(usage_key, mountpoint)
+        
+        # Read them concurrently (a slow or hung mount no longer delays the rest)
+        if mountpoint_by_key:
+            with ThreadPoolExecutor(max_workers=min(USAGE_MAX_WORKERS, len(mountpoint_by_key))) as executor:
+                usage_by_key = dict(zip(mountpoint_by_key, executor.map(_partition_usage, mountpoint_by_key.values())))
+            for part_info, usage_key in zip(partition_list, usage_keys):
+                part_info.update(usage_by_key[usage_key])
         
         result = {
             "total_partitions": len(partition_list),
@@ -64,11 +120,11 @@ def get_disk_partitions() -> str:
             "message": f"Found {len(partition_list)} disk partitions"
         }
         
-        return json.dumps(result, indent=2)
+        return dumps_result(result)
     
     except Exception as e:
         error_result = {
             "error": str(e),
             "message": f"Failed to get disk partitions: {str(e)}"
         }
-        return json.dumps(error_result, indent=2)
+        return dumps_result(error_result)
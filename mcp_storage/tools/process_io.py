@@ -3,8 +3,84 @@ Process I/O Tool
 Monitor I/O statistics for running processes.
 """
 
-import json
+import heapq
+import os
 import psutil
+from operator import itemgetter
+from typing import Iterator, Optional, Tuple
+
+from ._jsonio import dumps_result
+
+BYTES_PER_GB = 1 << 30
+
+# /proc/<pid>/comm is truncated to 15 characters (TASK_COMM_LEN - 1)
+_COMM_MAX_LEN = 15
+
+# Rows are (total_io, pid, name, read_bytes, write_bytes, read_count, write_count)
+_TOTAL_IO_KEY = itemgetter(0)
+
+
+def _read_proc_name(pid: int) -> Optional[str]:
+    """Read a process name from /proc (extending a truncated comm from cmdline like psutil does), or None if it exited."""
+    try:
+        with open(f"/proc/{pid}/comm", "rb") as f:
+            name = f.read().rstrip(b"\n").decode(errors="replace")
+    except OSError:
+        return None
+    if len(name) >= _COMM_MAX_LEN:
+        try:
+            with open(f"/proc/{pid}/cmdline", "rb") as f:
+                exe_name = os.path.basename(f.read().split(b"\0", 1)[0].decode(errors="replace"))
+            if exe_name.startswith(name):
+                name = exe_name
+        except OSError:
+            pass
+    return name
+
+
+def _iter_process_io() -> Iterator[Tuple[int, Optional[str], int, int, int, int]]:
+    """
+    Yield (pid, name, read_bytes, write_bytes, read_count, write_count) for every readable process.
+    
+    On Linux only /proc/<pid>/io is read here and name is None; callers look names up
+    with _read_proc_name for the processes they keep.
+    """
+    try:
+        proc_entries = os.scandir("/proc")
+    except OSError:
+        proc_entries = None
+    
+    if proc_entries is None:
+        # No procfs (non-Linux): let psutil gather the same counters
+        for proc in psutil.process_iter(['pid', 'name', 'io_counters']):
+            try:
+                pinfo = proc.info
+                io = pinfo['io_counters']
+                if io is not None:
+                    yield pinfo['pid'], pinfo['name'], io.read_bytes, io.write_bytes, io.read_count, io.write_count
+            except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+                continue
+        return
+    
+    # Read /proc/<pid>/io directly: one small read per process instead of psutil's Process
+    # construction, extra /proc reads and PID-reuse checks
+    with proc_entries:
+        for entry in proc_entries:
+            if not entry.name.isdigit():
+                continue
+            try:
+                with open(f"/proc/{entry.name}/io", "rb") as f:
+                    fields = f.read().split()
+                # "rchar: N wchar: N syscr: N ..." -> {b"rchar:": b"N", ...}
+                counters = dict(zip(fields[::2], fields[1::2]))
+                yield (
+                    int(entry.name), None,
+                    int(counters[b"read_bytes:"]), int(counters[b"write_bytes:"]),
+                    int(counters[b"syscr:"]), int(counters[b"syscw:"])
+                )
+            except (OSError, KeyError, ValueError):
+                # Process exited, or its io file is not readable (other users' processes without privileges)
+                continue
 
 
 def get_top_io_processes(limit: int = 10) -> str:
@@ -28,57 +104,52 @@ def get_top_io_processes(limit: int = 10) -> str:
         5
     """
     try:
-        processes = []
+        rows = []
         total_read_bytes = 0
         total_write_bytes = 0
         
-        for proc in psutil.process_iter(['pid', 'name', 'io_counters']):
-            try:
-                pinfo = proc.info
-                if pinfo['io_counters'] is not None:
-                    io = pinfo['io_counters']
-                    read_bytes = io.read_bytes
-                    write_bytes = io.write_bytes
-                    read_count = io.read_count
-                    write_count = io.write_count
-                    total_io = read_bytes + write_bytes
-                    
-                    processes.append({
-                        "pid": pinfo['pid'],
-                        "name": pinfo['name'],
-                        "read_bytes": read_bytes,
-                        "write_bytes": write_bytes,
-                        "read_bytes_gb": round(read_bytes / (1024 ** 3), 4),
-                        "write_bytes_gb": round(write_bytes / (1024 ** 3), 4),
-                        "read_count": read_count,
-                        "write_count": write_count,
-                        "total_io_bytes": total_io
-                    })
-                    
-                    total_read_bytes += read_bytes
-                    total_write_bytes += write_bytes
-            except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+        # Keep one small tuple per process that has done I/O (idle processes, usually the
+        # majority, add nothing to the totals or the ranking); only the top N become dicts
+        for pid, name, read_bytes, write_bytes, read_count, write_count in _iter_process_io():
+            total_io = read_bytes + write_bytes
+            if total_io == 0:
                 continue
+            rows.append((total_io, pid, name, read_bytes, write_bytes, read_count, write_count))
+            total_read_bytes += read_bytes
+            total_write_bytes += write_bytes
         
-        # Sort by total I/O and get top N
-        processes.sort(key=lambda x: x['total_io_bytes'], reverse=True)
-        top_processes = processes[:limit]
+        # Top N by total I/O (O(N log limit), same order as a stable descending sort)
+        top_processes = [
+            {
+                "pid": pid,
+                "name": name if name is not None else _read_proc_name(pid),
+                "read_bytes": read_bytes,
+                "write_bytes": write_bytes,
+                "read_bytes_gb": round(read_bytes / BYTES_PER_GB, 4),
+                "write_bytes_gb": round(write_bytes / BYTES_PER_GB, 4),
+                "read_count": read_count,
+                "write_count": write_count,
+                "total_io_bytes": total_io
+            }
+            for total_io, pid, name, read_bytes, write_bytes, read_count, write_count
+            in heapq.nlargest(limit, rows, key=_TOTAL_IO_KEY)
+        ]
         
         result = {
             "count": len(top_processes),
             "processes": top_processes,
             "total_read_bytes": total_read_bytes,
             "total_write_bytes": total_write_bytes,
-            "total_read_gb": round(total_read_bytes / (1024 ** 3), 2),
-            "total_write_gb": round(total_write_bytes / (1024 ** 3), 2),
+            "total_read_gb": round(total_read_bytes / BYTES_PER_GB, 2),
+            "total_write_gb": round(total_write_bytes / BYTES_PER_GB, 2),
             "message": f"Top {len(top_processes)} processes by I/O usage"
         }
         
-        return json.dumps(result, indent=2)
+        return dumps_result(result)
     
     except Exception as e:
         error_result = {
             "error": str(e),
             "message": f"Failed to get process I/O statistics: {str(e)}"
         }
-        return json.dumps(error_result, indent=2)
+        return dumps_result(error_result)
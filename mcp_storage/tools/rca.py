@@ -3,9 +3,41 @@ Storage Root Cause Analysis (RCA) Tool
 Analyzes storage metrics to identify issues and recommend actions.
 """
 
-import json
 from typing import Dict, Any, List
 
+from ._jsonio import dumps_result, loads_result
+
+# Overall severity is tracked as the worst level seen, indexing into _SEVERITY_NAMES
+_SEVERITY_NAMES = ("OK", "WARNING", "CRITICAL")
+_SEVERITY_OK, _SEVERITY_WARNING, _SEVERITY_CRITICAL = range(3)
+
+_OK_SUMMARY = "Storage system is operating normally. All metrics are within acceptable ranges."
+
+# Stable issue codes (reported in "issue_codes") -> the fixed recommendations for that issue
+_ISSUE_RECOMMENDATIONS = {
+    "CAPACITY_CRITICAL": (
+        "Immediate action required: Free up disk space or expand storage",
+        "Consider: Removing old logs, temporary files, or unused data",
+        "Consider: Adding additional storage capacity"
+    ),
+    "CAPACITY_WARNING": ("Plan for disk cleanup or expansion in near future",),
+    "CAPACITY_CHECK_FAILED": (),
+    "IOPS_DEGRADED": (
+        "Investigate disk I/O bottlenecks",
+        "Check for: High I/O wait times, disk queue depth, or I/O scheduler issues",
+        "Consider: Upgrading to faster storage (SSD) or optimizing I/O patterns"
+    ),
+    "IOPS_VERY_LOW": ("Verify system is under normal load",),
+    "IOPS_CHECK_FAILED": (),
+    "LATENCY_CRITICAL": (
+        "Immediate action: Investigate disk performance issues",
+        "Check for: Disk fragmentation, failing hardware, or overloaded storage",
+        "Consider: Replacing failing disks or redistributing I/O load"
+    ),
+    "LATENCY_WARNING": ("Monitor latency trends and investigate if it persists",),
+    "LATENCY_CHECK_FAILED": ()
+}
+
 
 def generate_storage_rca(
     capacity_data: Dict[str, Any],
@@ -29,6 +61,7 @@ def generate_storage_rca(
         JSON string containing:
         - summary: Overall storage health summary
         - issues: List of identified issues
+        - issue_codes: Stable codes for the identified issues (for automation/aggregation)
         - recommendations: List of recommended actions
         - severity: Overall severity level (OK, WARNING, CRITICAL)
         - metrics_summary: Quick metrics overview
@@ -41,128 +74,121 @@ def generate_storage_rca(
         >>> print(rca)
     """
     issues: List[str] = []
-    recommendations: List[str] = []
-    severity_levels = []
+    issue_codes: List[str] = []
+    worst_severity = _SEVERITY_OK
     
     # Parse input data (handle both dict and JSON string)
-    if isinstance(capacity_data, str):
-        capacity = json.loads(capacity_data)
-    else:
-        capacity = capacity_data
+    capacity = loads_result(capacity_data) if isinstance(capacity_data, str) else capacity_data
+    iops = loads_result(iops_data) if isinstance(iops_data, str) else iops_data
+    latency = loads_result(latency_data) if isinstance(latency_data, str) else latency_data
     
-    if isinstance(iops_data, str):
-        iops = json.loads(iops_data)
-    else:
-        iops = iops_data
+    # Read every input field once up front
+    capacity_ok = "error" not in capacity
+    capacity_status = capacity.get("status", "UNKNOWN") if capacity_ok else "ERROR"
+    used_percent = capacity.get("used_percent", 0) if capacity_ok else None
     
-    if isinstance(latency_data, str):
-        latency = json.loads(latency_data)
+    iops_ok = "error" not in iops
+    iops_status = iops.get("status", "UNKNOWN") if iops_ok else "ERROR"
+    total_iops = iops.get("total_iops", 0) if iops_ok else None
+    
+    latency_ok = "error" not in latency
+    latency_status = latency.get("status", "UNKNOWN") if latency_ok else "ERROR"
+    if latency_ok:
+        avg_read_latency = latency.get("avg_read_latency_ms", 0)
+        avg_write_latency = latency.get("avg_write_latency_ms", 0)
+        max_latency = max(avg_read_latency, avg_write_latency)
     else:
-        latency = latency_data
+        max_latency = None
+    
+    # Build metrics summary
+    metrics_summary = {
+        "capacity": {"status": capacity_status, "used_percent": used_percent},
+        "iops": {"status": iops_status, "total_iops": total_iops},
+        "latency": {"status": latency_status, "max_latency_ms": max_latency}
+    }
+    
+    # Fast path for a healthy host: every status is OK and IOPS is not suspiciously low,
+    # so none of the checks below can raise an issue
+    if capacity_status == "OK" and iops_status == "OK" and latency_status == "OK" and total_iops >= 50:
+        return dumps_result({
+            "summary": _OK_SUMMARY,
+            "severity": "OK",
+            "issues": ["No issues detected"],
+            "issue_codes": [],
+            "recommendations": ["Continue monitoring"],
+            "metrics_summary": metrics_summary,
+            "timestamp": "{}"
+        })
     
     # Analyze Capacity Issues
-    if "error" not in capacity:
-        capacity_status = capacity.get("status", "UNKNOWN")
-        used_percent = capacity.get("used_percent", 0)
-        free_gb = capacity.get("free_gb", 0)
-        
+    if capacity_ok:
         if capacity_status == "CRITICAL":
-            issues.append(f"CRITICAL: Disk usage at {used_percent:.2f}% - Only {free_gb:.2f} GB free")
-            recommendations.append("Immediate action required: Free up disk space or expand storage")
-            recommendations.append("Consider: Removing old logs, temporary files, or unused data")
-            recommendations.append("Consider: Adding additional storage capacity")
-            severity_levels.append("CRITICAL")
+            issue_codes.append("CAPACITY_CRITICAL")
+            issues.append(f"CRITICAL: Disk usage at {used_percent:.2f}% - Only {capacity.get('free_gb', 0):.2f} GB free")
+            worst_severity = _SEVERITY_CRITICAL
         elif capacity_status == "WARNING":
+            issue_codes.append("CAPACITY_WARNING")
             issues.append(f"WARNING: Disk usage at {used_percent:.2f}% - Monitor closely")
-            recommendations.append("Plan for disk cleanup or expansion in near future")
-            severity_levels.append("WARNING")
+            worst_severity = max(worst_severity, _SEVERITY_WARNING)
     else:
+        issue_codes.append("CAPACITY_CHECK_FAILED")
         issues.append(f"Capacity check failed: {capacity.get('error', 'Unknown error')}")
-        severity_levels.append("WARNING")
+        worst_severity = max(worst_severity, _SEVERITY_WARNING)
     
     # Analyze IOPS Issues
-    if "error" not in iops:
-        iops_status = iops.get("status", "UNKNOWN")
-        total_iops = iops.get("total_iops", 0)
-        
+    if iops_ok:
         if iops_status == "DEGRADED":
+            issue_codes.append("IOPS_DEGRADED")
             issues.append(f"DEGRADED: Low IOPS detected ({total_iops:.2f} IOPS)")
-            recommendations.append("Investigate disk I/O bottlenecks")
-            recommendations.append("Check for: High I/O wait times, disk queue depth, or I/O scheduler issues")
-            recommendations.append("Consider: Upgrading to faster storage (SSD) or optimizing I/O patterns")
-            severity_levels.append("WARNING")
+            worst_severity = max(worst_severity, _SEVERITY_WARNING)
         elif total_iops < 50:
+            issue_codes.append("IOPS_VERY_LOW")
             issues.append(f"Very low IOPS: {total_iops:.2f} - System may be idle or experiencing issues")
-            recommendations.append("Verify system is under normal load")
-            severity_levels.append("WARNING")
+            worst_severity = max(worst_severity, _SEVERITY_WARNING)
     else:
+        issue_codes.append("IOPS_CHECK_FAILED")
         issues.append(f"IOPS check failed: {iops.get('error', 'Unknown error')}")
-        severity_levels.append("WARNING")
+        worst_severity = max(worst_severity, _SEVERITY_WARNING)
     
     # Analyze Latency Issues
-    if "error" not in latency:
-        latency_status = latency.get("status", "UNKNOWN")
-        avg_read_latency = latency.get("avg_read_latency_ms", 0)
-        avg_write_latency = latency.get("avg_write_latency_ms", 0)
-        max_latency = max(avg_read_latency, avg_write_latency)
-        
+    if latency_ok:
         if latency_status == "CRITICAL":
+            issue_codes.append("LATENCY_CRITICAL")
             issues.append(f"CRITICAL: High latency detected (Read: {avg_read_latency:.2f}ms, Write: {avg_write_latency:.2f}ms)")
-            recommendations.append("Immediate action: Investigate disk performance issues")
-            recommendations.append("Check for: Disk fragmentation, failing hardware, or overloaded storage")
-            recommendations.append("Consider: Replacing failing disks or redistributing I/O load")
-            severity_levels.append("CRITICAL")
+            worst_severity = _SEVERITY_CRITICAL
         elif latency_status == "WARNING":
+            issue_codes.append("LATENCY_WARNING")
             issues.append(f"WARNING: Elevated latency (Read: {avg_read_latency:.2f}ms, Write: {avg_write_latency:.2f}ms)")
-            recommendations.append("Monitor latency trends and investigate if it persists")
-            severity_levels.append("WARNING")
+            worst_severity = max(worst_severity, _SEVERITY_WARNING)
     else:
+        issue_codes.append("LATENCY_CHECK_FAILED")
         issues.append(f"Latency check failed: {latency.get('error', 'Unknown error')}")
-        severity_levels.append("WARNING")
+        worst_severity = max(worst_severity, _SEVERITY_WARNING)
+    
+    recommendations = [
+        recommendation for code in issue_codes for recommendation in _ISSUE_RECOMMENDATIONS[code]
+    ]
     
     # Determine overall severity
-    if "CRITICAL" in severity_levels:
-        overall_severity = "CRITICAL"
-    elif "WARNING" in severity_levels:
-        overall_severity = "WARNING"
-    else:
-        overall_severity = "OK"
+    overall_severity = _SEVERITY_NAMES[worst_severity]
     
     # Generate summary
     if overall_severity == "OK":
-        summary = "Storage system is operating normally. All metrics are within acceptable ranges."
+        summary = _OK_SUMMARY
     elif overall_severity == "WARNING":
         summary = f"Storage system shows {len(issues)} warning(s). Monitor closely and take preventive action."
     else:
         summary = f"Storage system has CRITICAL issues. Immediate action required. {len(issues)} critical issue(s) detected."
     
-    # Build metrics summary
-    metrics_summary = {
-        "capacity": {
-            "status": capacity.get("status", "UNKNOWN") if "error" not in capacity else "ERROR",
-            "used_percent": capacity.get("used_percent", 0) if "error" not in capacity else None
-        },
-        "iops": {
-            "status": iops.get("status", "UNKNOWN") if "error" not in iops else "ERROR",
-            "total_iops": iops.get("total_iops", 0) if "error" not in iops else None
-        },
-        "latency": {
-            "status": latency.get("status", "UNKNOWN") if "error" not in latency else "ERROR",
-            "max_latency_ms": max(
-                latency.get("avg_read_latency_ms", 0),
-                latency.get("avg_write_latency_ms", 0)
-            ) if "error" not in latency else None
-        }
-    }
-    
     # Build result
     result = {
         "summary": summary,
         "severity": overall_severity,
         "issues": issues if issues else ["No issues detected"],
+        "issue_codes": issue_codes,
         "recommendations": recommendations if recommendations else ["Continue monitoring"],
         "metrics_summary": metrics_summary,
-        "timestamp": json.dumps({})  # Could add actual timestamp if needed
+        "timestamp": "{}"  # Could add actual timestamp if needed
     }
     
-    return json.dumps(result, indent=2)
+    return dumps_result(result)
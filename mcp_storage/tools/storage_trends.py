@@ -3,10 +3,27 @@ Storage Trends Tool
 Monitor storage trends over time by taking multiple samples.
 """
 
-import json
 import time
 import psutil
 
+from ._diskstats import read_disk_totals
+from ._jsonio import dumps_result
+
+BYTES_PER_GB = 1 << 30
+
+
+def _read_io_totals():
+    """Read whole-disk I/O totals from /proc/diskstats, falling back to psutil off Linux."""
+    return read_disk_totals() or psutil.disk_io_counters()
+
+
+def _fitted_slope(values: list, mean: float) -> float:
+    """Least-squares slope of values against their sample index (needs at least 2 values)."""
+    n = len(values)
+    center = (n - 1) / 2
+    # Sum of (i - center)^2 over i = 0..n-1 has the closed form n(n^2 - 1)/12
+    return sum((i - center) * (value - mean) for i, value in enumerate(values)) / (n * (n * n - 1) / 12)
+
 
 def get_storage_trends(mount_point: str = "/", samples: int = 5, interval_sec: float = 1.0) -> str:
     """
@@ -34,33 +51,39 @@ def get_storage_trends(mount_point: str = "/", samples: int = 5, interval_sec: f
     """
     try:
         sample_data = []
-        initial_io = psutil.disk_io_counters()
+        previous_io = None
+        previous_at = 0.0
+        # Samples are scheduled on absolute monotonic deadlines so sleep overshoot does not accumulate
+        deadline = time.monotonic()
         
         for i in range(samples):
             # Get disk usage
             disk_usage = psutil.disk_usage(mount_point)
-            used_gb = disk_usage.used / (1024 ** 3)
+            used_gb = disk_usage.used / BYTES_PER_GB
             used_percent = disk_usage.percent
             
-            # Get I/O counters
-            current_io = psutil.disk_io_counters()
-            if current_io and initial_io:
-                read_count = current_io.read_count - initial_io.read_count
-                write_count = current_io.write_count - initial_io.write_count
-                total_iops = (read_count + write_count) / (interval_sec * (i + 1)) if i > 0 else 0
+            # Get I/O counters; IOPS covers the measured time since the previous sample
+            # (the first sample has no interval yet)
+            current_io = _read_io_totals()
+            sampled_at = time.monotonic()
+            if current_io and previous_io and sampled_at > previous_at:
+                io_ops = (current_io.read_count - previous_io.read_count) + (current_io.write_count - previous_io.write_count)
+                total_iops = io_ops / (sampled_at - previous_at)
             else:
                 total_iops = 0
+            previous_io, previous_at = current_io, sampled_at
             
             sample_data.append({
                 "sample": i + 1,
                 "timestamp": time.time(),
                 "used_gb": round(used_gb, 2),
                 "used_percent": round(used_percent, 2),
-                "iops": round(total_iops, 2) if i > 0 else 0
+                "iops": round(total_iops, 2)
             })
             
             if i < samples - 1:
-                time.sleep(interval_sec)
+                deadline += interval_sec
+                time.sleep(max(0.0, deadline - time.monotonic()))
         
         # Analyze trend
         usage_values = [s["used_percent"] for s in sample_data]
@@ -68,12 +91,10 @@ def get_storage_trends(mount_point: str = "/", samples: int = 5, interval_sec: f
         max_usage = max(usage_values)
         min_usage = min(usage_values)
         
-        # Determine trend
+        # Determine trend from the least-squares line through the samples: its change over the
+        # whole window is less noisy than comparing the means of the two halves
         if len(usage_values) >= 2:
-            first_half = sum(usage_values[:len(usage_values)//2]) / (len(usage_values)//2)
-            second_half = sum(usage_values[len(usage_values)//2:]) / (len(usage_values) - len(usage_values)//2)
-            
-            diff = second_half - first_half
+            diff = _fitted_slope(usage_values, avg_usage) * (len(usage_values) - 1)
             if diff > 0.1:
                 trend = "INCREASING"
             elif diff < -0.1:
@@ -95,7 +116,7 @@ def get_storage_trends(mount_point: str = "/", samples: int = 5, interval_sec: f
             "message": f"Storage trend: {trend} (Avg: {avg_usage:.2f}%, Range: {min_usage:.2f}% - {max_usage:.2f}%)"
         }
         
-        return json.dumps(result, indent=2)
+        return dumps_result(result)
     
     except Exception as e:
         error_result = {
@@ -103,4 +124,4 @@ def get_storage_trends(mount_point: str = "/", samples: int = 5, interval_sec: f
             "mount_point": mount_point,
             "message": f"Failed to get storage trends for {mount_point}: {str(e)}"
         }
-        return json.dumps(error_result, indent=2)
+        return dumps_result(error_result)
@@ -3,8 +3,55 @@ Swap Space Tool
 Monitor swap space usage and statistics.
 """
 
-import json
+import bisect
 import psutil
+import time
+from typing import Optional, Tuple
+
+from ._jsonio import dumps_result
+
+BYTES_PER_GB = 1 << 30
+
+# used_percent thresholds for WARNING and CRITICAL (inclusive)
+_USED_PERCENT_THRESHOLDS = (60, 80)
+_STATUS_LEVELS = ("OK", "WARNING", "CRITICAL")
+
+# Swap figures are reused for this long, so tools polled together in one tick parse /proc once
+SWAP_CACHE_TTL_SEC = 0.25
+
+# psutil reports swapped-in/out amounts in bytes, counting 4 KiB per page
+_SWAP_PAGE_BYTES = 4 * 1024
+
+# (sampled_at, (total, free, sin, sout)) from the last /proc read
+_SWAP_CACHE: Optional[Tuple[float, Tuple[int, int, int, int]]] = None
+
+
+def _read_swap_stats() -> Optional[Tuple[int, int, int, int]]:
+    """Return (total, free, sin, sout) in bytes from /proc/meminfo and /proc/vmstat, or None off Linux."""
+    global _SWAP_CACHE
+    now = time.monotonic()
+    if _SWAP_CACHE and now - _SWAP_CACHE[0] < SWAP_CACHE_TTL_SEC:
+        return _SWAP_CACHE[1]
+    
+    try:
+        meminfo = {}
+        with open("/proc/meminfo") as f:
+            for line in f:
+                if line.startswith("Swap"):
+                    key, value = line.split(":", 1)
+                    meminfo[key] = int(value.split()[0]) * 1024  # Values are in kB
+        vmstat = {}
+        with open("/proc/vmstat") as f:
+            for line in f:
+                if line.startswith("pswp"):
+                    key, value = line.split()
+                    vmstat[key] = int(value) * _SWAP_PAGE_BYTES
+        stats = (meminfo["SwapTotal"], meminfo["SwapFree"], vmstat.get("pswpin", 0), vmstat.get("pswpout", 0))
+    except (OSError, ValueError, KeyError):
+        return None
+    
+    _SWAP_CACHE = (now, stats)
+    return stats
 
 
 def get_swap_usage() -> str:
@@ -28,20 +75,22 @@ def get_swap_usage() -> str:
         "OK"
     """
     try:
-        swap = psutil.swap_memory()
+        stats = _read_swap_stats()
+        if stats is not None:
+            total, free, sin, sout = stats
+            used = total - free
+            used_percent = round(used / total * 100, 1) if total else 0.0
+        else:
+            swap = psutil.swap_memory()
+            total, used, free, sin, sout = swap.total, swap.used, swap.free, swap.sin, swap.sout
+            used_percent = swap.percent
         
-        total_gb = swap.total / (1024 ** 3)
-        used_gb = swap.used / (1024 ** 3)
-        free_gb = swap.free / (1024 ** 3)
-        used_percent = swap.percent
+        total_gb = total / BYTES_PER_GB
+        used_gb = used / BYTES_PER_GB
+        free_gb = free / BYTES_PER_GB
         
-        # Determine status
-        if used_percent >= 80:
-            status = "CRITICAL"
-        elif used_percent >= 60:
-            status = "WARNING"
-        else:
-            status = "OK"
+        # Determine status (WARNING at >= 60%, CRITICAL at >= 80%)
+        status = _STATUS_LEVELS[bisect.bisect_right(_USED_PERCENT_THRESHOLDS, used_percent)]
         
         result = {
             "total_gb": round(total_gb, 2),
@@ -49,16 +98,16 @@ def get_swap_usage() -> str:
             "free_gb": round(free_gb, 2),
             "used_percent": round(used_percent, 2),
             "status": status,
-            "sin": swap.sin,  # Pages swapped in
-            "sout": swap.sout,  # Pages swapped out
+            "sin": sin,  # Pages swapped in
+            "sout": sout,  # Pages swapped out
             "message": f"Swap usage: {used_percent:.2f}% ({used_gb:.2f} GB used of {total_gb:.2f} GB total)"
         }
         
-        return json.dumps(result, indent=2)
+        return dumps_result(result)
     
     except Exception as e:
         error_result = {
             "error": str(e),
             "message": f"Failed to get swap usage: {str(e)}"
         }
-        return json.dumps(error_result, indent=2)
+        return dumps_result(error_result)
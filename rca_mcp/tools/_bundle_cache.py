@@ -0,0 +1,60 @@
+"""
+Bundle Result Cache
+Reuse a log tool's result while the RCA bundle directory it was computed from is unchanged.
+"""
+
+import os
+import threading
+from functools import wraps
+from typing import Tuple
+
+# Results kept per tool; app.py runs every tool and then analyze_logs on the same bundle,
+# so even a small cache turns the second round into lookups
+BUNDLE_CACHE_SIZE = 32
+
+
+def bundle_signature(logs_path: str) -> Tuple:
+    """Identify the current contents of a bundle directory by its files' names, inodes, sizes and mtimes."""
+    signature = []
+    with os.scandir(logs_path) as entries:
+        for entry in entries:
+            stat = entry.stat()
+            signature.append((entry.name, stat.st_ino, stat.st_size, stat.st_mtime_ns))
+    return tuple(sorted(signature))
+
+
+def bundle_cached(build):
+    """
+    Cache a build_* function's result dict per (logs_path, arguments, bundle_signature).
+    
+    A changed, added or removed file changes the signature, so stale results are never
+    returned. Error results are not cached. Cached dicts are shared between callers and
+    must not be mutated.
+    """
+    cache = {}
+    lock = threading.Lock()
+    
+    @wraps(build)
+    def wrapper(logs_path, *args, **kwargs):
+        try:
+            signature = bundle_signature(logs_path)
+        except OSError:
+            # Missing or unreadable directory: let the tool report it
+            return build(logs_path, *args, **kwargs)
+        
+        key = (logs_path, args, tuple(sorted(kwargs.items())), signature)
+        with lock:
+            result = cache.get(key)
+        if result is not None:
+            return result
+        
+        result = build(logs_path, *args, **kwargs)
+        if 'error' not in result:
+            with lock:
+                if len(cache) >= BUNDLE_CACHE_SIZE:
+                    # Evict the oldest entry (dicts keep insertion order)
+                    cache.pop(next(iter(cache)))
+                cache[key] = result
+        return result
+    
+    return wrapper
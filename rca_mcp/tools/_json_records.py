@@ -0,0 +1,70 @@
+"""
+Bundle JSON Reader
+Iterate the records of an RCA bundle's errors.json or timeline.json, streaming large files with ijson and parsing the rest with orjson when they are installed.
+"""
+
+import json
+import os
+from typing import Any, Iterator
+
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Files larger than this are parsed incrementally (when ijson is available) instead of
+# being loaded whole with json.load
+STREAM_MIN_BYTES = 1_000_000
+
+
+def iter_records(json_file: str, key: str) -> Iterator[Any]:
+    """
+    Yield the records of a bundle JSON file such as errors.json or timeline.json.
+    
+    The file holds either {key: [...]} or a bare list of records; anything else yields
+    nothing. Malformed JSON raises json.JSONDecodeError in both the streaming and the
+    json.load path.
+    """
+    if IJSON_AVAILABLE and os.path.getsize(json_file) > STREAM_MIN_BYTES:
+        yield from _stream_records(json_file, key)
+        return
+    
+    data = _load_json(json_file)
+    records = data.get(key, []) if isinstance(data, dict) else data
+    if isinstance(records, list):
+        yield from records
+
+
+def _load_json(json_file: str) -> Any:
+    """Parse a whole JSON file, with orjson when it is available."""
+    if not ORJSON_AVAILABLE:
+        with open(json_file, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    
+    with open(json_file, 'rb') as f:
+        raw = f.read()
+    try:
+        return orjson.loads(raw)
+    except orjson.JSONDecodeError:
+        # orjson rejects some input json accepts (NaN, integers beyond 64 bits); json.loads
+        # either parses it or raises the error json.load would have
+        return json.loads(raw.decode('utf-8'))
+
+
+def _stream_records(json_file: str, key: str) -> Iterator[Any]:
+    """Yield the records one at a time with ijson, holding only the current record in memory."""
+    with open(json_file, 'rb') as f:
+        # The first non-blank byte tells a bare list from a {key: [...]} object
+        prefix = 'item' if f.read(4096).lstrip(b'\xef\xbb\xbf \t\r\n')[:1] == b'[' else f'{key}.item'
+        f.seek(0)
+        try:
+            yield from ijson.items(f, prefix, use_float=True)
+        except ijson.JSONError as e:
+            raise json.JSONDecodeError(str(e), '', 0) from e
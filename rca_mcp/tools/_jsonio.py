@@ -0,0 +1,26 @@
+"""
+JSON Output Helper
+Serialize tool results, using orjson when it is installed.
+"""
+
+import json
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+    # Datetimes are passed to default=str like stdlib json does, so the output does not
+    # depend on which serializer ran
+    _ORJSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def dumps_result(obj) -> str:
+    """Serialize a tool result as 2-space indented JSON, stringifying unknown types (orjson when available)."""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(obj, default=str, option=_ORJSON_OPTIONS).decode()
+        except TypeError:
+            # e.g. integers beyond 64 bits, which stdlib json still handles
+            pass
+    return json.dumps(obj, indent=2, default=str)
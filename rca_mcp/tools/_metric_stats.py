@@ -0,0 +1,37 @@
+"""
+Metric Statistics Helper
+Summarize metric values (min/max/mean and order statistics such as p95), vectorized with NumPy when it is installed.
+"""
+
+from typing import List, Sequence, Tuple
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+
+def order_statistics(values: Sequence[float], ranks: Sequence[int]) -> List[float]:
+    """
+    Return sorted(values)[rank] for each rank.
+    
+    With NumPy the ranks are selected by np.partition (introselect) instead of sorting the
+    whole list; the values returned are the same either way.
+    """
+    if not ranks:
+        return []
+    if NUMPY_AVAILABLE:
+        partitioned = np.partition(np.asarray(values, dtype=np.float64), ranks)
+        return [float(partitioned[rank]) for rank in ranks]
+    sorted_values = sorted(values)
+    return [sorted_values[rank] for rank in ranks]
+
+
+def min_max_mean(values: Sequence[float]) -> Tuple[float, float, float]:
+    """Return the min, max and mean of non-empty values (one C loop each with NumPy)."""
+    if NUMPY_AVAILABLE:
+        # array('d') buffers are viewed in place rather than converted element by element
+        array_values = np.asarray(values, dtype=np.float64)
+        return float(array_values.min()), float(array_values.max()), float(array_values.mean())
+    return min(values), max(values), sum(values) / len(values)
@@ -0,0 +1,63 @@
+"""
+Parallel Log Scanning
+Run a tool's per-file log scan in worker processes when a bundle has enough log data to be worth it.
+"""
+
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Callable, List, Sequence
+
+# Below this much log data, starting worker processes costs more than it saves
+PARALLEL_SCAN_MIN_BYTES = 8 << 20
+
+# Files are handed to workers in about this many batches per worker, so a few large
+# files still spread out while many small ones do not cost a round trip each
+PARALLEL_SCAN_BATCHES_PER_WORKER = 4
+
+# Workers are started from a clean server process rather than forked: the tools run inside
+# multi-threaded hosts (Streamlit sessions, cache and logging locks, Kubernetes client
+# pools), and a forked child can deadlock on a lock another thread held at fork time.
+# "forkserver" is POSIX-only; "spawn" works everywhere
+PARALLEL_SCAN_START_METHODS = ("forkserver", "spawn")
+
+
+def scan_files(scan: Callable, files: Sequence[Sequence]) -> List:
+    """
+    Return [scan(*args) for args in files], in worker processes when there is enough to scan.
+    
+    The first item of each args tuple is the file's path. scan must be a module-level
+    function and should not raise for one bad file, since that would abort the whole map.
+    """
+    total_bytes = 0
+    for args in files:
+        try:
+            total_bytes += os.path.getsize(args[0])
+        except OSError:
+            pass
+    
+    workers = min(len(files), os.cpu_count() or 1)
+    if workers > 1 and total_bytes >= PARALLEL_SCAN_MIN_BYTES:
+        # The per-line regex work is CPU-bound, so files are spread over processes
+        # rather than threads; map() keeps the results in file order, which the callers'
+        # merges depend on
+        chunksize = max(1, len(files) // (workers * PARALLEL_SCAN_BATCHES_PER_WORKER))
+        try:
+            with ProcessPoolExecutor(max_workers=workers, mp_context=_start_context()) as executor:
+                return list(executor.map(scan, *zip(*files), chunksize=chunksize))
+        except (OSError, ValueError, BrokenProcessPool):
+            # Process pools (or a safe start method) are unavailable in some sandboxes;
+            # scan in this process instead
+            pass
+    
+    return [scan(*args) for args in files]
+
+
+def _start_context():
+    """Return the multiprocessing context for scan workers (ValueError if no safe start method exists)."""
+    available = multiprocessing.get_all_start_methods()
+    for method in PARALLEL_SCAN_START_METHODS:
+        if method in available:
+            return multiprocessing.get_context(method)
+    raise ValueError(f"none of the start methods {PARALLEL_SCAN_START_METHODS} is available")
@@ -3,12 +3,67 @@ Error Patterns Analysis Tool
 Analyzes error patterns and correlations from logs
 """
 
-import json
 import os
 import re
-from typing import Dict, List, Optional
-from collections import defaultdict, Counter
-from datetime import datetime
+import string
+from typing import Dict, List, Optional, Tuple
+from collections import defaultdict, namedtuple, Counter
+from datetime import datetime, timezone
+from functools import lru_cache
+
+from ._bundle_cache import bundle_cached
+from ._json_records import iter_records
+from ._jsonio import dumps_result
+from ._parallel_scan import scan_files
+
+# One error found in a log file (line is its 1-based line number) or in errors.json (line is None);
+# a tuple instead of a dict per event keeps large bundles' event lists compact
+ErrorEvent = namedtuple('ErrorEvent', 'service level message line timestamp has_stack_trace')
+
+# "<service>.log", "<service>-current.log" and "<service>-previous.log" all belong to <service>
+SERVICE_LOG_SUFFIX_PATTERN = re.compile(r'(?:-current|-previous)?\.log$')
+
+# Only this many leading characters of a log line are searched for errors
+LINE_SCAN_CHARS = 512
+
+# Error level and message of a log line; the message capture stops at the 200 characters
+# that are kept instead of copying the rest of (possibly multi-KB) lines. The line-level
+# patterns are matched against the lowercased line rather than with re.IGNORECASE
+ERROR_PATTERN = re.compile(r'(error|fatal|critical)[^:\n]*:\s*(.{1,200})')
+
+STACK_TRACE_PATTERN = re.compile(r'(?:traceback|exception|error):')
+
+# Lowercases ASCII letters only, so the result has the same length as the input
+_ASCII_LOWERCASE = str.maketrans(string.ascii_uppercase, string.ascii_lowercase)
+
+TIMESTAMP_PATTERN = re.compile(r'(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(?:\.\d+)?Z?)')
+
+# Message normalization for clustering (on lowercased messages): UUIDs become UUID and
+# other numbers N, in one pass so digits inside a UUID are not rewritten before it is seen
+NORMALIZE_PATTERN = re.compile(
+    r'(?P<UUID>[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12})|\d+'
+)
+
+
+# Error categories in priority order: a message gets the first category whose keywords it contains
+ERROR_CATEGORIES = {
+    'TIMEOUT': r'timeout|timed out|deadline exceeded',
+    'CONNECTION': r'connection|network|socket',
+    'VALIDATION': r'validation|invalid|bad request',
+    'AUTHENTICATION': r'auth|unauthorized|forbidden|permission',
+    'RESOURCE': r'resource|not found|404|500',
+    'DATABASE': r'database|db|sql|query',
+    'MEMORY': r'memory|oom|out of memory',
+    'CRASH': r'crash|failed|terminated|restore',
+    'NAME_ERROR': r'name.*not defined|undefined'
+}
+
+# All categories in one regex so a (lowercased) message is classified by a single match call.
+# Each branch looks ahead through the whole message and then captures an empty named group,
+# so branches are tried in priority order (not leftmost keyword) and lastgroup names the category
+CATEGORY_PATTERN = re.compile(
+    '|'.join(rf'(?=[\s\S]*?(?:{keywords}))(?P<{name}>)' for name, keywords in ERROR_CATEGORIES.items())
+)
 
 
 def analyze_error_patterns(logs_path: str) -> str:
@@ -32,147 +87,86 @@ def analyze_error_patterns(logs_path: str) -> str:
         >>> data = json.loads(result)
         >>> print(data["error_categories"])
     """
+    return dumps_result(build_error_patterns(logs_path))
+
+
+@bundle_cached
+def build_error_patterns(logs_path: str) -> Dict:
+    """Build the analyze_error_patterns result (or its error result) as a dict."""
     try:
-        # Load errors.json if available
-        errors_data = []
-        errors_file = os.path.join(logs_path, "errors.json")
-        if os.path.exists(errors_file):
-            with open(errors_file, 'r', encoding='utf-8') as f:
-                errors_json = json.load(f)
-                errors_data = errors_json.get('errors', []) if isinstance(errors_json, dict) else errors_json
-        
         # Extract errors from log files
-        error_pattern = re.compile(r'(ERROR|FATAL|CRITICAL)[^:]*:\s*(.+)', re.IGNORECASE)
-        stack_trace_pattern = re.compile(r'(Traceback|Exception|Error):', re.IGNORECASE)
+        log_files = []
+        with os.scandir(logs_path) as entries:
+            for entry in entries:
+                if entry.name.endswith('.log') and entry.is_file():
+                    service_name = SERVICE_LOG_SUFFIX_PATTERN.sub('', entry.name)
+                    log_files.append((entry.path, service_name))
         
         error_events = []
-        service_errors = defaultdict(list)
-        
-        # Process log files
-        for file in os.listdir(logs_path):
-            if file.endswith('.log'):
-                filepath = os.path.join(logs_path, file)
-                service_name = file.replace('-current.log', '').replace('-previous.log', '').replace('.log', '')
-                
-                try:
-                    with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-                        lines = f.readlines()
-                    
-                    for line_num, line in enumerate(lines, 1):
-                        # Check for error messages
-                        error_match = error_pattern.search(line)
-                        if error_match:
-                            error_level = error_match.group(1).upper()
-                            error_message = error_match.group(2).strip()[:200]  # Truncate
-                            
-                            error_events.append({
-                                'service': service_name,
-                                'level': error_level,
-                                'message': error_message,
-                                'line': line_num,
-                                'timestamp': _extract_timestamp(line),
-                                'has_stack_trace': bool(stack_trace_pattern.search(line))
-                            })
-                            
-                            service_errors[service_name].append({
-                                'message': error_message,
-                                'timestamp': _extract_timestamp(line)
-                            })
-                
-                except Exception:
-                    continue
+        for file_events in scan_files(_scan_log_file, log_files):
+            error_events.extend(file_events)
         
-        # Merge with errors.json data
+        # Merge with errors.json data if available
+        errors_file = os.path.join(logs_path, "errors.json")
+        errors_data = iter_records(errors_file, 'errors') if os.path.exists(errors_file) else []
         for error in errors_data:
             if isinstance(error, dict):
-                error_events.append({
-                    'service': error.get('service', 'unknown'),
-                    'level': 'ERROR',
-                    'message': error.get('message', '')[:200],
-                    'category': error.get('category'),
-                    'timestamp': error.get('timestamp') or error.get('time'),
-                    'request_id': error.get('request_id')
-                })
+                error_events.append(ErrorEvent(
+                    service=error.get('service', 'unknown'),
+                    level='ERROR',
+                    message=error.get('message', '')[:200],
+                    line=None,
+                    timestamp=error.get('timestamp') or error.get('time'),
+                    has_stack_trace=False
+                ))
         
-        # Analyze patterns
-        error_categories = Counter()
-        error_messages = Counter()
-        service_error_counts = Counter()
-        error_time_distribution = defaultdict(int)
-        error_sequences = []
+        # Analyze patterns over per-field columns so counting happens in Counter's C loop
+        services = [event.service for event in error_events]
+        messages = [event.message for event in error_events]
+        timestamps = [event.timestamp for event in error_events]
+        dts = [_parse_timestamp(ts) if isinstance(ts, str) else None for ts in timestamps]
         
-        # Extract error categories
-        category_patterns = {
-            'TIMEOUT': re.compile(r'timeout|timed out|deadline exceeded', re.IGNORECASE),
-            'CONNECTION': re.compile(r'connection|network|socket', re.IGNORECASE),
-            'VALIDATION': re.compile(r'validation|invalid|bad request', re.IGNORECASE),
-            'AUTHENTICATION': re.compile(r'auth|unauthorized|forbidden|permission', re.IGNORECASE),
-            'RESOURCE': re.compile(r'resource|not found|404|500', re.IGNORECASE),
-            'DATABASE': re.compile(r'database|db|sql|query', re.IGNORECASE),
-            'MEMORY': re.compile(r'memory|oom|out of memory', re.IGNORECASE),
-            'CRASH': re.compile(r'crash|failed|terminated|restore', re.IGNORECASE),
-            'NAME_ERROR': re.compile(r'name.*not defined|undefined', re.IGNORECASE)
-        }
+        service_error_counts = Counter(services)
+        error_messages = Counter(messages)
         
-        for event in error_events:
-            service = event['service']
-            message = event['message']
-            timestamp = event.get('timestamp')
-            
-            service_error_counts[service] += 1
-            error_messages[message] += 1
-            
-            # Categorize error
-            category = 'UNKNOWN'
-            for cat_name, pattern in category_patterns.items():
-                if pattern.search(message):
-                    category = cat_name
-                    break
-            error_categories[category] += 1
-            
-            # Time distribution
-            if timestamp:
-                try:
-                    dt = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
-                    hour_key = dt.strftime('%Y-%m-%d %H:00')
-                    error_time_distribution[hour_key] += 1
-                except:
-                    pass
+        # Categorize each distinct message once and weight it by its count
+        error_categories = Counter()
+        for message, count in error_messages.items():
+            category_match = CATEGORY_PATTERN.match(message.lower())
+            error_categories[category_match.lastgroup if category_match else 'UNKNOWN'] += count
+        
+        # Time distribution
+        error_time_distribution = Counter(dt.strftime('%Y-%m-%d %H:00') for dt in dts if dt is not None)
         
         # Find error sequences (errors happening close together)
+        error_sequences = []
         if len(error_events) > 1:
+            # Ordered by parsed time (ties by service), not by timestamp string, so
+            # timestamps with and without a zone suffix sort correctly
             sorted_events = sorted(
-                [e for e in error_events if e.get('timestamp')],
-                key=lambda x: x.get('timestamp', '')
+                [(dt, service, message) for dt, service, message in zip(dts, services, messages) if dt is not None],
+                key=_event_sort_key
             )
             
-            for i in range(len(sorted_events) - 1):
-                current = sorted_events[i]
-                next_event = sorted_events[i + 1]
+            for (current_dt, current_service, current_message), (next_dt, next_service, next_message) in zip(
+                sorted_events, sorted_events[1:]
+            ):
+                time_diff = (next_dt - current_dt).total_seconds()
                 
-                if current.get('timestamp') and next_event.get('timestamp'):
-                    try:
-                        current_dt = datetime.fromisoformat(current['timestamp'].replace('Z', '+00:00'))
-                        next_dt = datetime.fromisoformat(next_event['timestamp'].replace('Z', '+00:00'))
-                        time_diff = (next_dt - current_dt).total_seconds()
-                        
-                        if time_diff < 10:  # Within 10 seconds
-                            error_sequences.append({
-                                'first_service': current['service'],
-                                'first_message': current['message'][:100],
-                                'second_service': next_event['service'],
-                                'second_message': next_event['message'][:100],
-                                'time_gap_seconds': round(time_diff, 2)
-                            })
-                    except:
-                        pass
+                if time_diff < 10:  # Within 10 seconds
+                    error_sequences.append({
+                        'first_service': current_service,
+                        'first_message': current_message[:100],
+                        'second_service': next_service,
+                        'second_message': next_message[:100],
+                        'time_gap_seconds': round(time_diff, 2)
+                    })
         
         # Error message clusters (similar messages)
         message_clusters = defaultdict(list)
         for message, count in error_messages.most_common(50):
             # Normalize message for clustering
-            normalized = re.sub(r'\d+', 'N', message.lower())
-            normalized = re.sub(r'[a-f0-9\-]{36}', 'UUID', normalized)  # Replace UUIDs
+            normalized = NORMALIZE_PATTERN.sub(_normalized_token, message.lower())
             message_clusters[normalized[:50]].append({'message': message[:100], 'count': count})
         
         # Build result
@@ -193,12 +187,12 @@ def analyze_error_patterns(logs_path: str) -> str:
             "root_cause_candidates": {
                 'most_frequent_category': error_categories.most_common(1)[0][0] if error_categories else None,
                 'most_affected_service': service_error_counts.most_common(1)[0][0] if service_error_counts else None,
-                'error_burst_time': max(error_time_distribution.items(), key=lambda x: x[1])[0] if error_time_distribution else None
+                'error_burst_time': error_time_distribution.most_common(1)[0][0] if error_time_distribution else None
             },
             "status": "OK"
         }
         
-        return json.dumps(result, indent=2, default=str)
+        return result
     
     except Exception as e:
         error_result = {
@@ -206,11 +200,75 @@ def analyze_error_patterns(logs_path: str) -> str:
             "message": f"Failed to analyze error patterns: {str(e)}",
             "logs_path": logs_path
         }
-        return json.dumps(error_result, indent=2)
+        return error_result
+
+
+def _scan_log_file(filepath: str, service_name: str) -> List[ErrorEvent]:
+    """Extract the error events of one log file (empty if the file cannot be read)."""
+    events = []
+    try:
+        # Stream the file instead of readlines() so only one line is held at a time
+        with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
+            for line_num, line in enumerate(f, 1):
+                # Timestamp and level sit at the start of a line; long payloads after them are not scanned
+                head = line[:LINE_SCAN_CHARS]
+                
+                # Most lines carry no error keyword; a substring check is far
+                # cheaper than running the regex on them
+                low = head.lower()
+                if 'error' not in low and 'fatal' not in low and 'critical' not in low:
+                    continue
+                # Without a ':' the regex would rescan the rest of the line from every keyword
+                if ':' not in head:
+                    continue
+                
+                if len(low) != len(head):
+                    # A few non-ASCII characters change length when lowercased; the
+                    # message is sliced from head by offsets into low, so keep them aligned
+                    low = head.translate(_ASCII_LOWERCASE)
+                
+                # Check for error messages
+                error_match = ERROR_PATTERN.search(low)
+                if error_match:
+                    error_level = error_match.group(1).upper()
+                    error_message = head[error_match.start(2):error_match.end(2)].strip()
+                    timestamp = _extract_timestamp(head)
+                    
+                    events.append(ErrorEvent(
+                        service=service_name,
+                        level=error_level,
+                        message=error_message,
+                        line=line_num,
+                        timestamp=timestamp,
+                        has_stack_trace=bool(STACK_TRACE_PATTERN.search(low))
+                    ))
+    except Exception:
+        return []
+    return events
+
+
+def _event_sort_key(row: Tuple) -> Tuple:
+    """Order a (dt, service, message) row by time, then service (as text: errors.json services can be null)."""
+    return row[0], str(row[1])
+
+
+def _normalized_token(match) -> str:
+    """Replacement for a NORMALIZE_PATTERN match: UUID for a UUID, N for any other number."""
+    return 'UUID' if match.lastgroup == 'UUID' else 'N'
+
+
+@lru_cache(maxsize=8192)
+def _parse_timestamp(timestamp: str) -> Optional[datetime]:
+    """Parse an ISO-8601 timestamp (a trailing Z, or no offset, means UTC), or None if it is not one."""
+    try:
+        dt = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
+    except ValueError:
+        return None
+    # Bundle timestamps are UTC; making them all aware keeps them comparable with each other
+    return dt if dt.tzinfo is not None else dt.replace(tzinfo=timezone.utc)
 
 
 def _extract_timestamp(line: str) -> Optional[str]:
     """Extract timestamp from log line."""
-    timestamp_pattern = re.compile(r'(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(?:\.\d+)?Z?)')
-    match = timestamp_pattern.search(line)
+    match = TIMESTAMP_PATTERN.search(line)
     return match.group(1) if match else None
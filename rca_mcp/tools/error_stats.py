@@ -3,12 +3,20 @@ Error Statistics Tool
 Extracts and analyzes error statistics from errors.json
 """
 
+import heapq
 import json
 import os
 from typing import Dict, List, Optional
-from collections import Counter, defaultdict
+from collections import Counter
 from datetime import datetime
 
+from ._bundle_cache import bundle_cached
+from ._json_records import iter_records
+from ._jsonio import dumps_result
+
+# Errors listed per hour in errors_by_time (all errors are still counted)
+ERRORS_PER_HOUR_SAMPLE = 5
+
 
 def get_error_statistics(logs_path: str) -> str:
     """
@@ -33,6 +41,12 @@ def get_error_statistics(logs_path: str) -> str:
         >>> data = json.loads(result)
         >>> print(data["total_errors"])
     """
+    return dumps_result(build_error_statistics(logs_path))
+
+
+@bundle_cached
+def build_error_statistics(logs_path: str) -> Dict:
+    """Build the get_error_statistics result (or its error result) as a dict."""
     try:
         errors_file = os.path.join(logs_path, "errors.json")
         
@@ -42,28 +56,21 @@ def get_error_statistics(logs_path: str) -> str:
                 "message": f"errors.json not found at: {errors_file}",
                 "logs_path": logs_path
             }
-            return json.dumps(error_result, indent=2)
-        
-        with open(errors_file, 'r', encoding='utf-8') as f:
-            errors_data = json.load(f)
-        
-        # Extract errors list
-        errors = errors_data.get('errors', []) if isinstance(errors_data, dict) else errors_data
-        if not isinstance(errors, list):
-            errors = []
+            return error_result
         
         # Initialize statistics
-        total_errors = len(errors)
+        total_errors = 0
         errors_by_category = Counter()
         errors_by_service = Counter()
-        errors_by_time = defaultdict(list)
-        error_messages = []
+        # (year, month, day, hour) -> [error count, first few errors of that hour]
+        errors_by_time = {}
+        message_counter = Counter()
         errors_by_severity = Counter()
         unique_requests = set()
-        timeline = []
+        first_timestamp = last_timestamp = None
         
-        # Process each error
-        for error in errors:
+        # Process each error as it is read, so large files are never held as a whole list
+        for error in iter_records(errors_file, 'errors'):
             category = error.get('category', 'UNKNOWN')
             service = error.get('service', 'unknown')
             message = error.get('message', '')
@@ -71,12 +78,17 @@ def get_error_statistics(logs_path: str) -> str:
             severity = error.get('severity', 'UNKNOWN')
             request_id = error.get('request_id', '')
             
+            total_errors += 1
+            if total_errors == 1:
+                first_timestamp = timestamp
+            last_timestamp = timestamp
+            
             errors_by_category[category] += 1
             errors_by_service[service] += 1
             errors_by_severity[severity] += 1
             
             if message:
-                error_messages.append(message)
+                message_counter[message] += 1
             
             if request_id:
                 unique_requests.add(request_id)
@@ -85,27 +97,22 @@ def get_error_statistics(logs_path: str) -> str:
             if timestamp:
                 try:
                     dt = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
-                    hour_key = dt.strftime('%Y-%m-%d %H:00')
-                    errors_by_time[hour_key].append({
-                        'timestamp': timestamp,
-                        'service': service,
-                        'category': category,
-                        'message': message[:200]  # Truncate long messages
-                    })
+                    # Bucket by the hour's fields; the label is formatted once per hour below
+                    # instead of for every error
+                    hour_key = (dt.year, dt.month, dt.day, dt.hour)
+                    hour_errors = errors_by_time.setdefault(hour_key, [0, []])
+                    hour_errors[0] += 1
+                    if len(hour_errors[1]) < ERRORS_PER_HOUR_SAMPLE:
+                        hour_errors[1].append({
+                            'timestamp': timestamp,
+                            'service': service,
+                            'category': category,
+                            'message': message[:200]  # Truncate long messages
+                        })
                 except:
                     pass
-            
-            timeline.append({
-                'timestamp': timestamp,
-                'service': service,
-                'category': category,
-                'severity': severity,
-                'message': message[:100] if message else '',
-                'request_id': request_id
-            })
         
         # Get top error messages
-        message_counter = Counter(error_messages)
         top_error_messages = [{'message': msg, 'count': count} 
                              for msg, count in message_counter.most_common(10)]
         
@@ -119,20 +126,27 @@ def get_error_statistics(logs_path: str) -> str:
             "top_error_messages": top_error_messages,
             "errors_by_time": {
                 hour: {
-                    'count': len(errors),
-                    'errors': errors[:5]  # Limit to first 5 per hour
+                    'count': count,
+                    'errors': errors
                 }
-                for hour, errors in sorted(errors_by_time.items())[:24]  # Last 24 hours
+                # First 24 hours in order; nsmallest keeps a 24-entry heap instead of sorting every hour
+                for hour, (count, errors) in heapq.nsmallest(
+                    24,
+                    (
+                        (datetime(*hour_key).strftime('%Y-%m-%d %H:00'), hour_errors)
+                        for hour_key, hour_errors in errors_by_time.items()
+                    )
+                )
             },
             "timeline_summary": {
-                'first_error': timeline[0]['timestamp'] if timeline else None,
-                'last_error': timeline[-1]['timestamp'] if timeline else None,
-                'error_count': len(timeline)
+                'first_error': first_timestamp,
+                'last_error': last_timestamp,
+                'error_count': total_errors
             },
             "status": "OK"
         }
         
-        return json.dumps(result, indent=2, default=str)
+        return result
     
     except json.JSONDecodeError as e:
         error_result = {
@@ -140,7 +154,7 @@ def get_error_statistics(logs_path: str) -> str:
             "message": f"Failed to parse errors.json: {str(e)}",
             "logs_path": logs_path
         }
-        return json.dumps(error_result, indent=2)
+        return error_result
     
     except Exception as e:
         error_result = {
@@ -148,4 +162,4 @@ def get_error_statistics(logs_path: str) -> str:
             "message": f"Failed to extract error statistics: {str(e)}",
             "logs_path": logs_path
         }
-        return json.dumps(error_result, indent=2)
+        return error_result
@@ -3,15 +3,15 @@ Log Analyzer Tool
 Comprehensive log analysis combining multiple data sources
 """
 
-import json
 import os
 from typing import Dict, Optional
-from .error_stats import get_error_statistics
-from .timeline_stats import get_timeline_statistics
-from .service_stats import get_service_statistics
-from .request_patterns import get_request_patterns
-from .error_patterns import analyze_error_patterns
-from .metadata_extractor import extract_metadata
+from .error_stats import build_error_statistics
+from .timeline_stats import build_timeline_statistics
+from .service_stats import build_service_statistics
+from .request_patterns import build_request_patterns
+from .error_patterns import build_error_patterns
+from .metadata_extractor import build_metadata
+from ._jsonio import dumps_result
 
 
 def analyze_logs(logs_path: str) -> str:
@@ -36,21 +36,14 @@ def analyze_logs(logs_path: str) -> str:
         >>> print(data["summary"])
     """
     try:
-        # Collect all analyses
-        metadata_str = extract_metadata(logs_path)
-        error_stats_str = get_error_statistics(logs_path)
-        timeline_stats_str = get_timeline_statistics(logs_path)
-        service_stats_str = get_service_statistics(logs_path)
-        request_patterns_str = get_request_patterns(logs_path)
-        error_patterns_str = analyze_error_patterns(logs_path)
-        
-        # Parse JSON results
-        metadata = json.loads(metadata_str)
-        error_stats = json.loads(error_stats_str)
-        timeline_stats = json.loads(timeline_stats_str)
-        service_stats = json.loads(service_stats_str)
-        request_patterns = json.loads(request_patterns_str)
-        error_patterns = json.loads(error_patterns_str)
+        # Collect all analyses as dicts; serializing each one only to parse it
+        # back here would be wasted work
+        metadata = build_metadata(logs_path)
+        error_stats = build_error_statistics(logs_path)
+        timeline_stats = build_timeline_statistics(logs_path)
+        service_stats = build_service_statistics(logs_path)
+        request_patterns = build_request_patterns(logs_path)
+        error_patterns = build_error_patterns(logs_path)
         
         # Build comprehensive summary
         summary = {
@@ -74,18 +67,14 @@ def analyze_logs(logs_path: str) -> str:
             )
         
         # Find most critical service
-        if 'errors_by_service' in error_stats and error_stats.get('errors_by_service'):
-            summary['most_critical_service'] = max(
-                error_stats['errors_by_service'].items(),
-                key=lambda x: x[1]
-            )[0] if error_stats['errors_by_service'] else None
+        errors_by_service = error_stats.get('errors_by_service')
+        if errors_by_service:
+            summary['most_critical_service'] = max(errors_by_service, key=errors_by_service.get)
         
-        # Find primary error category
-        if 'error_categories' in error_patterns and error_patterns.get('error_categories'):
-            summary['primary_error_category'] = max(
-                error_patterns['error_categories'].items(),
-                key=lambda x: x[1]
-            )[0] if error_patterns['error_categories'] else None
+        # Primary error category (already ranked by analyze_error_patterns with Counter.most_common)
+        root_cause_candidates = error_patterns.get('root_cause_candidates')
+        if root_cause_candidates:
+            summary['primary_error_category'] = root_cause_candidates['most_frequent_category']
         
         # Build comprehensive result
         result = {
@@ -99,15 +88,7 @@ def analyze_logs(logs_path: str) -> str:
             "status": "OK"
         }
         
-        return json.dumps(result, indent=2, default=str)
-    
-    except json.JSONDecodeError as e:
-        error_result = {
-            "error": "JSON decode error",
-            "message": f"Failed to parse analysis results: {str(e)}",
-            "logs_path": logs_path
-        }
-        return json.dumps(error_result, indent=2)
+        return dumps_result(result)
     
     except Exception as e:
         error_result = {
@@ -115,4 +96,4 @@ def analyze_logs(logs_path: str) -> str:
             "message": f"Failed to perform comprehensive log analysis: {str(e)}",
             "logs_path": logs_path
         }
-        return json.dumps(error_result, indent=2)
+        return dumps_result(error_result)
@@ -3,11 +3,12 @@ Metadata Extractor Tool
 Extracts metadata from metadata.txt file
 """
 
-import json
 import os
-import re
 from typing import Dict, Optional
 
+from ._bundle_cache import bundle_cached
+from ._jsonio import dumps_result
+
 
 def extract_metadata(logs_path: str) -> str:
     """
@@ -31,6 +32,12 @@ def extract_metadata(logs_path: str) -> str:
         >>> data = json.loads(result)
         >>> print(data["scenario_type"])
     """
+    return dumps_result(build_metadata(logs_path))
+
+
+@bundle_cached
+def build_metadata(logs_path: str) -> Dict:
+    """Build the extract_metadata result (or its error result) as a dict."""
     try:
         metadata_file = os.path.join(logs_path, "metadata.txt")
         
@@ -40,7 +47,7 @@ def extract_metadata(logs_path: str) -> str:
                 "message": f"metadata.txt not found at: {metadata_file}",
                 "logs_path": logs_path
             }
-            return json.dumps(error_result, indent=2)
+            return error_result
         
         # Read metadata file
         metadata = {}
@@ -51,18 +58,21 @@ def extract_metadata(logs_path: str) -> str:
                     continue
                 
                 # Parse key=value format
-                if '=' in line:
-                    key, value = line.split('=', 1)
-                    key = key.strip()
-                    value = value.strip()
-                    
-                    # Try to parse numeric values
-                    if value.isdigit():
-                        value = int(value)
-                    elif re.match(r'^\d+\.\d+$', value):
+                key, sep, value = line.partition('=')
+                if not sep:
+                    continue
+                key = key.strip()
+                value = value.strip()
+                
+                # Try to parse numeric values ("42" -> int, "1.5" -> float)
+                if value.isdecimal():
+                    value = int(value)
+                else:
+                    whole, dot, fraction = value.partition('.')
+                    if dot and whole.isdecimal() and fraction.isdecimal():
                         value = float(value)
-                    
-                    metadata[key] = value
+                
+                metadata[key] = value
         
         # Extract common fields
         result = {
@@ -76,7 +86,7 @@ def extract_metadata(logs_path: str) -> str:
             "status": "OK"
         }
         
-        return json.dumps(result, indent=2, default=str)
+        return result
     
     except Exception as e:
         error_result = {
@@ -84,4 +94,4 @@ def extract_metadata(logs_path: str) -> str:
             "message": f"Failed to extract metadata: {str(e)}",
             "logs_path": logs_path
         }
-        return json.dumps(error_result, indent=2)
+        return error_result
@@ -3,13 +3,43 @@ Request Patterns Tool
 Extracts request patterns and metrics from logs
 """
 
-import json
 import os
-import re
-from typing import Dict, List, Optional
-from collections import defaultdict, Counter
+from typing import Dict, List, Optional, Tuple
+from array import array
+from collections import namedtuple, Counter
 from datetime import datetime
 
+try:
+    # The third-party regex engine accepts these patterns unchanged and is roughly
+    # twice as fast as re at the per-line searches; re is used when it is not installed
+    import regex as re
+except ImportError:
+    import re
+
+from ._bundle_cache import bundle_cached
+from ._jsonio import dumps_result
+from ._parallel_scan import scan_files
+from ._metric_stats import min_max_mean, order_statistics
+from .error_patterns import SERVICE_LOG_SUFFIX_PATTERN
+
+# Patterns for extracting request data, compiled once per process; log markers are
+# ASCII, so \d, \s and IGNORECASE do not need Unicode tables
+# REQUEST_START and REQUEST_COMPLETE lines in one pattern, so a line is scanned once for
+# either marker (the shared "[REQUEST_" prefix is a fast literal scan for the engine)
+REQUEST_EVENT_PATTERN = re.compile(
+    r'\[REQUEST_(?:'
+    r'START\]\s+endpoint=(?P<start_endpoint>[^\s]+)\s+method=(?P<start_method>[A-Z]+)'
+    r'|COMPLETE\]\s+endpoint=(?P<endpoint>[^\s]+)\s+method=(?P<method>[A-Z]+)'
+    r'\s+duration_ms=(?P<duration>[\d.]+)\s+status=(?P<status>\d{3})'
+    r')',
+    re.ASCII
+)
+REQUEST_ID_PATTERN = re.compile(r'req=([a-f0-9\-]{36})', re.IGNORECASE | re.ASCII)
+
+# The parts of a request's first start and first complete line that the statistics use
+RequestStart = namedtuple('RequestStart', 'service endpoint method')
+RequestComplete = namedtuple('RequestComplete', 'service endpoint method duration_ms status')
+
 
 def get_request_patterns(logs_path: str) -> str:
     """
@@ -34,117 +64,58 @@ def get_request_patterns(logs_path: str) -> str:
         >>> data = json.loads(result)
         >>> print(data["total_requests"])
     """
+    return dumps_result(build_request_patterns(logs_path))
+
+
+@bundle_cached
+def build_request_patterns(logs_path: str) -> Dict:
+    """Build the get_request_patterns result (or its error result) as a dict."""
     try:
-        # Patterns for extracting request data
-        request_start_pattern = re.compile(r'\[REQUEST_START\]\s+endpoint=([^\s]+)\s+method=([A-Z]+)')
-        request_complete_pattern = re.compile(
-            r'\[REQUEST_COMPLETE\]\s+endpoint=([^\s]+)\s+method=([A-Z]+)\s+duration_ms=([\d.]+)\s+status=(\d{3})'
-        )
-        request_id_pattern = re.compile(r'req=([a-f0-9\-]{36})', re.IGNORECASE)
-        latency_pattern = re.compile(r'latency_ms=([\d.]+)', re.IGNORECASE)
-        
         # Collect data from all log files
-        request_data = []
-        services_found = set()
+        log_files = []
+        with os.scandir(logs_path) as entries:
+            for entry in entries:
+                if entry.name.endswith('.log') and entry.is_file():
+                    service_name = SERVICE_LOG_SUFFIX_PATTERN.sub('', entry.name)
+                    log_files.append((entry.path, service_name))
         
-        # Process service log files
-        for file in os.listdir(logs_path):
-            if file.endswith('.log'):
-                filepath = os.path.join(logs_path, file)
-                service_name = file.replace('-current.log', '').replace('-previous.log', '').replace('.log', '')
-                
-                try:
-                    with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-                        for line_num, line in enumerate(f, 1):
-                            # Extract request start
-                            start_match = request_start_pattern.search(line)
-                            if start_match:
-                                endpoint = start_match.group(1)
-                                method = start_match.group(2)
-                                req_id_match = request_id_pattern.search(line)
-                                req_id = req_id_match.group(1) if req_id_match else None
-                                
-                                request_data.append({
-                                    'type': 'start',
-                                    'service': service_name,
-                                    'request_id': req_id,
-                                    'endpoint': endpoint,
-                                    'method': method,
-                                    'line': line_num,
-                                    'timestamp': _extract_timestamp(line)
-                                })
-                                services_found.add(service_name)
-                            
-                            # Extract request complete
-                            complete_match = request_complete_pattern.search(line)
-                            if complete_match:
-                                endpoint = complete_match.group(1)
-                                method = complete_match.group(2)
-                                duration = float(complete_match.group(3))
-                                status = int(complete_match.group(4))
-                                req_id_match = request_id_pattern.search(line)
-                                req_id = req_id_match.group(1) if req_id_match else None
-                                
-                                request_data.append({
-                                    'type': 'complete',
-                                    'service': service_name,
-                                    'request_id': req_id,
-                                    'endpoint': endpoint,
-                                    'method': method,
-                                    'duration_ms': duration,
-                                    'status': status,
-                                    'line': line_num,
-                                    'timestamp': _extract_timestamp(line)
-                                })
-                                services_found.add(service_name)
-                            
-                            # Extract latency info
-                            latency_match = latency_pattern.search(line)
-                            if latency_match and req_id_match:
-                                latency = float(latency_match.group(1))
-                                req_id = req_id_match.group(1)
-                                request_data.append({
-                                    'type': 'latency',
-                                    'service': service_name,
-                                    'request_id': req_id,
-                                    'latency_ms': latency,
-                                    'timestamp': _extract_timestamp(line)
-                                })
-                
-                except Exception as e:
+        # Process service log files (in worker processes for large bundles), keeping file order.
+        # Each request ID keeps its first start and first complete across all files, in the
+        # order the IDs first appear
+        requests = {}
+        services_found = set()
+        for (_, service_name), (file_requests, has_requests) in zip(log_files, scan_files(_scan_request_log, log_files)):
+            if has_requests:
+                services_found.add(service_name)
+            for req_id, file_record in file_requests.items():
+                record = requests.get(req_id)
+                if record is None:
+                    requests[req_id] = file_record
                     continue
+                if record[0] is None:
+                    record[0] = file_record[0]
+                if record[1] is None:
+                    record[1] = file_record[1]
         
         # Analyze request data
         requests_by_service = Counter()
         requests_by_endpoint = Counter()
         requests_by_method = Counter()
-        request_latencies = []
+        # Latencies are stored unboxed as C doubles
+        request_latencies = array('d')
         status_distribution = Counter()
         failed_requests = []
         
-        # Group requests by ID
-        requests_by_id = defaultdict(list)
-        for req in request_data:
-            if req.get('request_id'):
-                requests_by_id[req['request_id']].append(req)
-        
         # Process requests
-        for req_id, req_events in requests_by_id.items():
-            start_event = next((e for e in req_events if e['type'] == 'start'), None)
-            complete_event = next((e for e in req_events if e['type'] == 'complete'), None)
-            
+        for req_id, (start_event, complete_event) in requests.items():
             if start_event:
-                service = start_event['service']
-                endpoint = start_event['endpoint']
-                method = start_event['method']
-                
-                requests_by_service[service] += 1
-                requests_by_endpoint[endpoint] += 1
-                requests_by_method[method] += 1
+                requests_by_service[start_event.service] += 1
+                requests_by_endpoint[start_event.endpoint] += 1
+                requests_by_method[start_event.method] += 1
             
             if complete_event:
-                duration = complete_event.get('duration_ms')
-                status = complete_event.get('status')
+                duration = complete_event.duration_ms
+                status = complete_event.status
                 
                 if duration:
                     request_latencies.append(duration)
@@ -155,9 +126,9 @@ def get_request_patterns(logs_path: str) -> str:
                     if status >= 400:
                         failed_requests.append({
                             'request_id': req_id,
-                            'service': complete_event.get('service'),
-                            'endpoint': complete_event.get('endpoint'),
-                            'method': complete_event.get('method'),
+                            'service': complete_event.service,
+                            'endpoint': complete_event.endpoint,
+                            'method': complete_event.method,
                             'status': status,
                             'duration_ms': duration
                         })
@@ -165,20 +136,22 @@ def get_request_patterns(logs_path: str) -> str:
         # Calculate latency statistics
         latency_stats = {}
         if request_latencies:
-            sorted_latencies = sorted(request_latencies)
+            count = len(request_latencies)
+            minimum, maximum, mean = min_max_mean(request_latencies)
+            median, p95, p99 = order_statistics(request_latencies, [count // 2, int(count * 0.95), int(count * 0.99)])
             latency_stats = {
-                'count': len(request_latencies),
-                'min': round(min(request_latencies), 2),
-                'max': round(max(request_latencies), 2),
-                'avg': round(sum(request_latencies) / len(request_latencies), 2),
-                'median': round(sorted_latencies[len(sorted_latencies) // 2], 2),
-                'p95': round(sorted_latencies[int(len(sorted_latencies) * 0.95)], 2) if len(sorted_latencies) > 20 else None,
-                'p99': round(sorted_latencies[int(len(sorted_latencies) * 0.99)], 2) if len(sorted_latencies) > 100 else None
+                'count': count,
+                'min': round(minimum, 2),
+                'max': round(maximum, 2),
+                'avg': round(mean, 2),
+                'median': round(median, 2),
+                'p95': round(p95, 2) if count > 20 else None,
+                'p99': round(p99, 2) if count > 100 else None
             }
         
         # Build result
         result = {
-            "total_requests": len(requests_by_id),
+            "total_requests": len(requests),
             "services_with_requests": list(services_found),
             "requests_by_service": dict(requests_by_service),
             "requests_by_endpoint": dict(requests_by_endpoint.most_common(20)),
@@ -193,7 +166,7 @@ def get_request_patterns(logs_path: str) -> str:
             "status": "OK"
         }
         
-        return json.dumps(result, indent=2, default=str)
+        return result
     
     except Exception as e:
         error_result = {
@@ -201,11 +174,54 @@ def get_request_patterns(logs_path: str) -> str:
             "message": f"Failed to extract request patterns: {str(e)}",
             "logs_path": logs_path
         }
-        return json.dumps(error_result, indent=2)
+        return error_result
 
 
-def _extract_timestamp(line: str) -> Optional[str]:
-    """Extract timestamp from log line."""
-    timestamp_pattern = re.compile(r'(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(?:\.\d+)?Z?)')
-    match = timestamp_pattern.search(line)
-    return match.group(1) if match else None
+def _scan_request_log(filepath: str, service_name: str) -> Tuple[Dict[str, List], bool]:
+    """
+    Collect the first RequestStart and RequestComplete of each request ID in one log file.
+    
+    Returns ({request_id: [start or None, complete or None]}, whether the file had any
+    request lines). Lines after a failure (such as an unparsable duration) are not read.
+    """
+    requests = {}
+    has_requests = False
+    try:
+        with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
+            for line in f:
+                # Most lines hold no request marker; a substring test rejects them without
+                # running the pattern
+                if '[REQUEST_' not in line:
+                    continue
+                
+                event_match = REQUEST_EVENT_PATTERN.search(line)
+                if not event_match:
+                    continue
+                
+                # Extract request start
+                if event_match.group('start_endpoint'):
+                    slot = 0
+                    event = RequestStart(service_name, event_match.group('start_endpoint'), event_match.group('start_method'))
+                
+                # Extract request complete
+                else:
+                    slot = 1
+                    event = RequestComplete(
+                        service_name,
+                        event_match.group('endpoint'),
+                        event_match.group('method'),
+                        float(event_match.group('duration')),
+                        int(event_match.group('status'))
+                    )
+                has_requests = True
+                
+                req_id_match = REQUEST_ID_PATTERN.search(line)
+                if req_id_match:
+                    record = requests.setdefault(req_id_match.group(1), [None, None])
+                    if record[slot] is None:
+                        record[slot] = event
+    
+    except Exception:
+        pass
+    
+    return requests, has_requests
@@ -3,14 +3,53 @@ Service Statistics Tool
 Extracts statistics from service log files
 """
 
-import json
+import mmap
 import os
-import re
-from typing import Dict, List, Optional
-from collections import Counter, defaultdict
+import stat
+from typing import Dict, Iterator, List, Optional
+from array import array
+from collections import Counter, defaultdict, namedtuple
 from datetime import datetime
 from pathlib import Path
 
+try:
+    # The third-party regex engine accepts these patterns unchanged and is roughly
+    # twice as fast as re at the per-line searches; re is used when it is not installed
+    import regex as re
+except ImportError:
+    import re
+
+from ._bundle_cache import bundle_cached
+from ._jsonio import dumps_result
+from ._parallel_scan import scan_files
+from ._metric_stats import min_max_mean, order_statistics
+
+# Newlines are counted in slices of this size, since mmap objects have no count()
+LINE_COUNT_CHUNK = 8 << 20
+
+# Read size for log files that cannot be mapped; matches are found per tile of whole lines
+SCAN_TILE_BYTES = 1 << 20
+
+# service-<name>.log, service-<name>-current.log and service-<name>-previous.log
+SERVICE_LOG_PATTERN = re.compile(r'service-(\w+)(?:-current|-previous)?\.log')
+
+# Everything the statistics need from a log line, matched in one pass over the whole file:
+# log level, request ID and the performance metrics (latency, duration, status)
+LOG_TOKEN_PATTERN = re.compile(
+    rb'\b(?P<level>INFO|ERROR|WARN|WARNING|DEBUG|TRACE|FATAL)\b'
+    rb'|req=(?P<request_id>[a-f0-9\-]{36})'
+    rb'|latency_ms=(?P<latency>[\d.]+)'
+    rb'|duration_ms=(?P<duration>[\d.]+)'
+    rb'|status=(?P<status>\d{3})',
+    re.IGNORECASE
+)
+
+# Token kinds of LOG_TOKEN_PATTERN that are collected as numeric metrics
+PERF_METRICS = ('latency', 'duration', 'status')
+
+# What one service log file contributes to the statistics
+LogScan = namedtuple('LogScan', 'entry_count levels error_count unique_requests metrics')
+
 
 def get_service_statistics(logs_path: str, service_name: Optional[str] = None) -> str:
     """
@@ -35,15 +74,29 @@ def get_service_statistics(logs_path: str, service_name: Optional[str] = None) -
         >>> data = json.loads(result)
         >>> print(data["services_analyzed"])
     """
+    return dumps_result(build_service_statistics(logs_path, service_name))
+
+
+@bundle_cached
+def build_service_statistics(logs_path: str, service_name: Optional[str] = None) -> Dict:
+    """Build the get_service_statistics result (or its error result) as a dict."""
     try:
         log_files = []
-        service_pattern = r'service-(\w+)(?:-current|-previous)?\.log'
         
         # Find all service log files
-        for file in os.listdir(logs_path):
-            if re.match(service_pattern, file) or 'persistent-' in file:
-                if service_name is None or service_name in file:
-                    log_files.append(os.path.join(logs_path, file))
+        with os.scandir(logs_path) as entries:
+            for entry in entries:
+                filename = entry.name
+                # One search both selects the file (a match at the start of the name) and
+                # names its service
+                service_match = SERVICE_LOG_PATTERN.search(filename)
+                if (service_match and service_match.start() == 0) or 'persistent-' in filename:
+                    if service_name is None or service_name in filename:
+                        if service_match:
+                            service_name_from_file = service_match.group(1)
+                        else:
+                            service_name_from_file = filename.replace('persistent-', '').replace('.log', '')
+                        log_files.append((entry.path, filename, service_name_from_file))
         
         if not log_files:
             error_result = {
@@ -51,7 +104,7 @@ def get_service_statistics(logs_path: str, service_name: Optional[str] = None) -
                 "message": f"No service log files found in: {logs_path}",
                 "logs_path": logs_path
             }
-            return json.dumps(error_result, indent=2)
+            return error_result
         
         # Statistics containers
         services_analyzed = []
@@ -59,103 +112,59 @@ def get_service_statistics(logs_path: str, service_name: Optional[str] = None) -
         log_levels_by_service = defaultdict(Counter)
         errors_by_service = Counter()
         request_counts = Counter()
-        performance_metrics = defaultdict(list)
+        performance_metrics = defaultdict(lambda: defaultdict(lambda: array('d')))
         service_info = defaultdict(dict)
         
-        # Log level patterns
-        log_level_pattern = re.compile(r'\b(INFO|ERROR|WARN|WARNING|DEBUG|TRACE|FATAL)\b', re.IGNORECASE)
-        # Request ID patterns
-        request_id_pattern = re.compile(r'req=([a-f0-9\-]{36})', re.IGNORECASE)
-        # Performance patterns (latency, duration)
-        perf_patterns = {
-            'latency': re.compile(r'latency_ms=([\d.]+)', re.IGNORECASE),
-            'duration': re.compile(r'duration_ms=([\d.]+)', re.IGNORECASE),
-            'status': re.compile(r'status=(\d{3})', re.IGNORECASE)
-        }
+        # Scan the files (in worker processes for large bundles), then merge in file order
+        scans = scan_files(_scan_service_log, [(log_file,) for log_file, _, _ in log_files])
         
         # Process each log file
-        for log_file in log_files:
-            # Extract service name from filename
-            filename = os.path.basename(log_file)
-            service_match = re.search(service_pattern, filename)
-            if service_match:
-                service_name_from_file = service_match.group(1)
-            elif 'persistent-' in filename:
-                service_name_from_file = filename.replace('persistent-', '').replace('.log', '')
-            else:
-                service_name_from_file = filename.replace('.log', '')
-            
+        for (_, filename, service_name_from_file), scan in zip(log_files, scans):
             if service_name_from_file not in services_analyzed:
                 services_analyzed.append(service_name_from_file)
             
-            # Read and analyze log file
-            try:
-                with open(log_file, 'r', encoding='utf-8', errors='ignore') as f:
-                    lines = f.readlines()
-                
-                entry_count = 0
-                error_count = 0
-                request_ids_found = set()
-                
-                for line in lines:
-                    entry_count += 1
-                    
-                    # Extract log level
-                    level_match = log_level_pattern.search(line)
-                    if level_match:
-                        level = level_match.group(1).upper()
-                        log_levels_by_service[service_name_from_file][level] += 1
-                        
-                        if level in ['ERROR', 'FATAL']:
-                            error_count += 1
-                    
-                    # Extract request IDs
-                    req_match = request_id_pattern.search(line)
-                    if req_match:
-                        req_id = req_match.group(1)
-                        request_ids_found.add(req_id)
-                    
-                    # Extract performance metrics
-                    for metric_name, pattern in perf_patterns.items():
-                        match = pattern.search(line)
-                        if match:
-                            try:
-                                value = float(match.group(1))
-                                performance_metrics[f"{service_name_from_file}_{metric_name}"].append(value)
-                            except:
-                                pass
-                
-                log_entries_by_service[service_name_from_file] = entry_count
-                errors_by_service[service_name_from_file] = error_count
-                request_counts[service_name_from_file] = len(request_ids_found)
-                
-                # Calculate performance statistics
-                service_perf = {}
-                for metric_key, values in performance_metrics.items():
-                    if service_name_from_file in metric_key:
-                        if values:
-                            service_perf[metric_key.replace(f"{service_name_from_file}_", "")] = {
-                                'count': len(values),
-                                'min': round(min(values), 2),
-                                'max': round(max(values), 2),
-                                'avg': round(sum(values) / len(values), 2),
-                                'p95': round(sorted(values)[int(len(values) * 0.95)], 2) if len(values) > 20 else None
-                            }
-                
+            if isinstance(scan, Exception):
                 service_info[service_name_from_file] = {
                     'log_file': filename,
-                    'total_entries': entry_count,
-                    'errors': error_count,
-                    'unique_requests': len(request_ids_found),
-                    'error_rate': round((error_count / entry_count * 100), 2) if entry_count > 0 else 0,
-                    'performance': service_perf
+                    'error': f"Failed to process: {str(scan)}"
                 }
+                continue
             
-            except Exception as e:
-                service_info[service_name_from_file] = {
-                    'log_file': filename,
-                    'error': f"Failed to process: {str(e)}"
-                }
+            entry_count, levels, error_count, unique_requests, metrics = scan
+            if levels:
+                log_levels_by_service[service_name_from_file].update(levels)
+            for metric_name, values in metrics.items():
+                performance_metrics[service_name_from_file][metric_name].extend(values)
+            
+            log_entries_by_service[service_name_from_file] = entry_count
+            errors_by_service[service_name_from_file] = error_count
+            request_counts[service_name_from_file] = unique_requests
+            
+            service_info[service_name_from_file] = {
+                'log_file': filename,
+                'total_entries': entry_count,
+                'errors': error_count,
+                'unique_requests': unique_requests,
+                'error_rate': round((error_count / entry_count * 100), 2) if entry_count > 0 else 0,
+                'performance': {}
+            }
+        
+        # Calculate performance statistics once per service, over all of its files
+        for service, metrics in performance_metrics.items():
+            if 'performance' not in service_info[service]:
+                # The service's last file could not be processed
+                continue
+            service_perf = service_info[service]['performance']
+            for metric_name, values in metrics.items():
+                if values:
+                    minimum, maximum, mean = min_max_mean(values)
+                    service_perf[metric_name] = {
+                        'count': len(values),
+                        'min': round(minimum, 2),
+                        'max': round(maximum, 2),
+                        'avg': round(mean, 2),
+                        'p95': round(order_statistics(values, [int(len(values) * 0.95)])[0], 2) if len(values) > 20 else None
+                    }
         
         # Build result
         result = {
@@ -173,7 +182,7 @@ def get_service_statistics(logs_path: str, service_name: Optional[str] = None) -
             "status": "OK"
         }
         
-        return json.dumps(result, indent=2, default=str)
+        return result
     
     except Exception as e:
         error_result = {
@@ -181,4 +190,113 @@ def get_service_statistics(logs_path: str, service_name: Optional[str] = None) -
             "message": f"Failed to extract service statistics: {str(e)}",
             "logs_path": logs_path
         }
-        return json.dumps(error_result, indent=2)
+        return error_result
+
+
+def _scan_service_log(log_file: str):
+    """
+    Count one log file's lines, levels, errors and unique request IDs and collect its metric values.
+    
+    Returns a LogScan, or the exception if the file could not be read; it is returned rather
+    than raised so one bad file does not abort the other files' scans.
+    """
+    try:
+        # Matched bytes of each token kind, in file order
+        tokens = {kind: [] for kind in LOG_TOKEN_PATTERN.groupindex}
+        entry_count = 0
+        ends_with_newline = True
+        for data in _log_file_buffers(log_file):
+            entry_count += _count_newlines(data)
+            ends_with_newline = data[-1:] == b'\n'
+            
+            # Only the first token of each kind on a line counts, as with a per-line search():
+            # a token is skipped when no newline separates it from the previous one of its kind.
+            # Buffers end at line boundaries, so this state starts over for each one
+            previous_end = {}
+            rfind = data.rfind
+            for match in LOG_TOKEN_PATTERN.finditer(data):
+                kind = match.lastgroup
+                start = match.start()
+                last_end = previous_end.get(kind, -1)
+                previous_end[kind] = match.end()
+                if last_end >= 0 and rfind(b'\n', last_end, start) == -1:
+                    continue
+                tokens[kind].append(match.group(kind))
+        
+        # A last line without a newline still counts, as with readlines()
+        if not ends_with_newline:
+            entry_count += 1
+        
+        # Count in C, then fold the few distinct spellings (info, Info, ...) to upper case
+        levels = Counter()
+        for level, count in Counter(tokens['level']).items():
+            levels[level.upper().decode()] += count
+        error_count = levels['ERROR'] + levels['FATAL']
+        unique_requests = len(set(tokens['request_id']))
+        metrics = {metric_name: _float_array(tokens[metric_name]) for metric_name in PERF_METRICS}
+    except Exception as e:
+        return e
+    
+    return LogScan(entry_count, levels, error_count, unique_requests, metrics)
+
+
+def _float_array(values: List[bytes]) -> array:
+    """Convert matched metric values to floats, dropping any that do not parse (such as b'1.2.3')."""
+    try:
+        return array('d', map(float, values))
+    except ValueError:
+        floats = array('d')
+        for value in values:
+            try:
+                floats.append(float(value))
+            except ValueError:
+                pass
+        return floats
+
+
+def _log_file_buffers(log_file: str) -> Iterator:
+    """
+    Yield a log file's contents as buffers that each end at a line boundary (except a final
+    line without a newline).
+    
+    The file is normally mapped and yielded whole; where it cannot be mapped it is read in
+    SCAN_TILE_BYTES tiles, with a partial last line carried over to the next tile. Each
+    buffer is only valid until the next one is requested. An empty regular file yields nothing.
+    """
+    with open(log_file, 'rb') as f:
+        st = os.fstat(f.fileno())
+        # Only a regular file's size is meaningful; pipes and FIFOs report 0 and go to the tile loop
+        if stat.S_ISREG(st.st_mode) and st.st_size == 0:
+            return
+        try:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            # e.g. pipes and some network or virtual filesystems
+            mapped = None
+        if mapped is not None:
+            with mapped:
+                yield mapped
+            return
+        
+        tail = b''
+        while True:
+            tile = f.read(SCAN_TILE_BYTES)
+            if not tile:
+                break
+            tile = tail + tile
+            last_newline = tile.rfind(b'\n')
+            if last_newline < 0:
+                tail = tile
+                continue
+            tail = tile[last_newline + 1:]
+            yield tile[:last_newline + 1]
+        if tail:
+            yield tail
+
+
+def _count_newlines(data) -> int:
+    """Count the newlines in a bytes or mmap buffer."""
+    count = 0
+    for start in range(0, len(data), LINE_COUNT_CHUNK):
+        count += data[start:start + LINE_COUNT_CHUNK].count(b'\n')
+    return count
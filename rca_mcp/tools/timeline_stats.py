@@ -9,6 +9,13 @@ from typing import Dict, List, Optional
 from collections import Counter, defaultdict
 from datetime import datetime
 
+from ._bundle_cache import bundle_cached
+from ._json_records import iter_records
+from ._jsonio import dumps_result
+
+# Events listed per hour in events_by_time (all events are still counted)
+EVENTS_PER_HOUR_SAMPLE = 10
+
 
 def get_timeline_statistics(logs_path: str) -> str:
     """
@@ -32,6 +39,12 @@ def get_timeline_statistics(logs_path: str) -> str:
         >>> data = json.loads(result)
         >>> print(data["total_events"])
     """
+    return dumps_result(build_timeline_statistics(logs_path))
+
+
+@bundle_cached
+def build_timeline_statistics(logs_path: str) -> Dict:
+    """Build the get_timeline_statistics result (or its error result) as a dict."""
     try:
         timeline_file = os.path.join(logs_path, "timeline.json")
         
@@ -41,21 +54,16 @@ def get_timeline_statistics(logs_path: str) -> str:
                 "message": f"timeline.json not found at: {timeline_file}",
                 "logs_path": logs_path
             }
-            return json.dumps(error_result, indent=2)
-        
-        with open(timeline_file, 'r', encoding='utf-8') as f:
-            timeline_data = json.load(f)
+            return error_result
         
-        # Extract timeline list
-        timeline = timeline_data.get('timeline', []) if isinstance(timeline_data, dict) else timeline_data
-        if not isinstance(timeline, list):
-            timeline = []
+        # Events are streamed, so the whole timeline is never held in memory
+        timeline = iter_records(timeline_file, 'timeline')
         
         # Initialize statistics
-        total_events = len(timeline)
+        total_events = 0
         events_by_service = Counter()
         events_by_level = Counter()
-        events_by_time = defaultdict(list)
+        events_by_time = {}
         events_by_type = Counter()
         request_ids = set()
         request_distribution = defaultdict(int)
@@ -63,8 +71,12 @@ def get_timeline_statistics(logs_path: str) -> str:
         # Process each event
         first_timestamp = None
         last_timestamp = None
+        # Parsed forms of first/last_timestamp, kept so the duration needs no second parse
+        first_dt = None
+        last_dt = None
         
         for event in timeline:
+            total_events += 1
             service = event.get('service', 'unknown')
             level = event.get('level', 'UNKNOWN')
             event_type = event.get('event', 'log_entry')
@@ -83,26 +95,31 @@ def get_timeline_statistics(logs_path: str) -> str:
             if timestamp:
                 try:
                     dt = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
-                    hour_key = dt.strftime('%Y-%m-%d %H:00')
-                    events_by_time[hour_key].append({
-                        'timestamp': timestamp,
-                        'service': service,
-                        'level': level,
-                        'event': event_type
-                    })
+                    # Bucket by the hour's fields; the label is formatted once per hour below
+                    # instead of running strftime for every event
+                    hour_key = (dt.year, dt.month, dt.day, dt.hour)
+                    hour_events = events_by_time.setdefault(hour_key, [0, []])
+                    hour_events[0] += 1
+                    if len(hour_events[1]) < EVENTS_PER_HOUR_SAMPLE:
+                        hour_events[1].append({
+                            'timestamp': timestamp,
+                            'service': service,
+                            'level': level,
+                            'event': event_type
+                        })
                     
                     if not first_timestamp:
                         first_timestamp = timestamp
+                        first_dt = dt
                     last_timestamp = timestamp
+                    last_dt = dt
                 except:
                     pass
         
         # Calculate duration if timestamps available
         duration_seconds = None
-        if first_timestamp and last_timestamp:
+        if first_dt and last_dt:
             try:
-                first_dt = datetime.fromisoformat(first_timestamp.replace('Z', '+00:00'))
-                last_dt = datetime.fromisoformat(last_timestamp.replace('Z', '+00:00'))
                 duration_seconds = (last_dt - first_dt).total_seconds()
             except:
                 pass
@@ -117,10 +134,13 @@ def get_timeline_statistics(logs_path: str) -> str:
             "request_distribution": dict(request_distribution),
             "events_by_time": {
                 hour: {
-                    'count': len(events),
-                    'events': events[:10]  # Limit to first 10 per hour
+                    'count': count,
+                    'events': events
                 }
-                for hour, events in sorted(events_by_time.items())
+                for hour, (count, events) in sorted(
+                    (datetime(*hour_key).strftime('%Y-%m-%d %H:00'), hour_events)
+                    for hour_key, hour_events in events_by_time.items()
+                )
             },
             "timeline_summary": {
                 'first_event': first_timestamp,
@@ -132,7 +152,7 @@ def get_timeline_statistics(logs_path: str) -> str:
             "status": "OK"
         }
         
-        return json.dumps(result, indent=2, default=str)
+        return result
     
     except json.JSONDecodeError as e:
         error_result = {
@@ -140,7 +160,7 @@ def get_timeline_statistics(logs_path: str) -> str:
             "message": f"Failed to parse timeline.json: {str(e)}",
             "logs_path": logs_path
         }
-        return json.dumps(error_result, indent=2)
+        return error_result
     
     except Exception as e:
         error_result = {
@@ -148,4 +168,4 @@ def get_timeline_statistics(logs_path: str) -> str:
             "message": f"Failed to extract timeline statistics: {str(e)}",
             "logs_path": logs_path
         }
-        return json.dumps(error_result, indent=2)
+        return error_result
@@ -0,0 +1,34 @@
+"""
+Error Patterns Tool Tests
+Regression tests for build_error_patterns on small generated bundles.
+"""
+
+import json
+import os
+import tempfile
+import unittest
+
+from rca_mcp.tools.error_patterns import build_error_patterns
+
+
+class ErrorSequenceOrderingTest(unittest.TestCase):
+    """Error sequences over errors.json records."""
+    
+    def test_null_service_with_tied_timestamp(self):
+        """A null service on an error sharing another error's timestamp does not break sorting."""
+        errors = [
+            {"timestamp": "2024-01-01T00:00:00Z", "service": None, "message": "first"},
+            {"timestamp": "2024-01-01T00:00:00Z", "service": "api", "message": "second"},
+        ]
+        with tempfile.TemporaryDirectory() as logs_path:
+            with open(os.path.join(logs_path, "errors.json"), "w") as f:
+                json.dump(errors, f)
+            result = build_error_patterns(logs_path)
+        
+        self.assertNotIn("error", result)
+        self.assertEqual(result["total_errors_analyzed"], 2)
+        self.assertEqual(len(result["error_sequences"]), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()